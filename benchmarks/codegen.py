@@ -0,0 +1,65 @@
+"""
+Benchmark of converting records with and without a generated convert function.
+
+usage:
+    python benchmarks/codegen.py --records 100000
+"""
+
+import argparse
+import time
+
+from record_convertor import RecordConvertorWithRulesDict
+
+RULES = {
+    "id": "id",
+    "name": "name",
+    "sku": "item.sku",
+    "price": "item.price.amount",
+    "currency": "item.price.currency",
+    "brand": {"name": "item.brand.name", "country": "item.brand.country"},
+    "label": {"$join": ["$seperator ", "item.brand.name", "name"]},
+    "location": {"$point": {"lat": "geo.lat", "lon": "geo.lon"}},
+    "tags": {"$to_list": ["tag1", "tag2", "tag3"]},
+    "source": {"$fixed_value": "feed"},
+}
+
+
+class GeneratedRecordConvertor(RecordConvertorWithRulesDict):
+    GENERATE_CODE = True
+
+
+def records(number_of_records: int) -> list[dict]:
+    return [
+        {
+            "id": index,
+            "name": f"Product {index}",
+            "item": {
+                "sku": f"SKU-{index}",
+                "price": {"amount": index / 100, "currency": "EUR"},
+                "brand": {"name": f"Brand {index % 100}", "country": "NL"},
+            },
+            "geo": {"lat": "52.37", "lon": "4.89"},
+            "tag1": "new",
+            "tag3": "sale",
+        }
+        for index in range(number_of_records)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    input_records = records(arguments.records)
+    print(f"{'convertor':>26} {'records/s':>12}")
+    for convertor_class in (RecordConvertorWithRulesDict, GeneratedRecordConvertor):
+        record_convertor = convertor_class(rule_dict=RULES)
+        start = time.perf_counter()
+        record_convertor.convert_list(input_records)
+        records_per_second = arguments.records / (time.perf_counter() - start)
+        print(f"{convertor_class.__name__:>26} {records_per_second:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark of the time it takes to import `record_convertor`, as measured by
+`python -X importtime`.
+
+The optional dependencies `phonenumbers`, `pydantic`, `unidecode` and `yaml` are only
+imported on first use. The benchmark fails when one of them is imported by
+`import record_convertor`, or when the import takes longer than `--max-ms`.
+
+usage:
+    python benchmarks/import_time.py --runs 10 --max-ms 150
+"""
+
+import argparse
+import subprocess
+import sys
+
+LAZY_DEPENDENCIES = ("phonenumbers", "pydantic", "unidecode", "yaml")
+
+
+def import_times() -> dict[str, int]:
+    """Returns the cumulative import time in microseconds of every imported module."""
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import record_convertor"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed_process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    arguments = parser.parse_args()
+
+    runs = [import_times() for _ in range(arguments.runs)]
+    best_run = min(runs, key=lambda times: times["record_convertor"])
+    total_ms = best_run["record_convertor"] / 1000
+
+    print(f"{'module':>60} {'ms':>8}")
+    slowest = sorted(best_run.items(), key=lambda item: item[1], reverse=True)
+    for module, cumulative in slowest[: arguments.top]:
+        print(f"{module:>60} {cumulative / 1000:>8.1f}")
+
+    failures = [
+        f"{dependency} is imported by `import record_convertor`"
+        for dependency in LAZY_DEPENDENCIES
+        if dependency in best_run
+    ]
+    if arguments.max_ms is not None and total_ms > arguments.max_ms:
+        failures.append(f"import takes {total_ms:.1f} ms (max {arguments.max_ms} ms)")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
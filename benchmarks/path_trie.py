@@ -0,0 +1,73 @@
+"""
+Benchmark of extracting the fields read by a rule set from deep and wide records with
+the path trie of the plan and with a separate lookup per field path.
+
+usage:
+    python benchmarks/path_trie.py --records 100000 --fields 20
+"""
+
+import argparse
+import time
+
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.package_settings import PathTrie, get_field
+
+
+def field_paths(number_of_fields: int) -> list[str]:
+    return [
+        f"inventory.item.{group}.attribute{index}"
+        for index in range(number_of_fields)
+        for group in ("details", "brand")
+    ]
+
+
+def records(number_of_records: int, number_of_fields: int) -> list[dict]:
+    attributes = {f"attribute{index}": index for index in range(number_of_fields * 2)}
+    return [
+        {
+            "id": index,
+            "inventory": {
+                "item": {"details": dict(attributes), "brand": dict(attributes)}
+            },
+        }
+        for index in range(number_of_records)
+    ]
+
+
+def records_per_second(function, input_records: list[dict]) -> str:
+    start = time.perf_counter()
+    for record in input_records:
+        function(record)
+    return f"{len(input_records) / (time.perf_counter() - start):>12,.0f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--fields", type=int, default=20)
+    arguments = parser.parse_args()
+
+    paths = field_paths(arguments.fields)
+    input_records = records(arguments.records, arguments.fields)
+    trie = PathTrie(paths)
+    record_convertor = RecordConvertorWithRulesDict(
+        rule_dict={path.replace(".", "_"): path for path in paths}
+    )
+
+    print(f"{'extraction':>26} {'records/s':>12}")
+    print(
+        f"{'lookup per field path':>26}",
+        records_per_second(
+            lambda record: {path: get_field(record, path) for path in paths},
+            input_records,
+        ),
+    )
+    print(f"{'path trie':>26}", records_per_second(trie.extract, input_records))
+    print(
+        f"{'convert':>26}",
+        records_per_second(record_convertor.convert, input_records),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark of the throughput of `convert_threaded` with 1 to N threads.
+
+On free-threaded python builds (3.13t and later) the throughput should scale with the
+number of threads. With the GIL enabled it stays (at best) flat.
+
+usage:
+    python benchmarks/thread_scaling.py --records 100000 --max-threads 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from record_convertor import RecordConvertorWithRulesDict
+
+RULES = {
+    "$SKIP": {"fieldname": "status", "condition": {"equals": "deleted"}},
+    "$convert1": {"fieldname": "name", "actions": [{"to_lower_str": None}]},
+    "$format_date1": {"date_field": "created", "format": "DD-MM-YYYY"},
+    "id": "id",
+    "name": "name",
+    "created": "created",
+    "brand": {"name": "item.brand.name", "country": "item.brand.country"},
+    "label": {"$join": ["item.brand.name", "$ - ", "name"]},
+}
+
+
+def records(number_of_records: int) -> list[dict]:
+    return [
+        {
+            "id": index,
+            "name": f"Product {index}",
+            "status": "deleted" if index % 50 == 0 else "active",
+            "created": f"{index % 28 + 1:02d}-{index % 12 + 1:02d}-2024",
+            "item": {"brand": {"name": f"Brand {index % 100}", "country": "NL"}},
+        }
+        for index in range(number_of_records)
+    ]
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled else True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=500)
+    arguments = parser.parse_args()
+
+    input_records = records(arguments.records)
+    record_convertor = RecordConvertorWithRulesDict(rule_dict=RULES)
+
+    print(f"python {sys.version.split()[0]}, GIL enabled: {gil_enabled()}")
+    print(f"{'threads':>8} {'records/s':>12} {'speedup':>8}")
+    baseline = None
+    for threads in range(1, arguments.max_threads + 1):
+        # every run converts fresh copies as `$convert` and `$format_date` rules
+        # update the input records
+        batch = [dict(record) for record in input_records]
+        start = time.perf_counter()
+        for _ in record_convertor.convert_threaded(
+            batch, workers=threads, chunksize=arguments.chunksize
+        ):
+            pass
+        records_per_second = arguments.records / (time.perf_counter() - start)
+        baseline = baseline or records_per_second
+        speedup = records_per_second / baseline
+        print(f"{threads:>8} {records_per_second:>12,.0f} {speedup:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
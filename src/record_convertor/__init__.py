@@ -10,17 +10,34 @@ usage:
 >>>     RecordConvertor(rules: Rules).convert(record: dict)
 """
 
+import inspect
+import os
+import pickle
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
 from copy import copy
-from typing import Any, Optional, Union
-
-import jmespath
-from jmespath.exceptions import ParseError
+from functools import partial, wraps
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
 
 from record_convertor.command_processor import ProcessCommand
 from record_convertor.dataclass_processor import DataClassProcessor
 
+from .codegen import generated_convert_function
 from .field_convertors import BaseFieldConvertor, DateFieldConvertor
 from .package_settings import (
+    NOT_EXTRACTED,
+    ConditionPredicate,
+    ConversionContext,
+    CopyOnWriteRecord,
     DataclassInstance,
     DateFormatProtocol,
     EvaluateConditions,
@@ -28,12 +45,35 @@ from .package_settings import (
     RecConvKeys,
     RulesDict,
     SkipConvKeys,
+    SkipRecordHandling,
     SkipRuleDict,
+    compiled_rule_cache,
+    get_field,
     keys_in_lower_case,
+    plain_record,
 )
 from .package_settings.conditions.condition_settings.condition_types import (
     ConditionsDict,
 )
+from .parallel import DEFAULT_CHUNKSIZE, convert_parallel, convert_threaded
+from .parallel.ndjson_files import (
+    DEFAULT_SHARD_SIZE,
+    ConvertedShard,
+    convert_ndjson_file,
+)
+from .projection import ReadSet, read_set
+from .rules_compiler import (
+    PLAN_REGISTRY,
+    SKIPPED,
+    RuleKind,
+    RulePlan,
+    compile_rules,
+    is_command_rule,
+    is_convert_field_rule,
+    is_dataclass_rule,
+    is_format_date_rule,
+    is_skip_rule,
+)
 from .rules_generator import RulesFromDict, RulesFromYAML  # NOQA: F401
 
 
@@ -42,11 +82,31 @@ class RecordConvertor:
     EVALUATE_CLASS = EvaluateConditions
     DATA_CLASS_PROCESSOR: DataClassProcessor = DataClassProcessor()
     KEYS_IN_LOWER_CASE: bool = False
+    # convert a copy-on-write version of the input record so that `$convert` and
+    # `$format_date` rules leave the input record untouched
+    COPY_ON_WRITE: bool = False
+    # convert with a python function generated from the rules (see `codegen`)
+    GENERATE_CODE: bool = False
+    # share the compiled plan of the rules with all record convertors with the same
+    # rules in this process (see `rules_compiler.PlanRegistry`)
+    SHARE_PLANS: bool = False
     DEFAULT_VALUE: dict = {}
     DEFAULT_FIELD_CONVERTOR_CLASS: type[FieldConvertorProtocol] = BaseFieldConvertor
     DEFAULT_DATE_FORMAT_CLASS: type[DateFormatProtocol] = DateFieldConvertor
     COMMAND_CLASS: type[ProcessCommand] = ProcessCommand
-    _stored_copy: Optional["RecordConvertor"] = None
+    _plan: RulePlan
+    # path copies read the values extracted by the path trie of the plan, unless a
+    # subclass looks up fields in its own way
+    _read_extracted_fields: bool = True
+
+    # input record of the conversion, only set for overrides of `_get_field` and
+    # `_skip_this_record` that do not take the record (see `_support_legacy_overrides`)
+    _input_record: Optional[dict] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _support_legacy_overrides(cls)
+        cls._read_extracted_fields = cls._get_field is RecordConvertor._get_field
 
     def __init__(
         self,
@@ -56,6 +116,14 @@ class RecordConvertor:
         data_classes: Optional[list[type[DataclassInstance]]] = None,
         command_class: Optional[type[ProcessCommand]] = None,
     ):
+        # arguments needed to build an identical record convertor in another process
+        self._convertor_arguments: dict[str, Any] = {
+            "rule_source": rule_source,
+            "field_convertor": field_convertor,
+            "date_formatter": date_formatter,
+            "data_classes": data_classes,
+            "command_class": command_class,
+        }
         self._rules = self.RULE_CLASS(rule_source=rule_source).rules
         # set instance of given or default field convertor class
         self._field_convertor: FieldConvertorProtocol = (
@@ -67,10 +135,44 @@ class RecordConvertor:
         )()
         # set the dataclasses attribute as a dict with dataclass name as key and data
         # the dataclass itself as value
+        # registered on a copy of the processor so dataclasses are not shared with
+        # other record convertors
         dataclasses = data_classes or []
+        self.DATA_CLASS_PROCESSOR = copy(self.DATA_CLASS_PROCESSOR)
         self.DATA_CLASS_PROCESSOR.register_data_classes(dataclasses=dataclasses)
         self._command_class = command_class or self.COMMAND_CLASS
 
+    @property
+    def _rules(self) -> RulesDict:
+        """The rule set this record convertor has been compiled from."""
+        return self._plan.rules
+
+    @_rules.setter
+    def _rules(self, rules: RulesDict) -> None:
+        if self.SHARE_PLANS:
+            self._plan = PLAN_REGISTRY.plan(rules)
+        else:
+            self._plan = compile_rules(rules)
+
+    @classmethod
+    def preload_plans(cls, rule_sources: Iterable[Any]) -> None:
+        """
+        Reads the rule sources with the rule class of this record convertor and adds
+        their compiled plans to the registry of shared plans. Record convertors with
+        `SHARE_PLANS` set then use these plans without compiling the rules again.
+
+        Preloading before forking worker processes lets the workers share the memory
+        of the plans.
+
+        Args:
+            rule_sources (Iterable): Rule sources as accepted by `RULE_CLASS` (YAML
+                filenames or rule dicts).
+        """
+        PLAN_REGISTRY.preload(
+            cls.RULE_CLASS(rule_source=rule_source).rules
+            for rule_source in rule_sources
+        )
+
     def convert(self, record: dict) -> dict:
         """
         Primary public method to run the actual conversion of the record.
@@ -81,161 +183,573 @@ class RecordConvertor:
         Returns:
             dict: converted record
         """
+        converted_record = self._convert_record(record)
+        if converted_record is SKIPPED:
+            return self.DEFAULT_VALUE
+        return converted_record
+
+    def read_set(self) -> ReadSet:
+        """
+        Returns the fields of the input record read by the rules of this record
+        convertor (see `record_convertor.projection`).
+        """
+        return read_set(
+            self._plan,
+            self._command_class,
+            self._field_convertor,
+            self._date_formatter,
+            self.DATA_CLASS_PROCESSOR,
+        )
+
+    def parse_json(self, raw: Union[bytes, str]) -> dict:
+        """
+        Parses a JSON object into an input record with only the fields read by the
+        rules. Converting it gives the same result as converting the full record.
+
+        Args:
+            raw (bytes | str): The JSON object.
+
+        Returns:
+            dict: The projected input record.
+
+        Raises:
+            ValueError: If `raw` is not valid JSON or not a JSON object.
+        """
+        return self.read_set().parse(raw, self.KEYS_IN_LOWER_CASE)
+
+    def convert_json(self, raw: Union[bytes, str]) -> dict:
+        """
+        Converts a record given as JSON object. Only the fields read by the rules
+        are parsed into python objects when `pysimdjson` is installed.
+
+        Args:
+            raw (bytes | str): The JSON object.
+
+        Returns:
+            dict: converted record
+        """
+        return self.convert(self.parse_json(raw))
+
+    def convert_many(
+        self,
+        records: Iterable[dict],
+        skip_handling: str = SkipRecordHandling.DEFAULT,
+    ) -> Iterator[Any]:
+        """
+        Lazily converts the records from an iterable of records.
+
+        Records are only read from the iterable when the next converted record is
+        requested, so this can be used to stream records of any size.
+
+        Args:
+            records (Iterable[dict]): input records
+            skip_handling (str): what to return for records that are skipped by a
+                skip rule. One of the `SkipRecordHandling` options:
+                    - default: the DEFAULT_VALUE (same as `convert`)
+                    - drop: skipped records are left out
+                    - none: None
+
+        Returns:
+            Iterator: converted records in the order of the input records
+        """
+        skipped_value = self._skipped_value(skip_handling)
+        drop_skipped = skip_handling == SkipRecordHandling.DROP
+        convert_record = self._convert_record
+
+        for record in records:
+            converted_record = convert_record(record)
+            if converted_record is SKIPPED:
+                if drop_skipped:
+                    continue
+                converted_record = skipped_value
+            yield converted_record
+
+    def convert_list(
+        self,
+        records: Iterable[dict],
+        skip_handling: str = SkipRecordHandling.DEFAULT,
+    ) -> list:
+        """
+        Converts all records from an iterable of records and returns them as a list.
+
+        Args:
+            records (Iterable[dict]): input records
+            skip_handling (str): what to return for records that are skipped by a
+                skip rule (see `convert_many`).
+
+        Returns:
+            list: converted records in the order of the input records
+        """
+        return list(self.convert_many(records, skip_handling=skip_handling))
+
+    def convert_parallel(
+        self,
+        records: Iterable[dict],
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        ordered: bool = True,
+        skip_handling: str = SkipRecordHandling.DEFAULT,
+    ) -> Iterator[Any]:
+        """
+        Lazily converts the records from an iterable of records with a pool of
+        worker processes.
+
+        Each worker builds its own record convertor with the same arguments as this
+        record convertor and keeps it for the life of the pool. Hence the record
+        convertor class (and any custom classes passed to it) should be defined at
+        module level, and the rule source should be picklable.
+
+        Args:
+            records (Iterable[dict]): input records
+            workers (int, optional): number of worker processes. Defaults to the
+                number of CPUs.
+            chunksize (int): number of records sent to a worker in one go.
+            ordered (bool): return the converted records in the order of the input
+                records. When False, records are returned per chunk as soon as the
+                chunk is converted.
+            skip_handling (str): what to return for records that are skipped by a
+                skip rule (see `convert_many`).
+
+        Returns:
+            Iterator: converted records
+        """
+        self._skipped_value(skip_handling)
+        return convert_parallel(
+            convertor_class=type(self),
+            convertor_arguments=self._convertor_arguments,
+            records=records,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            skip_handling=skip_handling,
+        )
+
+    def convert_ndjson_file(
+        self,
+        filename: Union[str, os.PathLike],
+        workers: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        ordered: bool = True,
+        skip_handling: str = SkipRecordHandling.DEFAULT,
+        shard_output: Optional[str] = None,
+    ) -> Iterator[ConvertedShard]:
+        """
+        Converts an NDJSON file with a pool of worker processes that each read,
+        convert and encode their own byte ranges (shards) of the memory-mapped file.
+
+        The workers are build in the same way as by `convert_parallel`.
+
+        Args:
+            filename (str | os.PathLike): the (uncompressed) NDJSON file.
+            workers (int, optional): number of worker processes. Defaults to the
+                number of CPUs.
+            shard_size (int): size in bytes of a shard.
+            ordered (bool): return the shards in the order of the file. When False,
+                shards are returned as soon as they are converted.
+            skip_handling (str): what to write for records that are skipped by a
+                skip rule (see `convert_many`).
+            shard_output (str, optional): filename pattern with a `{shard}` field.
+                When given, every shard is written to its own file by the workers.
+
+        Returns:
+            Iterator[ConvertedShard]: the converted shards, with the converted
+                records as NDJSON (or the file they have been written to).
+        """
+        self._skipped_value(skip_handling)
+        return convert_ndjson_file(
+            convertor_class=type(self),
+            convertor_arguments=self._convertor_arguments,
+            filename=filename,
+            workers=workers,
+            shard_size=shard_size,
+            ordered=ordered,
+            skip_handling=skip_handling,
+            shard_output=shard_output,
+        )
+
+    def aconvert_stream(
+        self,
+        records: AsyncIterable[dict],
+        executor: Optional[Executor] = None,
+        skip_handling: str = SkipRecordHandling.DEFAULT,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Converts an async iterable of records without blocking the event loop.
+
+        Records are collected in batches on a bounded queue and converted in the
+        executor, so fetching records and converting them overlap. The async
+        iterable is only read as fast as the records are converted.
+
+        With a process pool, every worker builds its own record convertor (on first
+        use) from the same arguments as this record convertor, as for
+        `convert_parallel`.
+
+        Args:
+            records (AsyncIterable[dict]): input records
+            executor (Executor, optional): thread or process pool to convert the
+                records in. The default executor of the event loop if None.
+            skip_handling (str): what to return for records that are skipped by a
+                skip rule (see `convert_many`).
+            queue_size (int, optional): maximum number of batches waiting to be
+                converted and being converted.
+            batch_size (int, optional): fixed number of records per batch. Adapted
+                to the conversion time when None.
+
+        Returns:
+            AsyncIterator: converted records in the order of the input records
+        """
+        # imported on first use to keep the import of the package fast
+        from .parallel.async_stream import (
+            DEFAULT_QUEUE_SIZE,
+            aconvert_stream,
+            convert_batch_in_process,
+        )
+
+        self._skipped_value(skip_handling)
+        convert_batch: Callable[[list], list]
+        if isinstance(executor, ProcessPoolExecutor):
+            convertor_key = pickle.dumps((type(self), self._convertor_arguments))
+            convert_batch = partial(
+                convert_batch_in_process, convertor_key, skip_handling
+            )
+        else:
+            convert_batch = partial(self.convert_list, skip_handling=skip_handling)
+        return aconvert_stream(
+            convert_batch=convert_batch,
+            records=records,
+            executor=executor,
+            queue_size=DEFAULT_QUEUE_SIZE if queue_size is None else queue_size,
+            batch_size=batch_size,
+        )
+
+    def convert_threaded(
+        self,
+        records: Iterable[dict],
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        ordered: bool = True,
+        skip_handling: str = SkipRecordHandling.DEFAULT,
+    ) -> Iterator[Any]:
+        """
+        Lazily converts the records from an iterable of records with a pool of
+        threads that all use this record convertor.
+
+        Only on free-threaded python builds (3.13t and later) the records are
+        converted in parallel. With the GIL enabled use `convert_parallel` instead.
+
+        Args:
+            records (Iterable[dict]): input records
+            workers (int, optional): number of threads. Defaults to the number of
+                CPUs.
+            chunksize (int): number of records converted by a thread in one go.
+            ordered (bool): return the converted records in the order of the input
+                records. When False, records are returned per chunk as soon as the
+                chunk is converted.
+            skip_handling (str): what to return for records that are skipped by a
+                skip rule (see `convert_many`).
+
+        Returns:
+            Iterator: converted records
+        """
+        self._skipped_value(skip_handling)
+        return convert_threaded(
+            record_convertor=self,
+            records=records,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            skip_handling=skip_handling,
+        )
+
+    def _skipped_value(self, skip_handling: str) -> Optional[dict]:
+        """Returns the value to be used for skipped records."""
+        if skip_handling == SkipRecordHandling.DEFAULT:
+            return self.DEFAULT_VALUE
+        if skip_handling in (SkipRecordHandling.DROP, SkipRecordHandling.NONE):
+            return None
+        raise ValueError(f"Unknown skip handling option `{skip_handling}`")
+
+    def _convert_record(self, record: dict) -> Any:
+        """
+        Converts the record and returns the converted record, or `SKIPPED` if the
+        record is skipped by one of the skip rules.
+        """
+        if self.GENERATE_CODE:
+            convert_function = generated_convert_function(
+                self._plan,
+                self._command_class,
+                self.KEYS_IN_LOWER_CASE,
+                self.COPY_ON_WRITE,
+                type(self)._get_field is not RecordConvertor._get_field,
+            )
+            if convert_function is not None:
+                return convert_function(self, record)
+        return self._convert_with_plan(self._plan, self._new_context(record))
+
+    def _new_context(self, record: dict) -> ConversionContext:
+        """Returns the context for the conversion of a single record."""
+        if self.KEYS_IN_LOWER_CASE:
+            # a lower case record is a new record so no copy-on-write is needed
+            return ConversionContext(keys_in_lower_case(record))
+        if self.COPY_ON_WRITE and not isinstance(record, CopyOnWriteRecord):
+            return ConversionContext(CopyOnWriteRecord(record))
+        return ConversionContext(record)
+
+    def _convert_with_plan(self, plan: RulePlan, context: ConversionContext) -> Any:
+        """
+        Walks the compiled rules of the plan for the record in the context.
+
+        All state of the conversion is kept in the context (and local variables) so
+        the same record convertor can be used for multiple conversions at the same
+        time.
+        """
         output_record: dict = {}
-        self._input_record = (
-            keys_in_lower_case(record) if self.KEYS_IN_LOWER_CASE else record
+        # extract the values of all field paths read by the rules from the position
+        # of the path trie on, unless the values have been extracted for the plan
+        # this plan is nested in
+        path_trie_position = (
+            plan.path_trie_position
+            if plan.path_trie is not None and context.fields is None
+            else -1
         )
 
-        # process all rules (and nested rules)
-        for rule in self._rules.items():
-            # check if the rule determines that the given record can be skipped
-            # if so return default value
-            if self._skip_this_record(rule):
-                return self.DEFAULT_VALUE
+        # process all compiled rules (and nested rules)
+        for index, compiled_rule in enumerate(plan):
+            kind = compiled_rule.kind
+            if index == path_trie_position:
+                context.fields = plan.path_trie.extract(  # type: ignore[union-attr]
+                    context.record
+                )
 
-            # in case of a skip rule that is invalidated in the previous check (ie.
-            # record can not be skipped) no further processing of this rule is needed.
-            if self._is_skip_rule(rule):
+            # check if the rule determines that the given record can be skipped.
+            # Otherwise no further processing of this rule is needed.
+            if kind == RuleKind.SKIP:
+                if self._skip_rule_applies(compiled_rule.rule, context.record):
+                    return SKIPPED
                 continue
 
-            # check if the rule requires a change on the input record to be done
-            # if rule is an input record update rule then proceed with the next rule.
-            if self._change_field_in_input_record_if_required(rule=rule):
+            # rules that require a change on the input record
+            if kind == RuleKind.FIELD_CONVERT:
+                context.record = self._field_convertor.convert_field(
+                    record=context.record, conversion_rule=compiled_rule.rule
+                )
                 continue
 
-            # check if the rule requires a change on the input record to be done
-            # if rule is an input record update rule then proceed with the next rule.
-            if self._is_dataclass_rule(rule=rule):
-                _, dataclass_rule = rule
+            if kind == RuleKind.DATE_FORMAT:
+                context.record = self._date_formatter.format_date_field(
+                    record=context.record, conversion_rule=compiled_rule.rule
+                )
+                continue
+
+            # rules that determine the result of the (nested) rule set as a whole
+            if kind == RuleKind.DATACLASS:
                 return self.DATA_CLASS_PROCESSOR.data_from_dataclass(
-                    record=self._input_record,
-                    rules=dataclass_rule,  # type: ignore
-                    record_convertor=self._copy,
+                    record=context.record,
+                    rules=compiled_rule.rule,
+                    record_convertor=self,
                 )
 
+            if kind == RuleKind.COMMAND:
+                command = self._command_class(
+                    record=context.record,
+                    process_command=compiled_rule.key,
+                    process_args=compiled_rule.rule,
+                    record_convertor=self,
+                )
+                command.fields = context.fields
+                # a command (like `$full_record`) can return the input record
+                return plain_record(command.get_value())
+
             # All possible command options have been excluded so rule must be a key
             # definition for the new record:
-            if self._is_command_rule(rule=rule):
-                command, command_args = rule
-                return self._command_class(
-                    record=self._input_record,
-                    process_command=command,
-                    process_args=command_args,  # type: ignore
-                    record_convertor=self._copy,
-                ).get_value()
-
-            output_record_key, output_record_value = rule
-
-            if isinstance(output_record_value, dict):
-                # output_record_value is the nested rule set. So a new recordconvertor
-                # with the new rule setis defined
-                nested_record_covertor = self.get_record_convertor_copy_with_new_rules(
-                    output_record_value
-                )
-                # add the result of that new record convertor to the output record.
-                output_record[output_record_key] = nested_record_covertor.convert(
-                    record=self._input_record
+            if kind == RuleKind.NESTED:
+                # the nested rule set has been compiled into a sub plan. The result
+                # is added to the output record.
+                output_record[compiled_rule.key] = self._convert_nested(
+                    compiled_rule.sub_plan,  # type: ignore[arg-type]
+                    context.record,
+                    context.fields,
                 )
                 continue
 
-            if isinstance(output_record_value, str):
-                # setup with None needed to allow result_for_key to be 0
-                result_for_output_record_key = self._get_field(output_record_value)
-                if result_for_output_record_key is not None:
-                    output_record[output_record_key] = result_for_output_record_key
-                continue
+            # setup with None needed to allow result_for_key to be 0
+            result_for_output_record_key = NOT_EXTRACTED
+            if context.fields is not None and self._read_extracted_fields:
+                result_for_output_record_key = context.fields.get(
+                    compiled_rule.rule, NOT_EXTRACTED
+                )
+            if result_for_output_record_key is NOT_EXTRACTED:
+                result_for_output_record_key = self._get_field(
+                    compiled_rule.rule, context.record
+                )
+            if result_for_output_record_key is not None:
+                output_record[compiled_rule.key] = result_for_output_record_key
 
         return output_record
 
-    def get_record_convertor_copy_with_new_rules(
-        self, new_rules: RulesDict
-    ) -> "RecordConvertor":
+    def _convert_nested(
+        self, plan: RulePlan, record: dict, fields: Optional[dict] = None
+    ) -> Any:
         """
-        Return a copy of the current record convertor instance with new rules.
+        Converts the record with the sub plan of a nested rule set. `fields` are the
+        values extracted from the record for the plan the rule set is nested in.
         """
-        new_record_convertor = self._copy
-        new_record_convertor._rules = new_rules
-        return new_record_convertor
+        context = self._new_context(record)
+        context.fields = fields
+        nested_result = self._convert_with_plan(plan, context)
+        return self.DEFAULT_VALUE if nested_result is SKIPPED else nested_result
+
+    def rules_convertor(
+        self, rules: RulesDict, ignored_keys: tuple[str, ...] = ()
+    ) -> Callable[[dict], Any]:
+        """
+        Returns a function that converts a record with a (nested) rule set from the
+        rules of this record convertor, for example a rule set in the arguments of a
+        command. The rule set is compiled only once.
 
-    @property
-    def _copy(self) -> "RecordConvertor":
-        # prevent from creating class copy everytime a _copy method is called
-        # by storing the first copy in the _stored_copy attribute
-        if not self._stored_copy:
-            self._stored_copy = copy(self)
-        return self._stored_copy
+        Args:
+            rules (RulesDict): The rule set.
+            ignored_keys (tuple[str, ...]): Keys of the rule set that are not rules.
 
-    def _change_field_in_input_record_if_required(self, rule: tuple) -> bool:
+        Returns:
+            Callable: Function that takes a record and returns the converted record.
         """
-        Checks if input record needs to be updated based upon the given.
-        If so update is performed.
+        return partial(self._convert_nested, self._plan.plan_for(rules, ignored_keys))
 
-        Returns True if the rule is an input record update rule and false otherwise.
+    def get_record_convertor_copy_with_new_rules(
+        self, new_rules: RulesDict
+    ) -> "RecordConvertor":
         """
-        # check if the rule triggers a field conversion in the input record
-        if self._convert_field_rule(rule):
-            _, rule_dict = rule
-            self._input_record = self._field_convertor.convert_field(
-                record=self._input_record, conversion_rule=rule_dict
-            )
-            return True
-
-        # check if the rule triggers a field date conversion in the input record
-        if self._format_date_rule(rule):
-            _, rule_dict = rule
-            self._input_record = self._date_formatter.format_date_field(
-                record=self._input_record, conversion_rule=rule_dict
-            )
-            return True
+        Return a copy of the current record convertor instance with new rules.
 
-        return False
+        A new copy is returned on every call, so copies are never shared between
+        conversions.
+        """
+        new_record_convertor = copy(self)
+        new_record_convertor._plan = self._plan.plan_for(new_rules)
+        return new_record_convertor
 
     def _convert_field_rule(self, rule: tuple) -> bool:
         rule_key, _ = rule
-        return "$convert" in rule_key
+        return is_convert_field_rule(rule_key)
 
     def _format_date_rule(self, rule: tuple) -> bool:
         rule_key, _ = rule
-        return "$format_date" in rule_key
+        return is_format_date_rule(rule_key)
 
     def _is_dataclass_rule(self, rule: tuple) -> bool:
         rule_key, _ = rule
-        return "$dataclass" in rule_key
+        return is_dataclass_rule(rule_key)
 
     def _is_command_rule(self, rule: tuple) -> bool:
         rule_key, _ = rule
-        return rule_key[0] == "$"
+        return is_command_rule(rule_key)
 
     def _is_skip_rule(self, rule: tuple) -> bool:
-        rule_key, rule_value = rule
-        if RecConvKeys.SKIP in rule_key.lower():
-            return True
-        return False
+        rule_key, _ = rule
+        return is_skip_rule(rule_key)
 
-    def _skip_this_record(self, rule: tuple) -> bool:
-        rule_key, rule_value = rule
+    def _skip_this_record(self, rule: tuple, record: Optional[dict] = None) -> bool:
         if self._is_skip_rule(rule):
-            skip_rule: SkipRuleDict = rule_value
-            conditions: Optional[ConditionsDict] = skip_rule[SkipConvKeys.CONDITION]
-            fieldname: Optional[str] = skip_rule.get(SkipConvKeys.FIELDNAME)
-            field_value = self._get_field(fieldname)
-            return self.EVALUATE_CLASS(conditions, field_value).evaluate()
+            _, skip_rule = rule
+            return RecordConvertor._skip_rule_applies(
+                self, skip_rule, self._input_record if record is None else record
+            )
 
         return False
 
-    def _get_field(self, key: Optional[str]) -> Any:
-        if key:
-            # key elemenets in nested keys are surround with "". For exmample
-            # key.example-1 becomes "key"."example-1".
-            # Needed for jmespath can hande special characters in the keys
-            nested_keys = key.split(".")
-            nested_key = ".".join(['"' + key + '"' for key in nested_keys])
-            try:
-                return jmespath.search(nested_key, self._input_record)
-            except ParseError:
-                pass
+    def _skip_rule_applies(
+        self, skip_rule: SkipRuleDict, record: Optional[dict]
+    ) -> bool:
+        conditions: Optional[ConditionsDict] = skip_rule[SkipConvKeys.CONDITION]
+        fieldname: Optional[str] = skip_rule.get(SkipConvKeys.FIELDNAME)
+        field_value = self._get_field(fieldname, record)
+        return self._conditions_predicate(conditions)(field_value)
+
+    def _conditions_predicate(
+        self, conditions: Optional[ConditionsDict]
+    ) -> ConditionPredicate:
+        """Returns the conditions compiled by the evaluate class."""
+        return compiled_rule_cache(self).get(
+            conditions, self.EVALUATE_CLASS.compile, variant=self.EVALUATE_CLASS
+        )
+
+    def _get_field(self, key: Optional[str], record: Optional[dict] = None) -> Any:
+        # without a record the field is looked up in the record set for a legacy
+        # override (see `_support_legacy_overrides`)
+        return get_field(self._input_record if record is None else record, key)
+
+
+def _support_legacy_overrides(convertor_class: type[RecordConvertor]) -> None:
+    """
+    Adapts overrides of `_get_field(self, key)` and `_skip_this_record(self, rule)`
+    written before these methods were given the record to convert. The record is
+    made available as `self._input_record` before such an override is called, which
+    is not safe when the record convertor is shared between threads. Overrides of
+    `_skip_this_record` are called for the skip rules of the plan.
+    """
+    for method_name in ("_get_field", "_skip_this_record"):
+        method = convertor_class.__dict__.get(method_name)
+        if method is None or _takes_positional_arguments(method, 3):
+            continue
+        warnings.warn(
+            f"{convertor_class.__name__}.{method_name} does not take the record "
+            "to convert as argument. This is deprecated, add a `record` argument "
+            "instead of reading `self._input_record`.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        setattr(convertor_class, method_name, _with_input_record(method))
+
+    if (
+        convertor_class._skip_this_record is not RecordConvertor._skip_this_record
+        and "_skip_rule_applies" not in convertor_class.__dict__
+    ):
+        setattr(
+            convertor_class,
+            "_skip_rule_applies",
+            _skip_rule_applies_with_skip_this_record,
+        )
+
+
+def _takes_positional_arguments(method: Callable, number_of_arguments: int) -> bool:
+    """Returns True if the method accepts the number of positional arguments."""
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return True
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (
+            parameter.POSITIONAL_ONLY,
+            parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional += 1
+    return positional >= number_of_arguments
+
+
+def _with_input_record(method: Callable) -> Callable:
+    """Wraps a legacy override so it can be called with the record."""
+
+    @wraps(method)
+    def method_with_record(
+        self: RecordConvertor, argument: Any, record: Optional[dict] = None
+    ) -> Any:
+        if record is not None:
+            self._input_record = record
+        return method(self, argument)
+
+    return method_with_record
+
 
-        return None
+def _skip_rule_applies_with_skip_this_record(
+    self: RecordConvertor, skip_rule: SkipRuleDict, record: dict
+) -> bool:
+    return self._skip_this_record((RecConvKeys.SKIP, skip_rule), record)
 
 
 class RecordConvertorWithRulesDict(RecordConvertor):
@@ -249,6 +763,14 @@ class RecordConvertorWithRulesDict(RecordConvertor):
         data_classes: Optional[list[type[DataclassInstance]]] = None,
         command_class: Optional[type[ProcessCommand]] = None,
     ):
+        # arguments needed to build an identical record convertor in another process
+        self._convertor_arguments = {
+            "rule_dict": rule_dict,
+            "field_convertor": field_convertor,
+            "date_formatter": date_formatter,
+            "data_classes": data_classes,
+            "command_class": command_class,
+        }
         self._rules = self.RULE_CLASS(rule_source=rule_dict).rules
         # set instance of given or default field convertor class
         self._field_convertor: FieldConvertorProtocol = (
@@ -260,6 +782,9 @@ class RecordConvertorWithRulesDict(RecordConvertor):
         )()
         # set the dataclasses attribute as a dict with dataclass name as key and data
         # the dataclass itself as value
+        # registered on a copy of the processor so dataclasses are not shared with
+        # other record convertors
         dataclasses = data_classes or []
+        self.DATA_CLASS_PROCESSOR = copy(self.DATA_CLASS_PROCESSOR)
         self.DATA_CLASS_PROCESSOR.register_data_classes(dataclasses=dataclasses)
         self._command_class = command_class or self.COMMAND_CLASS
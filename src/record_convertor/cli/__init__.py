@@ -0,0 +1,393 @@
+"""
+Module with the `record-convertor` command, which converts NDJSON files (one JSON
+record per line) with a rule file.
+
+Records are streamed from the input to the output: they are read, converted and
+written one batch at a time, so the memory use does not depend on the size of the
+input. Gzip compressed input is detected from its content; output to a filename ending
+with `.gz` is gzip compressed.
+
+With more than one worker, uncompressed input files are split into byte ranges that
+the workers read, convert and encode themselves (see `parallel.ndjson_files`). Other
+input is read by the main process and sent to the workers record by record.
+
+Classes:
+    - ConversionStats: Numbers of records read and written.
+
+Functions:
+    - main: Entry point of the `record-convertor` command.
+    - convert_ndjson: Converts NDJSON streams with a record convertor.
+    - convert_ndjson_files: Converts NDJSON files in shards with worker processes.
+
+usage:
+    record-convertor --rules rules.yaml export.ndjson.gz -o converted.ndjson
+    cat export.ndjson | record-convertor --rules rules.yaml --workers 8 --progress
+"""
+
+import argparse
+import gzip
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import IO, Any, Callable, ContextManager, Iterable, Iterator, Optional, cast
+
+import yaml
+
+from ..package_settings import SkipRecordHandling
+from ..parallel import DEFAULT_CHUNKSIZE
+from ..parallel.ndjson_files import DEFAULT_SHARD_SIZE, ConvertedShard, to_ndjson
+
+__all__ = ["ConversionStats", "convert_ndjson", "convert_ndjson_files", "main"]
+
+STDIN_STDOUT = "-"
+DEFAULT_CONVERTOR_CLASS = "record_convertor:RecordConvertor"
+DEFAULT_BATCH_SIZE = 1000
+# seconds between two progress reports
+PROGRESS_INTERVAL = 5.0
+IO_BUFFER_SIZE = 1024 * 1024
+GZIP_MAGIC = b"\x1f\x8b"
+GZIP_COMPRESS_LEVEL = 6
+
+
+@dataclass
+class ConversionStats:
+    """Numbers of records read from the input and written to the output."""
+
+    records_read: int = 0
+    records_written: int = 0
+    start_time: float = field(default_factory=time.perf_counter)
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def report(self) -> str:
+        seconds = self.seconds
+        records_per_second = self.records_read / seconds if seconds else 0.0
+        return (
+            f"read {self.records_read:,} records, wrote {self.records_written:,} "
+            f"records in {seconds:,.1f}s ({records_per_second:,.0f} records/s)"
+        )
+
+
+def convert_ndjson(
+    convert: Callable[[Iterable[dict]], Iterable[Any]],
+    inputs: Iterable[IO[bytes]],
+    output: IO[bytes],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[ConversionStats], None]] = None,
+) -> ConversionStats:
+    """
+    Converts the records of NDJSON streams and writes them as NDJSON.
+
+    Args:
+        convert (Callable): Converts an iterable of records lazily, for example the
+            `convert_many` method of a record convertor.
+        inputs (Iterable[IO[bytes]]): Binary NDJSON streams. Empty lines are skipped.
+            The streams are not closed.
+        output (IO[bytes]): Binary stream the converted records are written to.
+        batch_size (int): Number of converted records written in a single write.
+        progress (Callable, optional): Called with the stats every
+            `PROGRESS_INTERVAL` seconds.
+
+    Returns:
+        ConversionStats: Numbers of records read and written.
+
+    Raises:
+        ValueError: If a line of the input is not a JSON object.
+    """
+    stats = ConversionStats()
+    records = _counted(
+        chain.from_iterable(_read_records(stream) for stream in inputs), stats
+    )
+    next_report = time.perf_counter() + PROGRESS_INTERVAL
+    batch: list[Any] = []
+    for converted_record in convert(records):
+        batch.append(converted_record)
+        if len(batch) < batch_size:
+            continue
+        output.write(to_ndjson(batch))
+        stats.records_written += len(batch)
+        batch = []
+        if progress is not None and time.perf_counter() >= next_report:
+            progress(stats)
+            next_report = time.perf_counter() + PROGRESS_INTERVAL
+    if batch:
+        output.write(to_ndjson(batch))
+        stats.records_written += len(batch)
+    output.flush()
+    return stats
+
+
+def convert_ndjson_files(
+    convert_file: Callable[[str], Iterable[ConvertedShard]],
+    filenames: Iterable[str],
+    output: IO[bytes],
+    progress: Optional[Callable[[ConversionStats], None]] = None,
+) -> ConversionStats:
+    """
+    Converts NDJSON files in shards and writes the converted shards to the output.
+
+    Args:
+        convert_file (Callable): Converts a file into shards, for example the
+            `convert_ndjson_file` method of a record convertor.
+        filenames (Iterable[str]): The (uncompressed) NDJSON files.
+        output (IO[bytes]): Binary stream the converted records are written to.
+        progress (Callable, optional): Called with the stats every
+            `PROGRESS_INTERVAL` seconds.
+
+    Returns:
+        ConversionStats: Numbers of records read and written.
+    """
+    stats = ConversionStats()
+    next_report = time.perf_counter() + PROGRESS_INTERVAL
+    for filename in filenames:
+        for shard in convert_file(filename):
+            output.write(shard.data)
+            stats.records_read += shard.records_read
+            stats.records_written += shard.records_written
+            if progress is not None and time.perf_counter() >= next_report:
+                progress(stats)
+                next_report = time.perf_counter() + PROGRESS_INTERVAL
+    output.flush()
+    return stats
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point of the `record-convertor` command.
+
+    Args:
+        argv (list[str], optional): Command line arguments, `sys.argv[1:]` if None.
+
+    Returns:
+        int: Exit status of the command.
+    """
+    parser = _argument_parser()
+    arguments = parser.parse_args(argv)
+    shard_inputs = (
+        arguments.workers > 1 or arguments.shard_output is not None
+    ) and all(_is_uncompressed_file(filename) for filename in arguments.inputs)
+    if arguments.shard_output is not None and not (
+        shard_inputs and len(arguments.inputs) == 1
+    ):
+        parser.error("--shard-output needs a single uncompressed input file")
+
+    def convert(records: Iterable[dict]) -> Iterator[Any]:
+        if arguments.workers == 1:
+            return record_convertor.convert_many(
+                records, skip_handling=arguments.skipped
+            )
+        return record_convertor.convert_parallel(
+            records,
+            workers=arguments.workers,
+            chunksize=arguments.chunksize,
+            skip_handling=arguments.skipped,
+        )
+
+    def convert_file(filename: str) -> Iterator[ConvertedShard]:
+        return record_convertor.convert_ndjson_file(
+            filename,
+            workers=arguments.workers,
+            shard_size=arguments.shard_size,
+            skip_handling=arguments.skipped,
+            shard_output=arguments.shard_output,
+        )
+
+    def report(stats: ConversionStats) -> None:
+        print(stats.report(), file=sys.stderr, flush=True)
+
+    progress = report if arguments.progress else None
+    try:
+        convertor_class = _import_class(arguments.convertor_class)
+        record_convertor = convertor_class(rule_source=arguments.rules)
+        with _open_output(arguments.output) as output:
+            if shard_inputs:
+                stats = convert_ndjson_files(
+                    convert_file, arguments.inputs, output, progress=progress
+                )
+            else:
+                stats = convert_ndjson(
+                    convert,
+                    _open_inputs(arguments.inputs),
+                    output,
+                    batch_size=arguments.batch_size,
+                    progress=progress,
+                )
+    except (OSError, ValueError, yaml.YAMLError) as error:
+        print(f"record-convertor: {error}", file=sys.stderr)
+        return 1
+    if arguments.progress:
+        report(stats)
+    return 0
+
+
+def _argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="record-convertor",
+        description="Converts NDJSON records with a rule file.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=[STDIN_STDOUT],
+        help="NDJSON input files, plain or gzip compressed ('-' for stdin, default)",
+    )
+    parser.add_argument("-r", "--rules", required=True, help="the YAML rule file")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=STDIN_STDOUT,
+        help="NDJSON output file, gzip compressed if it ends with .gz (default stdout)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes (default 1)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=_positive_int,
+        default=DEFAULT_CHUNKSIZE,
+        help=(
+            "number of records sent to a worker process in one go "
+            f"(default {DEFAULT_CHUNKSIZE})"
+        ),
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=_positive_int,
+        default=DEFAULT_SHARD_SIZE,
+        help=(
+            "size in bytes of the parts of uncompressed input files converted by a "
+            f"worker process in one go (default {DEFAULT_SHARD_SIZE})"
+        ),
+    )
+    parser.add_argument(
+        "--shard-output",
+        help=(
+            "write the records of every part of the input file to its own file, "
+            "named by this pattern with a {shard} field (e.g. out-{shard:05d}.ndjson)"
+        ),
+    )
+    parser.add_argument(
+        "--skipped",
+        choices=[
+            SkipRecordHandling.DROP,
+            SkipRecordHandling.DEFAULT,
+            SkipRecordHandling.NONE,
+        ],
+        default=SkipRecordHandling.DROP,
+        help=(
+            "output for records skipped by a skip rule: drop them (default), the "
+            "default value of the convertor or null"
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"number of records written at once (default {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="report the throughput on stderr while converting and when done",
+    )
+    parser.add_argument(
+        "--convertor-class",
+        default=DEFAULT_CONVERTOR_CLASS,
+        help=f"record convertor class as module:class ({DEFAULT_CONVERTOR_CLASS})",
+    )
+    return parser
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"should be at least 1 but is {number}")
+    return number
+
+
+def _import_class(name: str) -> type:
+    module_name, _, class_name = name.partition(":")
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(f"can not import convertor class '{name}': {error}") from error
+
+
+def _is_uncompressed_file(filename: str) -> bool:
+    if filename == STDIN_STDOUT or not os.path.isfile(filename):
+        return False
+    with open(filename, "rb") as file:
+        return file.read(len(GZIP_MAGIC)) != GZIP_MAGIC
+
+
+def _open_input(filename: str) -> IO[bytes]:
+    stream: Any
+    if filename == STDIN_STDOUT:
+        stream = sys.stdin.buffer
+    else:
+        stream = open(filename, "rb", buffering=IO_BUFFER_SIZE)
+    if not isinstance(stream, io.BufferedReader):
+        # a stream without `peek` (for example a replaced stdin)
+        stream = io.BufferedReader(stream, IO_BUFFER_SIZE)
+    if stream.peek(len(GZIP_MAGIC))[: len(GZIP_MAGIC)] == GZIP_MAGIC:
+        # a buffered reader reads lines much faster than the gzip file itself
+        return cast(
+            IO[bytes], io.BufferedReader(gzip.GzipFile(fileobj=stream), IO_BUFFER_SIZE)
+        )
+    return stream
+
+
+def _open_inputs(filenames: Iterable[str]) -> Iterator[IO[bytes]]:
+    """
+    Opens the input files one at a time. A file is closed once it has been read,
+    stdin is read but not closed.
+    """
+    for filename in filenames:
+        stream = _open_input(filename)
+        try:
+            yield stream
+        finally:
+            if filename != STDIN_STDOUT:
+                stream.close()
+
+
+def _open_output(filename: str) -> ContextManager[IO[bytes]]:
+    if filename == STDIN_STDOUT:
+        # stdout is flushed but not closed
+        return nullcontext(sys.stdout.buffer)
+    if filename.endswith(".gz"):
+        gzip_file = gzip.open(filename, "wb", compresslevel=GZIP_COMPRESS_LEVEL)
+        return cast(IO[bytes], gzip_file)
+    return open(filename, "wb", buffering=IO_BUFFER_SIZE)
+
+
+def _read_records(stream: IO[bytes]) -> Iterator[dict]:
+    name = getattr(stream, "name", "<input>")
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            raise ValueError(f"{name}:{line_number}: invalid JSON: {error}") from error
+        if not isinstance(record, dict):
+            raise ValueError(f"{name}:{line_number}: not a JSON object")
+        yield record
+
+
+def _counted(records: Iterator[dict], stats: ConversionStats) -> Iterator[dict]:
+    for record in records:
+        stats.records_read += 1
+        yield record
@@ -0,0 +1,368 @@
+"""
+Module to generate a specialised python function from a compiled rule plan.
+
+Walking a `RulePlan` costs a dispatch on the kind of every rule for every record. For
+rule sets that mainly map fields from the input record to the output record this
+overhead dominates the conversion. This module generates python source for the plan in
+which the field lookups and the output dict are written out, and `exec`s it into a
+plain function.
+
+Supported in the generated source:
+    - path copies (`"output_key": "input.path"`) and nested rule sets
+    - the `$fixed_value`, `$join`, `$point` and `$to_list` commands
+    - `$skip`, `$convert` and `$format_date` rules of the top level rule set, which
+      call the record convertor (and its field convertor and date formatter)
+
+Nested rule sets with any other rules are converted by the record convertor the
+function is called with. A plan with a `$dataclass` rule or a command at the top
+level is not generated at all, in which case the record convertor converts records by
+walking the plan itself. Neither is a plan for a record convertor that overrides
+`_get_field`.
+
+Classes:
+    - GeneratedFunction: The generated source and the function created from it.
+
+Functions:
+    - generate_convert_function:
+        Generates the convert function for a plan.
+    - generated_convert_function:
+        Returns the (cached) generated convert function for a plan.
+
+usage:
+>>> generated = generate_convert_function(plan)
+>>> print(generated.source)
+>>> converted_record = generated.function(record_convertor, record)
+"""
+
+from itertools import count
+from typing import Any, Callable, NamedTuple, Optional
+
+from ..command_processor import ProcessCommand
+from ..command_processor.command_helper import lat_lon_to_geojson_point
+from ..package_settings import (
+    CopyOnWriteRecord,
+    RecConvKeys,
+    compile_field_path,
+    keys_in_lower_case,
+)
+from ..rules_compiler import SKIPPED, CompiledRule, RuleKind, RulePlan
+
+__all__ = [
+    "GeneratedFunction",
+    "generate_convert_function",
+    "generated_convert_function",
+]
+
+ConvertFunction = Callable[[Any, dict], Any]
+
+# commands for which the generated source replaces the call to the command class
+GENERATED_COMMANDS = ("$fixed_value", "$join", "$point", "$to_list")
+INDENT = "    "
+
+
+class GeneratedFunction(NamedTuple):
+    """
+    Result of the code generation for a plan.
+
+    Attributes:
+        source (str): The generated python source.
+        function (ConvertFunction): The generated function. Takes the record
+            convertor and the input record and returns the converted record or
+            `SKIPPED`.
+    """
+
+    source: str
+    function: ConvertFunction
+
+
+class _NotGenerated(Exception):
+    """Raised when (part of) a plan can not be generated."""
+
+
+def _join_value(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+class _SourceGenerator:
+    """
+    Writes the source for a plan. Values that can not be written as a literal (rule
+    dicts, sub plans, compiled field getters) are passed to the generated function
+    as globals.
+    """
+
+    def __init__(
+        self, command_class: type[ProcessCommand], lower_case: bool, copy_on_write: bool
+    ):
+        self.command_class = command_class
+        self.lower_case = lower_case
+        self.copy_on_write = copy_on_write
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "SKIPPED": SKIPPED,
+            "CopyOnWriteRecord": CopyOnWriteRecord,
+            "keys_in_lower_case": keys_in_lower_case,
+            "lat_lon_to_geojson_point": lat_lon_to_geojson_point,
+            "join_value": _join_value,
+        }
+        self._counter = count(1)
+
+    def generate(self, plan: RulePlan) -> str:
+        self.emit(0, "def convert(record_convertor, record):")
+        if self.lower_case:
+            self.emit(1, "record = keys_in_lower_case(record)")
+        elif self.copy_on_write:
+            self.emit(1, "if not isinstance(record, CopyOnWriteRecord):")
+            self.emit(2, "record = CopyOnWriteRecord(record)")
+        self.emit(1, "output = {}")
+        for compiled_rule in plan:
+            self.emit_top_level_rule(compiled_rule)
+        self.emit(1, "return output")
+        return "\n".join(self.lines) + "\n"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append(INDENT * indent + line)
+
+    def name(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._counter)}"
+
+    def global_value(self, prefix: str, value: Any) -> str:
+        """Passes a value to the generated function and returns its name."""
+        name = self.name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def emit_top_level_rule(self, compiled_rule: CompiledRule) -> None:
+        kind = compiled_rule.kind
+        if kind == RuleKind.SKIP:
+            rule = self.global_value("skip_rule", compiled_rule.rule)
+            self.emit(1, f"if record_convertor._skip_rule_applies({rule}, record):")
+            self.emit(2, "return SKIPPED")
+        elif kind == RuleKind.FIELD_CONVERT:
+            rule = self.global_value("convert_rule", compiled_rule.rule)
+            self.emit(1, "record = record_convertor._field_convertor.convert_field(")
+            self.emit(2, f"record=record, conversion_rule={rule}")
+            self.emit(1, ")")
+        elif kind == RuleKind.DATE_FORMAT:
+            rule = self.global_value("date_rule", compiled_rule.rule)
+            self.emit(1, "record = record_convertor._date_formatter.format_date_field(")
+            self.emit(2, f"record=record, conversion_rule={rule}")
+            self.emit(1, ")")
+        elif kind in (RuleKind.PATH_COPY, RuleKind.NESTED):
+            self.emit_output_rule(compiled_rule, "output", "record", 1)
+        else:
+            # dataclass and command rules replace the output record as a whole
+            raise _NotGenerated(compiled_rule.key)
+
+    def emit_output_rule(
+        self, compiled_rule: CompiledRule, output: str, record: str, indent: int
+    ) -> None:
+        """Emits the code for a rule that adds a key to the output dict."""
+        key = repr(compiled_rule.key)
+        if compiled_rule.kind == RuleKind.PATH_COPY:
+            self.emit_path_copy(compiled_rule.rule, f"{output}[{key}]", record, indent)
+            return
+
+        sub_plan: RulePlan = compiled_rule.sub_plan  # type: ignore[assignment]
+        command = _leading_command(sub_plan)
+        nested_record = self.name("record") if self.lower_case else record
+        if command is not None:
+            expression = self.command_expression(command, nested_record)
+            if expression is not None:
+                if command.key != "$fixed_value":
+                    self.emit_nested_record(record, nested_record, indent)
+                self.emit(indent, f"{output}[{key}] = {expression}")
+                return
+
+        if all(rule.kind in (RuleKind.PATH_COPY, RuleKind.NESTED) for rule in sub_plan):
+            self.emit_nested_record(record, nested_record, indent)
+            nested_output = self.name("output")
+            self.emit(indent, f"{nested_output} = {{}}")
+            for rule in sub_plan:
+                self.emit_output_rule(rule, nested_output, nested_record, indent)
+            self.emit(indent, f"{output}[{key}] = {nested_output}")
+            return
+
+        # any other nested rule set is converted by the record convertor
+        plan = self.global_value("plan", sub_plan)
+        self.emit(
+            indent,
+            f"{output}[{key}] = record_convertor._convert_nested({plan}, {record})",
+        )
+
+    def emit_nested_record(self, record: str, nested_record: str, indent: int) -> None:
+        """A nested rule set is converted with its own (lower cased) record."""
+        if nested_record != record:
+            self.emit(indent, f"{nested_record} = keys_in_lower_case({record})")
+
+    def emit_path_copy(
+        self, field_path: str, target: str, record: str, indent: int
+    ) -> None:
+        """
+        Emits the lookup of a field path. Plain keys are looked up with chained
+        `.get` calls, which gives the same result as the compiled field path getter.
+        """
+        keys = field_path.split(".")
+        if not field_path or not all(_is_plain_key(key) for key in keys):
+            getter = self.global_value("get_field", compile_field_path(field_path))
+            self.emit(indent, f"value = {getter}({record})")
+        else:
+            lookups = "".join(f".get({key!r})" for key in keys)
+            self.emit(indent, "try:")
+            self.emit(indent + 1, f"value = {record}{lookups}")
+            self.emit(indent, "except AttributeError:")
+            self.emit(indent + 1, "value = None")
+        self.emit(indent, "if value is not None:")
+        self.emit(indent + 1, f"{target} = value")
+
+    def command_expression(
+        self, compiled_rule: CompiledRule, record: str
+    ) -> Optional[str]:
+        """
+        Returns an expression with the same result as the command, or None if the
+        command (or its arguments) is not supported by the generated source.
+        """
+        command, arguments = compiled_rule.key, compiled_rule.rule
+        if command not in GENERATED_COMMANDS or not self.default_command(command):
+            return None
+
+        if command == "$fixed_value":
+            return self.global_value("fixed_value", arguments)
+
+        if command == "$to_list":
+            if not _are_field_paths(arguments):
+                return None
+            values = "".join(f"{self.field(key, record)}, " for key in arguments)
+            return f"list(filter(None, ({values})))"
+
+        if command == "$point":
+            if not isinstance(arguments, dict):
+                return None
+            lat, lon = arguments.get("lat"), arguments.get("lon")
+            if not (_are_field_paths([lat, lon]) and lat and lon):
+                return None
+            return (
+                f"lat_lon_to_geojson_point({self.field(lat, record)}, "
+                f"{self.field(lon, record)})"
+            )
+
+        # $join
+        if not (_are_field_paths(arguments) and arguments and all(arguments)):
+            return None
+        seperator = ""
+        if "$seperator" in arguments[0]:
+            seperator, arguments = arguments[0][-1], arguments[1:]
+        values = "".join(
+            f"{key[1:]!r}, "
+            if key[0] == RecConvKeys.COMMAND_PREFIX
+            else f"join_value({self.field(key, record)}), "
+            for key in arguments
+        )
+        return f"{seperator!r}.join(({values})).strip()"
+
+    def field(self, field_path: str, record: str) -> str:
+        getter = self.global_value("get_field", compile_field_path(field_path))
+        return f"{getter}({record})"
+
+    def default_command(self, command: str) -> bool:
+        """
+        Returns True if the command class runs the command as `ProcessCommand` does,
+        so that the generated source can replace it.
+        """
+        return self.command_class.COMMANDS.get(command[1:]) is (
+            ProcessCommand.COMMANDS[command[1:]]
+        ) and all(
+            getattr(self.command_class, attribute, None)
+            is getattr(ProcessCommand, attribute)
+            for attribute in ("__init__", "get_value", "_get_field")
+        )
+
+
+def _leading_command(plan: RulePlan) -> Optional[CompiledRule]:
+    """
+    Returns the command that determines the result of the plan, if it is only
+    preceded by path copies (which have no effect as the command result replaces the
+    output).
+    """
+    for compiled_rule in plan:
+        if compiled_rule.kind == RuleKind.COMMAND:
+            return compiled_rule
+        if compiled_rule.kind != RuleKind.PATH_COPY:
+            return None
+    return None
+
+
+def _is_plain_key(key: str) -> bool:
+    return bool(key) and not any(char in ('"', "\\") or char < " " for char in key)
+
+
+def _are_field_paths(arguments: Any) -> bool:
+    return isinstance(arguments, list) and all(
+        isinstance(argument, str) for argument in arguments
+    )
+
+
+def generate_convert_function(
+    plan: RulePlan,
+    command_class: type[ProcessCommand] = ProcessCommand,
+    keys_in_lower_case: bool = False,
+    copy_on_write: bool = False,
+    custom_get_field: bool = False,
+) -> Optional[GeneratedFunction]:
+    """
+    Generates a convert function for a plan.
+
+    Args:
+        plan (RulePlan): the compiled rule set.
+        command_class (type): the command class of the record convertor. Commands
+            are only generated if the command class runs them as `ProcessCommand`.
+        keys_in_lower_case (bool): the record convertor converts the keys of the
+            input record to lower case.
+        copy_on_write (bool): the record convertor converts a copy-on-write version
+            of the input record.
+        custom_get_field (bool): the record convertor overrides `_get_field`. The
+            generated source looks up the fields itself, so no function is
+            generated.
+
+    Returns:
+        GeneratedFunction: the source and the function, or None if the plan can not
+            be generated.
+    """
+    if custom_get_field:
+        return None
+    generator = _SourceGenerator(command_class, keys_in_lower_case, copy_on_write)
+    try:
+        source = generator.generate(plan)
+    except _NotGenerated:
+        return None
+    exec(compile(source, "<record_convertor.codegen>", "exec"), generator.namespace)
+    return GeneratedFunction(source, generator.namespace["convert"])
+
+
+def generated_convert_function(
+    plan: RulePlan,
+    command_class: type[ProcessCommand] = ProcessCommand,
+    keys_in_lower_case: bool = False,
+    copy_on_write: bool = False,
+    custom_get_field: bool = False,
+) -> Optional[ConvertFunction]:
+    """
+    Returns the generated convert function for a plan. The function is generated
+    once and stored with the plan.
+
+    Args: see `generate_convert_function`
+
+    Returns:
+        ConvertFunction: the generated function, or None if the plan can not be
+            generated.
+    """
+    key = (command_class, keys_in_lower_case, copy_on_write, custom_get_field)
+    try:
+        return plan.generated_functions[key]
+    except KeyError:
+        pass
+    generated = generate_convert_function(
+        plan, command_class, keys_in_lower_case, copy_on_write, custom_get_field
+    )
+    convert_function = generated.function if generated else None
+    plan.generated_functions[key] = convert_function
+    return convert_function
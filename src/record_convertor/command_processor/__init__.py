@@ -93,14 +93,35 @@ Availale conversion commands
 
     - $current_year
         sets the field value to the current year as a str
+
+Commands are dispatched through the `COMMANDS` registry of the command class: a dict
+with the command name (without the `$`) as key and a function that takes the command
+instance as its only argument. The command instance is the per-call context of the
+command: it holds the record, the command arguments and the record convertor. The
+registry is built from the public methods of the class (so commands added or
+overridden by a subclass are registered automatically). Custom commands can be added
+with `register_command`.
+
+usage:
+>>> class CommandClass(ProcessCommand):
+>>>     pass
+>>>
+>>> @CommandClass.register_command("reverse")
+>>> def reverse(command: ProcessCommand):
+>>>     return command.get_field(command.process_args["field_name"])[::-1]
 """
 
 import re
 from datetime import datetime
-from typing import Union
-
-import jmespath
-from jmespath.exceptions import ParseError
+from types import FunctionType
+from typing import Any, Callable, ClassVar, Iterable, Optional, Union
+
+from record_convertor.package_settings import (
+    NOT_EXTRACTED,
+    CommandRuleKeys,
+    get_field,
+    plain_record,
+)
 
 from .command_helper import (
     lat_lon_to_geojson_point,
@@ -108,7 +129,32 @@ from .command_helper import (
     process_args_is_list,
 )
 
-__all__ = ["ProcessCommand"]
+__all__ = ["ProcessCommand", "CommandFunction", "command_field_paths"]
+
+CommandFunction = Callable[["ProcessCommand"], Any]
+
+# public methods of the command class that are not a command
+NON_COMMAND_METHODS = ("get_value", "get_field")
+
+# commands that do not read fields of the record themselves
+COMMANDS_WITHOUT_FIELDS = (
+    "current_year",
+    "set_to_none_value",
+    "fixed_value",
+    "to_list_dynamic",
+)
+# commands that read the fields named by some of their (dict) arguments
+COMMAND_FIELD_ARGUMENTS = {
+    "allow_none_value": ("field_name",),
+    "to_int": ("field_name",),
+    "int_from_string": ("field_name",),
+    "split_field": ("field_name",),
+    "point": ("lat", "lon"),
+    "key_value": ("value",),
+    "from_list": (CommandRuleKeys.LIST_FIELD_NAME,),
+    "first_item_from_list": (CommandRuleKeys.LIST_FIELD_NAME,),
+    "join_key_value": (CommandRuleKeys.KEY, CommandRuleKeys.VALUE),
+}
 
 
 class ProcessCommand:
@@ -121,14 +167,67 @@ class ProcessCommand:
         process_command (str) : process command to be executed to obtain the
                                 correct value from the record
         process_args (str, dict) : arguments needed to run the process command
-        add_process_commands (dict) : dict with process names and custom
-                                      lambda's
+        add_process_commands (dict) : dict with process names (without `$`) and
+                                      custom command classes. A custom command
+                                      class is created with the record and
+                                      process_args and run with `convert()`.
 
 
     returns:
         value (dict, list, str, int, float): output of teh conversion
     """
 
+    # commands of the class by name, see the module docstring
+    COMMANDS: ClassVar[dict[str, CommandFunction]] = {}
+    # commands added to the class with `register_command`
+    _registered_commands: ClassVar[dict[str, CommandFunction]] = {}
+    # values of the field paths extracted from the record by the path trie of the
+    # plan, set by the record convertor (see `PathTrie`)
+    fields: Optional[dict[str, Any]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._registered_commands = {}
+        cls._collect_commands()
+
+    @classmethod
+    def register_command(
+        cls, name: str, function: Optional[CommandFunction] = None
+    ) -> Any:
+        """
+        Registers a custom command for this class (and its subclasses). Can be used
+        as a decorator when no function is given.
+
+        Args:
+            name (str): Name of the command, with or without the leading `$`.
+            function (CommandFunction): Function that takes the command instance
+                and returns the result of the command.
+
+        Returns:
+            The registered function, or a decorator when no function is given.
+        """
+
+        def register(function: CommandFunction) -> CommandFunction:
+            cls._registered_commands[name.removeprefix("$")] = function
+            cls._collect_commands()
+            return function
+
+        return register if function is None else register(function)
+
+    @classmethod
+    def _collect_commands(cls) -> None:
+        """
+        (Re)builds the command registry of the class and its subclasses. Commands of
+        a subclass override the commands of its base classes.
+        """
+        commands: dict[str, CommandFunction] = {}
+        for klass in reversed(cls.__mro__):
+            commands.update(_method_commands(klass))
+            commands.update(vars(klass).get("_registered_commands", {}))
+        cls.COMMANDS = commands
+        for subclass in cls.__subclasses__():
+            subclass._collect_commands()
+
     def __init__(
         self,
         record: dict,
@@ -199,30 +298,23 @@ class ProcessCommand:
         """
         process_args = process_args_is_dict(self.process_args)
 
-        rules = process_args.copy()
-        obj_list = self._get_field(rules.pop("list_field_name"))
+        obj_list = self._get_field(process_args[CommandRuleKeys.LIST_FIELD_NAME])
 
         if not (obj_list and isinstance(obj_list, list)):
             return []
 
-        return list(
-            filter(
-                None,
-                [
-                    self.record_convertor(rules=rules, record=obj).convert()
-                    for obj in obj_list
-                ],
-            )
+        # the remaining arguments are the rule set for the list items
+        convert_item = self._rules_convertor(
+            process_args, ignored_keys=(CommandRuleKeys.LIST_FIELD_NAME,)
         )
+        return list(filter(None, map(convert_item, obj_list)))
 
     def to_list_dynamic(self):
+        process_args = process_args_is_list(self.process_args)
         return list(
             filter(
                 None,
-                [
-                    self.record_convertor(rules=rule, record=self.record).convert()
-                    for rule in self.process_args
-                ],
+                [self._rules_convertor(rule)(self.record) for rule in process_args],
             )
         )
 
@@ -235,13 +327,13 @@ class ProcessCommand:
 
         # check if key value needs to be composed
         if isinstance(key_key, dict):
-            key = self.record_convertor(rules=key_key, record=self.record).convert()
+            key = self._rules_convertor(key_key)(self.record)
         else:
             key = self._get_field(key_key)
 
         # check if value value needs to be composed
         if isinstance(value_key, dict):
-            value = self.record_convertor(rules=value_key, record=self.record).convert()
+            value = self._rules_convertor(value_key)(self.record)
         else:
             value = self._get_field(value_key)
 
@@ -262,7 +354,7 @@ class ProcessCommand:
 
     def full_record(self):
         """returns the full record"""
-        return self.record
+        return plain_record(self.record)
 
     def point(self):
         """
@@ -362,33 +454,104 @@ class ProcessCommand:
     def get_value(self):
         """calls the actual process command
 
-        first command is looked up in default commands.
+        first command is looked up in the command registry of the class.
         If not found there it is looked up in custom commands
 
         """
-        if self.process_command in dir(self):
-            return getattr(self, self.process_command)()
+        command = self.COMMANDS.get(self.process_command)
+        if command is not None:
+            return command(self)
 
-        cust_command = self.process_command[1:]
-        cust_comm_class = self.add_process_commands.get(cust_command, None)
+        cust_comm_class = self.add_process_commands.get(self.process_command, None)
 
         if cust_comm_class:
             return cust_comm_class(self.record, self.process_args).convert()
 
         raise NotImplementedError(f"Field conversion command `{self.process_command}`")
 
+    def get_field(self, key: str) -> Any:
+        """Returns the value of the (nested) field `key` of the record."""
+        return self._get_field(key)
+
     def _get_field(self, key, rec=None):
-        record = rec or self.record
-
-        if key:
-            # key elemenets in nested keys are surround with "". For exmample
-            # key.example-1 becomes "key"."example-1".
-            # Needed for jmespath can hande special characters in the keys
-            nested_keys = key.split(".")
-            nested_key = ".".join(['"' + key + '"' for key in nested_keys])
-            try:
-                return jmespath.search(nested_key, record)
-            except ParseError:
-                pass
+        if rec is None and self.fields is not None:
+            value = self.fields.get(key, NOT_EXTRACTED)
+            if value is not NOT_EXTRACTED:
+                return value
+        return get_field(rec or self.record, key)
+
+    def _rules_convertor(
+        self, rules: dict, ignored_keys: tuple[str, ...] = ()
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function that converts a record with a nested rule set from the
+        command arguments. A record convertor compiles the rule set only once.
+        """
+        rules_convertor = getattr(self.record_convertor, "rules_convertor", None)
+        if rules_convertor is not None:
+            return rules_convertor(rules, ignored_keys)
+
+        # a record convertor class that is created for every conversion
+        rules = {key: value for key, value in rules.items() if key not in ignored_keys}
+        return lambda record: self.record_convertor(
+            rules=rules, record=record
+        ).convert()
+
+
+def command_field_paths(command: str, arguments: Any) -> Optional[list[str]]:
+    """
+    Returns the field paths of the record that a command of `ProcessCommand` reads
+    itself. Rule sets in the arguments of a command (of `$to_list_dynamic` for
+    example) are converted with a record convertor and are not included.
+
+    Args:
+        command (str): The command, including the leading `$`.
+        arguments (Any): The arguments of the command.
 
+    Returns:
+        list[str]: The field paths, or None if the command can read any field of
+            the record (`$full_record` and commands that are not known).
+    """
+    name = command[1:]
+    field_paths: Iterable[Any]
+    if name in COMMANDS_WITHOUT_FIELDS:
+        return []
+    if name in COMMAND_FIELD_ARGUMENTS:
+        if not isinstance(arguments, dict):
+            return []
+        field_paths = (arguments.get(key) for key in COMMAND_FIELD_ARGUMENTS[name])
+    elif name == "to_list":
+        field_paths = arguments if isinstance(arguments, list) else []
+    elif name == "join":
+        # arguments starting with a `$` are fixed values (or the seperator)
+        field_paths = (
+            argument
+            for argument in (arguments if isinstance(arguments, list) else [])
+            if isinstance(argument, str) and argument[:1] != "$"
+        )
+    else:
         return None
+    return [path for path in field_paths if path and isinstance(path, str)]
+
+
+def _method_commands(klass: type) -> dict[str, CommandFunction]:
+    """Returns the commands defined as public methods in the body of the class."""
+    commands: dict[str, CommandFunction] = {}
+    for name, attribute in vars(klass).items():
+        if name.startswith("_") or name in NON_COMMAND_METHODS:
+            continue
+        if isinstance(attribute, FunctionType):
+            commands[name] = attribute
+        elif isinstance(attribute, staticmethod):
+            commands[name] = _command_from_attribute(name)
+    return commands
+
+
+def _command_from_attribute(name: str) -> CommandFunction:
+    def run_command(command: ProcessCommand) -> Any:
+        return getattr(command, name)()
+
+    return run_command
+
+
+ProcessCommand._collect_commands()
@@ -11,10 +11,9 @@ The class uses an injected record convertor to process the input record bases up
 provided rules.
 """
 
+import sys
 from dataclasses import asdict, is_dataclass
-from typing import Any, Type
-
-from pydantic import BaseModel
+from typing import Any, NamedTuple, Optional, Type
 
 from ..package_settings import (
     DataclassInstance,
@@ -25,6 +24,17 @@ from ..package_settings import (
 )
 
 
+def _pydantic_base_model() -> Optional[type[Any]]:
+    """
+    Returns the Pydantic BaseModel if Pydantic models are in use, else None.
+
+    Pydantic is not imported by this package: a Pydantic model can only exist once
+    `pydantic.main` has been imported by the code that defines the model.
+    """
+    pydantic_main = sys.modules.get("pydantic.main")
+    return getattr(pydantic_main, "BaseModel", None)
+
+
 def _is_dataclass(dataclass: type) -> bool:
     """
     Helper method to check if a class is a dataclass.
@@ -33,7 +43,8 @@ def _is_dataclass(dataclass: type) -> bool:
     """
     if is_dataclass(dataclass):
         return True
-    if issubclass(dataclass, BaseModel):
+    base_model = _pydantic_base_model()
+    if base_model is not None and issubclass(dataclass, base_model):
         return True
     return False
 
@@ -41,11 +52,23 @@ def _is_dataclass(dataclass: type) -> bool:
 def _asdict(dataclass) -> dict:
     if is_dataclass(dataclass):
         return asdict(dataclass)  # type: ignore
-    if isinstance(dataclass, BaseModel):
+    base_model = _pydantic_base_model()
+    if base_model is not None and isinstance(dataclass, base_model):
         return dataclass.model_dump()
     raise TypeError(f"Class {dataclass.__name__} is not a dataclass of a Pydantic c")
 
 
+class DataClassSettings(NamedTuple):
+    """
+    Settings for processing a dataclass rule. Created per call so that a single
+    processor can be used by multiple record conversions at the same time.
+    """
+
+    dataclass: Type
+    record_convertor_args: Optional[dict]
+    methods: list[dict[str, Any]]
+
+
 class DataClassProcessor:
     """
     Processes dataclasses by applying a set of rules and converting dictionaries to
@@ -80,10 +103,8 @@ class DataClassProcessor:
         Returns:
             dict: The converted dataclass instance as a dictionary.
         """
-        self._record = record
-        self._record_covertor = record_convertor
-        self._prepare_dataclass_settings(rules=rules)
-        return self._create_return_dict()
+        settings = self._get_dataclass_settings(rules=rules)
+        return self._create_return_dict(record, record_convertor, settings)
 
     def register_dict_of_data_classes(
         self, dataclasses: dict[str, Type[DataclassInstance]]
@@ -139,85 +160,115 @@ class DataClassProcessor:
             raise ValueError(f"class '{dataclass.__name__}' is not a dataclass")
         setattr(self, dataclass_name, dataclass)
 
-    def _prepare_dataclass_settings(self, rules: DataClassRuleDict):
+    def _get_dataclass_settings(self, rules: DataClassRuleDict) -> DataClassSettings:
         """
-        Prepares settings for dataclass processing being
-        - rule set
+        Returns the settings for dataclass processing being
+        - the dataclass to use
         - arguments for the intial record conversion
         - methods and arguments to be run on the dataclass instance
         """
-        self._set_dataclass_to_use(rules)
-        self._set_record_covertor_arguments(rules)
-        self._set_dataclass_methods(rules)
-
-    def _set_record_covertor_arguments(self, rules: DataClassRuleDict):
-        """Set arguments for the intial record conversion."""
-        self._record_convertor_args: dict = rules.get(
-            DataClassRuleKeys.RECORD_CONVERSION_ARGUMENTS, {}
+        return DataClassSettings(
+            dataclass=self._get_dataclass_to_use(rules),
+            record_convertor_args=self._get_record_covertor_arguments(rules),
+            methods=self._get_dataclass_methods(rules),
         )
 
-    def _set_dataclass_methods(self, rules: DataClassRuleDict):
+    def _get_record_covertor_arguments(
+        self, rules: DataClassRuleDict
+    ) -> Optional[dict]:
         """
-        Set methods and their arguments to be used after the dataclass has been created.
+        Get arguments for the intial record conversion. None if there are no
+        arguments.
         """
-        self._data_class_methods: list[dict[str, Any]] = (
-            rules.get(
-                DataClassRuleKeys.METHODS  # type: ignore
-            )
-            or []
-        )
+        return rules.get(DataClassRuleKeys.RECORD_CONVERSION_ARGUMENTS) or None
+
+    def _get_dataclass_methods(self, rules: DataClassRuleDict) -> list[dict[str, Any]]:
+        """
+        Get methods and their arguments to be used after the dataclass has been created.
+        """
+        return rules.get(DataClassRuleKeys.METHODS) or []  # type: ignore
 
-    def _set_dataclass_to_use(self, rules: DataClassRuleDict):
+    def _get_dataclass_to_use(self, rules: DataClassRuleDict) -> Type:
         """Select the dataclass to be used from the registered dataclasses."""
         data_class_name = rules[DataClassRuleKeys.NAME]
         try:
-            self._dataclass_to_be_used: Type = getattr(self, data_class_name)
+            return getattr(self, data_class_name)
         except AttributeError:
             raise ValueError(f"Unknown dataclass '{data_class_name}' defined in rules")
 
-    def _get_dataclass_content(self) -> dict:
+    def _get_dataclass_content(
+        self,
+        record: dict,
+        record_convertor: RecordConvertorProtocol,
+        settings: DataClassSettings,
+    ) -> dict:
         """Convert input record into dict that can be be used byu the dataclass."""
+        if settings.record_convertor_args is None:
+            # converting with an empty rule set always results in an empty dict
+            return {}
         dataclass_content_creator = (
-            self._record_covertor.get_record_convertor_copy_with_new_rules(
-                new_rules=self._record_convertor_args
+            record_convertor.get_record_convertor_copy_with_new_rules(
+                new_rules=settings.record_convertor_args
             )
         )
-        return dataclass_content_creator.convert(record=self._record)
+        return dataclass_content_creator.convert(record=record)
 
-    def _create_return_dict(self) -> dict:
+    def _create_return_dict(
+        self,
+        record: dict,
+        record_convertor: RecordConvertorProtocol,
+        settings: DataClassSettings,
+    ) -> dict:
         """Create dict record to be returned."""
-        dataclass_content = self._get_dataclass_content()
-        dataclass_instance = self._get_dataclass_instance(dataclass_content)
+        dataclass_content = self._get_dataclass_content(
+            record, record_convertor, settings
+        )
+        dataclass_instance = self._get_dataclass_instance(
+            dataclass_content, record, record_convertor, settings
+        )
         return _asdict(dataclass_instance)
 
-    def _get_dataclass_instance(self, dataclass_content: dict) -> DataclassInstance:
+    def _get_dataclass_instance(
+        self,
+        dataclass_content: dict,
+        record: dict,
+        record_convertor: RecordConvertorProtocol,
+        settings: DataClassSettings,
+    ) -> DataclassInstance:
         """Create the dataclass instance and initiate the methods to be run."""
-        dataclass_instance = self._dataclass_to_be_used(**dataclass_content)
+        dataclass_instance = settings.dataclass(**dataclass_content)
         dataclass_instance = self._update_dataclass_with_provided_methods(
-            dataclass_instance
+            dataclass_instance, record, record_convertor, settings
         )
         return dataclass_instance
 
     def _update_dataclass_with_provided_methods(
-        self, dataclass_instance: DataclassInstance
+        self,
+        dataclass_instance: DataclassInstance,
+        record: dict,
+        record_convertor: RecordConvertorProtocol,
+        settings: DataClassSettings,
     ) -> DataclassInstance:
         """Execute each method on the data class."""
-        for method_dict in self._data_class_methods:
+        for method_dict in settings.methods:
             [[method, method_argument_rules]] = method_dict.items()
-            method_arguments = self._get_method_arguments(method_argument_rules)
+            method_arguments = self._get_method_arguments(
+                method_argument_rules, record, record_convertor
+            )
             for method_argument in method_arguments:
                 getattr(dataclass_instance, method)(**method_argument)  # type: ignore
         return dataclass_instance
 
     def _get_method_arguments(
-        self, method_argument_rules: dict
+        self,
+        method_argument_rules: dict,
+        record: dict,
+        record_convertor: RecordConvertorProtocol,
     ) -> list[dict[str, Any]]:
         """Retrieve method arguments from the method rules."""
-        method_arguments = (
-            self._record_covertor.get_record_convertor_copy_with_new_rules(
-                new_rules=method_argument_rules
-            ).convert(self._record)
-        )
+        method_arguments = record_convertor.get_record_convertor_copy_with_new_rules(
+            new_rules=method_argument_rules
+        ).convert(record)
         return (
             method_arguments
             if isinstance(method_arguments, list)
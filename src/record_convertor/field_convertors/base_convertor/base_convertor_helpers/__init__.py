@@ -1,17 +1,21 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any, Optional
 
-import jmespath
-from jmespath.exceptions import ParseError
-
 from record_convertor.package_settings.conditions.evaluate import EvaluateConditions
+from record_convertor.package_settings.helpers.compiled_rule_cache import (
+    compiled_rule_cache,
+)
+from record_convertor.package_settings.helpers.copy_on_write import writable_child
+from record_convertor.package_settings.helpers.field_path import get_field
 from record_convertor.package_settings.package_types import (
     BaseConvertorKeys,
     BaseRuleDict,
 )
 
+from .action_pipeline import ActionPipeline, compile_action_pipeline
 from .countries import *  # NOQA
 from .html_parser import *  # NOQA
+from .phone_numbers import *  # NOQA
 from .string_helpers import *  # NOQA
 
 
@@ -37,44 +41,72 @@ class _BaseConvertorClass:
 
     def convert_field(
         self, record: dict[str, Any], conversion_rule: BaseRuleDict
+    ) -> dict:
+        pipeline = self._action_pipeline(conversion_rule)
+        # the conversion state is kept on a shallow copy of the convertor so that a
+        # single convertor can be used by multiple record conversions at once
+        return copy(self)._run_action_pipeline(record, conversion_rule, pipeline)
+
+    def _action_pipeline(self, conversion_rule: BaseRuleDict) -> ActionPipeline:
+        """
+        Returns the compiled actions for the conversion rule. Each conversion rule is
+        compiled once per field convertor.
+        """
+        return compiled_rule_cache(self).get(
+            conversion_rule, self._compile_action_pipeline, variant="actions"
+        )
+
+    def _compile_action_pipeline(self, conversion_rule: BaseRuleDict) -> ActionPipeline:
+        return compile_action_pipeline(type(self), conversion_rule)
+
+    def _run_action_pipeline(
+        self,
+        record: dict[str, Any],
+        conversion_rule: BaseRuleDict,
+        pipeline: ActionPipeline,
     ) -> dict:
         self.record = record
         self.conversion_rule = conversion_rule
-        self.field_name = conversion_rule[BaseConvertorKeys.FIELDNAME]
-        self.field_value = self._get_field(self.field_name)
-
-        actions = self.conversion_rule[BaseConvertorKeys.ACTIONS] or {}
-        if self.all_conditions_true():
-            # loop over all actions
-            for action_dict in deepcopy(actions):
+        self.field_name = pipeline.field_name
+        if type(self)._get_field is _BaseConvertorClass._get_field:
+            self.field_value = pipeline.get_field_value(record)
+        else:
+            # the compiled field getter would bypass the overridden `_get_field`
+            self.field_value = self._get_field(self.field_name)
+
+        if not (pipeline.steps and self.all_conditions_true()):
+            return self.record
+
+        for index, step in enumerate(pipeline.steps):
+            # an earlier action might have changed the field (or its name)
+            if index:
                 self.field_value = self._get_field(self.field_name)
-                # remove any optional target_field from the action as the target_field
-                # setting is not an action in itself
-                optional_target_field = action_dict.pop(
-                    BaseConvertorKeys.ACTIONTARGET, None
-                )
 
-                # retrieve single action and action value and execute
-                [[action, action_value]] = action_dict.items()
-                if action in dir(self):
-                    field_value = getattr(self, action)(action_value)
-                else:
-                    raise NotImplementedError(f"Action {action}")
-
-                # Set the target field of leave the used field_name as is if no
-                # target field is defined.
-                target_field = optional_target_field or self.field_name
-                if action not in ["remove"]:
-                    self.set_field_value(value=field_value, target_field=target_field)
+            if step.method is None:
+                raise NotImplementedError(f"Action {step.action}")
+            action_value = (
+                deepcopy(step.action_value)
+                if step.copy_action_value
+                else step.action_value
+            )
+            field_value = step.method(self, action_value)
+
+            # Set the target field of leave the used field_name as is if no
+            # target field is defined.
+            if step.sets_field:
+                self.set_field_value(
+                    value=field_value, target_field=step.target_field or self.field_name
+                )
 
         return self.record
 
     def all_conditions_true(self) -> bool:
         """Returns True if all provided conditions are satisfied"""
         if conditions := self.conversion_rule.get(BaseConvertorKeys.CONDITION):
-            return EvaluateConditions(
-                provided_conditions=conditions, value=self.field_value
-            ).evaluate()
+            conditions_apply = compiled_rule_cache(self).get(
+                conditions, EvaluateConditions.compile, variant="conditions"
+            )
+            return conditions_apply(self.field_value)
 
         # when no conditions were provided the conversion needs to
         # continue
@@ -105,7 +137,9 @@ class _BaseConvertorClass:
 
         # find the top level nested dict in whih the last_field is a (nested) key
         # if this nested dict does not yet exist then create it
-        field_value = self.record.get(first_field_name, None)
+        # nested dicts are retrieved with `writable_child` so that nested dicts that
+        # are shared with the input record of a copy-on-write record are copied first
+        field_value = writable_child(self.record, self.record, first_field_name)
         if field_value is None:
             field_value = {}
             self.record[first_field_name] = field_value
@@ -114,7 +148,7 @@ class _BaseConvertorClass:
         # structure to get to the dict containing the last field name
         # if the nested dict structure does not yet exist it will be created
         for field_name in nested_field_names:
-            field_value = field_value.get(field_name, None)
+            field_value = writable_child(self.record, field_value, field_name)
             if field_value is None:
                 field_value = {}
                 self.record[first_field_name] = field_value
@@ -145,13 +179,15 @@ class _BaseConvertorClass:
         last_field = nested_field_names.pop()
 
         # find the nested dict in which the last_field is a (nested) key
-        if not (field_value := self.record.get(first_field_name, None)):
+        if not (
+            field_value := writable_child(self.record, self.record, first_field_name)
+        ):
             return None
 
         # with the list of nested field name we dig deeper into the
         # structure to get to the dict containing the last field name
         for field_name in nested_field_names:
-            field_value = field_value.get(field_name, {})
+            field_value = writable_child(self.record, field_value, field_name, {})
 
         # update that value of `last_field` in that dict
         if field_value and isinstance(field_value, dict):
@@ -163,19 +199,6 @@ class _BaseConvertorClass:
         nested field names should be seperated by `__`
         """
         # initially used '__' as key seperator but migrating to using
-        # `.` as seperator. This line to allow old conversion yaml files
-        # not to fail
-        record = rec or self.record
-        if key:
-            nested_field_names = key.replace("__", ".")
-            # key elemenets in nested keys are surround with "". For exmample
-            # key.example-1 becomes "key"."example-1".
-            # Needed for jmespath can hande special characters in the keys
-            nested_keys = nested_field_names.split(".")
-            nested_key = ".".join(['"' + key + '"' for key in nested_keys])
-            try:
-                return jmespath.search(nested_key, record)
-            except ParseError:
-                pass
-
-        return None
+        # `.` as seperator. The legacy seperator is allowed so old conversion
+        # yaml files do not fail
+        return get_field(rec or self.record, key, legacy_separator=True)
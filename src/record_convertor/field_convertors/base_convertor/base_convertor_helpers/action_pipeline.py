@@ -0,0 +1,137 @@
+"""
+Module to compile the actions of a field conversion rule into an action pipeline.
+
+A field conversion rule is applied to every record. Everything that only depends on
+the rule (which method runs an action, the optional target field of an action, the
+compiled field path) is worked out once when the rule is compiled into an
+`ActionPipeline`. Running the conversion only has to walk the steps of the pipeline.
+
+Classes:
+    - ActionStep: A single action of a conversion rule.
+    - ActionPipeline: The compiled actions of a conversion rule.
+
+Functions:
+    - compile_action_pipeline:
+        Compiles a conversion rule for a field convertor class.
+"""
+
+from inspect import getattr_static
+from types import FunctionType
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+from record_convertor.package_settings.helpers.field_path import (
+    FieldGetter,
+    compile_field_path,
+)
+from record_convertor.package_settings.package_types import (
+    BaseConvertorKeys,
+    BaseRuleDict,
+)
+
+__all__ = ["ActionStep", "ActionPipeline", "compile_action_pipeline"]
+
+ActionMethod = Callable[[Any, Any], Any]
+
+# actions that do not set the result of the action to the target field
+ACTIONS_WITHOUT_RESULT = ("remove",)
+
+
+class ActionStep(NamedTuple):
+    """
+    A single action of a conversion rule.
+
+    Attributes:
+        action (str): Name of the action.
+        action_value (Any): Value of the action as given in the rule.
+        copy_action_value (bool): The action value is a container which is copied
+            for every run so the result of an action never shares data with the rule.
+        target_field (str, optional): Field to set the result to. The field of the
+            conversion rule is used when not provided.
+        sets_field (bool): The result of the action is set to the target field.
+        method (ActionMethod, optional): Runs the action with the field convertor
+            and the action value as arguments. None when the field convertor has
+            no method for the action.
+    """
+
+    action: str
+    action_value: Any
+    copy_action_value: bool
+    target_field: Optional[str]
+    sets_field: bool
+    method: Optional[ActionMethod]
+
+
+class ActionPipeline(NamedTuple):
+    """
+    The compiled actions of a conversion rule.
+
+    Attributes:
+        field_name (str): Field of the record that is converted.
+        get_field_value (FieldGetter): Compiled getter for `field_name`.
+        steps (tuple[ActionStep, ...]): The actions in order.
+    """
+
+    field_name: str
+    get_field_value: FieldGetter
+    steps: tuple[ActionStep, ...]
+
+
+def _action_method(convertor_class: type, action: str) -> Optional[ActionMethod]:
+    """
+    Returns a function that runs the action on a field convertor of the given class.
+    Plain methods are called directly, other attributes (static methods etc.) are
+    looked up on the field convertor when the action is run.
+    """
+    attribute = getattr_static(convertor_class, action, None)
+    if attribute is None:
+        return None
+    if isinstance(attribute, FunctionType):
+        return attribute
+
+    def run_action(field_convertor: Any, action_value: Any) -> Any:
+        return getattr(field_convertor, action)(action_value)
+
+    return run_action
+
+
+def _compile_action_step(convertor_class: type, action_dict: dict) -> ActionStep:
+    # the optional target_field is not an action in itself
+    action_items = {
+        key: value
+        for key, value in action_dict.items()
+        if key != BaseConvertorKeys.ACTIONTARGET
+    }
+    [[action, action_value]] = action_items.items()
+    return ActionStep(
+        action=action,
+        action_value=action_value,
+        copy_action_value=isinstance(action_value, (dict, list, set)),
+        target_field=action_dict.get(BaseConvertorKeys.ACTIONTARGET),
+        sets_field=action not in ACTIONS_WITHOUT_RESULT,
+        method=_action_method(convertor_class, action),
+    )
+
+
+def compile_action_pipeline(
+    convertor_class: type, conversion_rule: BaseRuleDict
+) -> ActionPipeline:
+    """
+    Compiles the actions of a conversion rule for a field convertor class.
+
+    Args:
+        convertor_class (type): The field convertor class that runs the actions.
+        conversion_rule (BaseRuleDict): The conversion rule.
+
+    Returns:
+        ActionPipeline: The compiled actions.
+    """
+    field_name = conversion_rule[BaseConvertorKeys.FIELDNAME]
+    actions: Iterable = conversion_rule[BaseConvertorKeys.ACTIONS] or []
+    return ActionPipeline(
+        field_name=field_name,
+        get_field_value=compile_field_path(field_name, legacy_separator=True),
+        steps=tuple(
+            _compile_action_step(convertor_class, action_dict)
+            for action_dict in actions
+        ),
+    )
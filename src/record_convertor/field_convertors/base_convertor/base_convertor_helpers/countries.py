@@ -1,13 +1,77 @@
 """
 Helper module to provide meta data for country regions structure
 
+The country codes of `ALL_COUNTRY_CODES` are looked up through hash indexes that
+are built once, on first use.
+
+Classes:
+    CountryIndexes
+
 Methods:
+    country_indexes
     iso3116_from_alpha_3_country_code
+    alpha_3_from_iso3116_country_code
+    iso3116_from_country_name
+    alpha_3_from_country_name
+    country_name_from_iso3116_country_code
 """
 
+from collections import Counter
+from functools import cache
+from typing import NamedTuple
+
 from .data_files.country_codes import ALL_COUNTRY_CODES
 
-__all__ = ["iso3116_from_alpha_3_country_code"]
+__all__ = [
+    "CountryIndexes",
+    "country_indexes",
+    "iso3116_from_alpha_3_country_code",
+    "alpha_3_from_iso3116_country_code",
+    "iso3116_from_country_name",
+    "alpha_3_from_country_name",
+    "country_name_from_iso3116_country_code",
+]
+
+
+class CountryIndexes(NamedTuple):
+    """
+    Indexes of the country codes by upper case code and by normalised country name
+    (see `_name_key`). Names shared by more than one country are left out of the
+    name indexes.
+    """
+
+    iso3116_by_alpha_3: dict[str, str]
+    alpha_3_by_iso3116: dict[str, str]
+    name_by_iso3116: dict[str, str]
+    iso3116_by_name: dict[str, str]
+    alpha_3_by_name: dict[str, str]
+
+
+@cache
+def country_indexes() -> CountryIndexes:
+    """Returns the indexes of the country codes, building them on first use."""
+    # the data file has some codes with surrounding whitespace
+    countries = [
+        (country["name"].strip(), country["let2"].strip(), country["let3"].strip())
+        for country in ALL_COUNTRY_CODES
+    ]
+    name_keys = [_name_key(name) for name, _, _ in countries]
+    unique_names = {key for key, count in Counter(name_keys).items() if count == 1}
+    return CountryIndexes(
+        iso3116_by_alpha_3={let3: let2 for _, let2, let3 in countries},
+        alpha_3_by_iso3116={let2: let3 for _, let2, let3 in countries},
+        name_by_iso3116={let2: name for name, let2, _ in countries},
+        iso3116_by_name={
+            key: let2
+            for key, (_, let2, _) in zip(name_keys, countries)
+            if key in unique_names
+        },
+        alpha_3_by_name={
+            key: let3
+            for key, (_, _, let3) in zip(name_keys, countries)
+            if key in unique_names
+        },
+    )
 
 
 def iso3116_from_alpha_3_country_code(alpha_3: str) -> str:
@@ -19,11 +83,64 @@ def iso3116_from_alpha_3_country_code(alpha_3: str) -> str:
     Returns:
         str: iso3116 country code
     """
-    return next(
-        (
-            country["let2"]
-            for country in ALL_COUNTRY_CODES
-            if country["let3"] == alpha_3.upper()
-        ),
-        "",
-    )
+    return _code_lookup(country_indexes().iso3116_by_alpha_3, alpha_3)
+
+
+def alpha_3_from_iso3116_country_code(iso3116: str) -> str:
+    """Returns alpha3 country code from iso3116 country code
+
+    Args:
+        iso3116 (str): iso3116 country code
+
+    Returns:
+        str: alpha3 country code
+    """
+    return _code_lookup(country_indexes().alpha_3_by_iso3116, iso3116)
+
+
+def iso3116_from_country_name(name: str) -> str:
+    """Returns iso3116 country code from the (english) country name
+
+    Args:
+        name (str): country name, not case sensitive
+
+    Returns:
+        str: iso3116 country code
+    """
+    return country_indexes().iso3116_by_name.get(_name_key(name), "")
+
+
+def alpha_3_from_country_name(name: str) -> str:
+    """Returns alpha3 country code from the (english) country name
+
+    Args:
+        name (str): country name, not case sensitive
+
+    Returns:
+        str: alpha3 country code
+    """
+    return country_indexes().alpha_3_by_name.get(_name_key(name), "")
+
+
+def country_name_from_iso3116_country_code(iso3116: str) -> str:
+    """Returns the (english) country name from iso3116 country code
+
+    Args:
+        iso3116 (str): iso3116 country code
+
+    Returns:
+        str: country name
+    """
+    return _code_lookup(country_indexes().name_by_iso3116, iso3116)
+
+
+def _code_lookup(index: dict[str, str], code: str) -> str:
+    # codes are mostly provided in upper case already
+    result = index.get(code)
+    if result is None:
+        return index.get(code.upper(), "")
+    return result
+
+
+def _name_key(name: str) -> str:
+    return " ".join(name.split()).casefold()
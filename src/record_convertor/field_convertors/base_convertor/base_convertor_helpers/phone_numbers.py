@@ -0,0 +1,109 @@
+"""
+Helper module to find the country of a phone number.
+
+Parsing a phone number with `phonenumbers` is expensive, while the same phone
+numbers (store hotlines etc.) occur in many records. The country codes found are
+therefore kept in an LRU cache. Well-formed E.164 numbers ('+' followed by 8 to 15
+digits) are not parsed at all: their country calling code is looked up in the
+calling code table of `phonenumbers`, which gives the same result as parsing them.
+`phonenumbers` is only imported when the first phone number is looked up.
+
+Classes:
+    PhoneNumberCountryLookup
+
+Methods:
+    phone_number_country_lookup
+    country_code_from_phone_nr
+
+usage:
+>>> lookup = phone_number_country_lookup(maxsize=1024)
+>>> lookup("+31201234567")
+'NL'
+>>> lookup.cache_info()
+"""
+
+import re
+from functools import _CacheInfo, cache, lru_cache
+from typing import Any, Optional
+
+__all__ = [
+    "PhoneNumberCountryLookup",
+    "phone_number_country_lookup",
+    "country_code_from_phone_nr",
+]
+
+E164_NUMBER = re.compile(r"\+[1-9][0-9]{7,14}")
+# country calling codes have 1 to 3 digits and no code is a prefix of another code
+MAX_CALLING_CODE_LENGTH = 3
+
+
+def country_code_from_phone_nr(phone_nr: Any) -> Optional[str]:
+    """Returns the (iso3116) country code for a phone number
+
+    Args:
+        phone_nr (Any): phone number in international format
+
+    Returns:
+        Optional[str]: country code, None if the phone number can not be parsed
+    """
+    import phonenumbers
+
+    if isinstance(phone_nr, str) and E164_NUMBER.fullmatch(phone_nr):
+        country_code = _country_code_from_calling_code(phone_nr)
+        if country_code is not None:
+            return country_code
+
+    try:
+        phone_object = phonenumbers.parse(phone_nr)
+    except phonenumbers.phonenumberutil.NumberParseException:
+        return None
+
+    if phone_object and phone_object.country_code:
+        return phonenumbers.region_codes_for_country_code(phone_object.country_code)[0]
+    # ensure the field is empty if no country code can be found
+    return None
+
+
+def _country_code_from_calling_code(e164_number: str) -> Optional[str]:
+    from phonenumbers import COUNTRY_CODE_TO_REGION_CODE
+
+    for length in range(1, MAX_CALLING_CODE_LENGTH + 1):
+        region_codes = COUNTRY_CODE_TO_REGION_CODE.get(int(e164_number[1 : length + 1]))
+        if region_codes:
+            return region_codes[0]
+    return None
+
+
+class PhoneNumberCountryLookup:
+    """
+    Returns the country code of phone numbers, keeping the results for the most
+    recently used phone numbers in an LRU cache.
+
+    Args:
+        maxsize (Optional[int]): Number of phone numbers kept in the cache, None
+            for no limit.
+    """
+
+    __slots__ = ("_cached_lookup",)
+
+    def __init__(self, maxsize: Optional[int]):
+        self._cached_lookup = lru_cache(maxsize=maxsize)(country_code_from_phone_nr)
+
+    def __call__(self, phone_nr: Any) -> Optional[str]:
+        if isinstance(phone_nr, str):
+            return self._cached_lookup(phone_nr)
+        return country_code_from_phone_nr(phone_nr)
+
+    def cache_info(self) -> _CacheInfo:
+        """Returns the hits, misses, maximum size and current size of the cache."""
+        return self._cached_lookup.cache_info()
+
+    def cache_clear(self) -> None:
+        """Empties the cache and resets its statistics."""
+        self._cached_lookup.cache_clear()
+
+
+@cache
+def phone_number_country_lookup(maxsize: Optional[int]) -> PhoneNumberCountryLookup:
+    """Returns the (shared) phone number country lookup with the given cache size."""
+    return PhoneNumberCountryLookup(maxsize)
@@ -5,8 +5,6 @@ Methods
     - normalize_string
 """
 
-import unidecode
-
 __all__ = ["normalize_string"]
 
 
@@ -14,7 +12,10 @@ def normalize_string(accented_string):
     """
     remove special characters form string and make lower case
     """
+    # imported on first use to keep the import of the package fast
+    from unidecode import unidecode
+
     accented_string = accented_string.replace('"', "")
-    unaccented_string = unidecode.unidecode(accented_string)
+    unaccented_string = unidecode(accented_string)
     normalized_string = unaccented_string.lower().strip()
     return normalized_string
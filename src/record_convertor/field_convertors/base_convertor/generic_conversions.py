@@ -94,16 +94,37 @@ Availale conversion
         converts a alpha 3 country code to a iso3116 country code
             'actions': [{'alpha3_to_iso3116_cc': None}]}
 
+    - iso3116_to_alpha3_cc
+        converts a iso3116 country code to a alpha 3 country code
+            'actions': [{'iso3116_to_alpha3_cc': None}]}
+
+    - country_name_to_iso3116_cc
+        converts a (english) country name to a iso3116 country code
+            'actions': [{'country_name_to_iso3116_cc': None}]}
+
+    - country_name_to_alpha3_cc
+        converts a (english) country name to a alpha 3 country code
+            'actions': [{'country_name_to_alpha3_cc': None}]}
+
+    - iso3116_cc_to_country_name
+        converts a iso3116 country code to the (english) country name
+            'actions': [{'iso3116_cc_to_country_name': None}]}
+
     - divide_by
         divides a float or int by a given value
             'actions': [{'divide_by': 10}]}
 
 """
 
-import phonenumbers
+from typing import Optional
 
 from record_convertor.field_convertors.base_convertor.base_convertor_helpers import (
+    alpha_3_from_country_name,
+    alpha_3_from_iso3116_country_code,
+    country_name_from_iso3116_country_code,
     iso3116_from_alpha_3_country_code,
+    iso3116_from_country_name,
+    phone_number_country_lookup,
 )
 
 from .base_convertor_helpers import _BaseConvertorClass
@@ -131,22 +152,19 @@ class GenericConversions(_BaseConvertorClass):
             returns: record (dict) -> the converted record
     """
 
+    # number of phone numbers for which the country code is cached (None for no
+    # limit). Convertor classes with the same cache size share the cache.
+    PHONE_NUMBER_CACHE_SIZE: Optional[int] = 4096
+
     def get_country_code_from_phone_nr(self, action_value):
         phone_nr = self._get_field(action_value)
-        phone_object = None
         if phone_nr:
-            try:
-                phone_object = phonenumbers.parse(phone_nr)
-            except phonenumbers.phonenumberutil.NumberParseException:
-                return None
-
-            if phone_object and phone_object.country_code:
-                return phonenumbers.region_codes_for_country_code(
-                    phone_object.country_code
-                )[0]
-            else:
-                # ensure the field is empty if no country code can be found
-                return None
+            return phone_number_country_lookup(self.PHONE_NUMBER_CACHE_SIZE)(phone_nr)
+
+    @classmethod
+    def phone_number_cache_info(cls):
+        """Returns the hits, misses and size of the phone number cache."""
+        return phone_number_country_lookup(cls.PHONE_NUMBER_CACHE_SIZE).cache_info()
 
     def remove(self, action_value):
         """change remove a (nested) field"""
@@ -155,10 +173,29 @@ class GenericConversions(_BaseConvertorClass):
 
     def alpha3_to_iso3116_cc(self, action_value):
         """converts a alpha 3 country code to a iso3116 country code"""
+        return iso3116_from_alpha_3_country_code(self._str_field_value())
+
+    def iso3116_to_alpha3_cc(self, action_value):
+        """converts a iso3116 country code to a alpha 3 country code"""
+        return alpha_3_from_iso3116_country_code(self._str_field_value())
+
+    def country_name_to_iso3116_cc(self, action_value):
+        """converts a country name to a iso3116 country code"""
+        return iso3116_from_country_name(self._str_field_value())
+
+    def country_name_to_alpha3_cc(self, action_value):
+        """converts a country name to a alpha 3 country code"""
+        return alpha_3_from_country_name(self._str_field_value())
+
+    def iso3116_cc_to_country_name(self, action_value):
+        """converts a iso3116 country code to the country name"""
+        return country_name_from_iso3116_country_code(self._str_field_value())
+
+    def _str_field_value(self) -> str:
         field_value = self.field_value
         if not isinstance(field_value, str):
             raise TypeError(
                 f"filed_value is of type `{type(field_value)}` "
                 "but should be of type `str`"
             )
-        return iso3116_from_alpha_3_country_code(field_value)
+        return field_value
@@ -11,7 +11,9 @@ Generic format in the rules_dict:
 {
     'date_field': <name of date field that needs to be converted>,
     'conditions: {<condition name> : <condition value when needed>},
-    'format': <format name that is used in date_field>
+    'format': <format name that is used in date_field>,
+    'timezone': <optional IANA name of the timezone of the output>,
+    'output_format': <optional strftime pattern of the output, default %Y-%m-%d>
 }
 
 Availale date formats (from which to convert to YYYY-MM-DD)
@@ -20,24 +22,55 @@ Availale date formats (from which to convert to YYYY-MM-DD)
     - YYYY_MM_DD
     - YYYY_MM_DD:Time
     - UNIX_DT_STAMP
+    - UNIX_MS_STAMP (Unix time stamp in milliseconds)
+    - ISO_8601 (date or date time with optional UTC offset)
     - YYYY-MM-DD
-"""
+    - AUTO (any of the above, detected for every value, see `date_detection`)
+
+The date times of the UNIX_DT_STAMP, UNIX_MS_STAMP and ISO_8601 formats are converted
+to the `timezone` of the rule (Unix time stamps use the local timezone of the host
+when no timezone is given). The timezone does not apply to the other formats, which
+only hold a date.
 
-from datetime import datetime
-from typing import Dict, Literal
+The fixed-layout formats are parsed with the fast parsers of the `date_parsers`
+module (falling back to `strptime`) and the converted values are kept in a bounded
+LRU memo per conversion rule. Both can be configured per convertor class with
+`FAST_DATE_PARSING` and `DATE_CACHE_SIZE`.
+"""
 
-import jmespath
-from jmespath.exceptions import ParseError
+from copy import copy
+from datetime import datetime, tzinfo
+from functools import lru_cache, partial
+from inspect import getattr_static
+from typing import Callable, Dict, Literal, Optional
 
 from ..package_settings import (
     EvaluateConditions,
     FormatDateConvKeys,
     FormatDateRuleDict,
     FormatNotImplementedException,
+    TimezoneNotFoundException,
+    compiled_rule_cache,
+    get_field,
+    writable_child,
+)
+from .date_detection import AUTO_FORMAT, AutoDateFormatter
+from .date_parsers import (
+    DEFAULT_OUTPUT_FORMAT,
+    compile_output_format,
+    day_month_year_to_iso,
+    epoch_datetime,
+    iso_datetime,
+    timestamp_to_iso,
+    to_timezone,
+    year_month_day_to_iso,
+    zone_info,
 )
 
 __all__ = ["DateFieldConvertor"]
 
+DateFormatter = Callable[[str], str]
+
 
 DATE_METHOD_NAME = Literal[
     "day_month_year",
@@ -45,6 +78,8 @@ DATE_METHOD_NAME = Literal[
     "year_month_day",
     "year_month_day_time",
     "unix_dt_stamp",
+    "unix_ms_stamp",
+    "iso_8601",
     "year_month_date",
 ]
 
@@ -55,10 +90,32 @@ CONV_METHODS: Dict[str, DATE_METHOD_NAME] = {
     "YYYY_MM_DD": "year_month_day",
     "YYYY_MM_DD:Time": "year_month_day_time",
     "UNIX_DT_STAMP": "unix_dt_stamp",
+    "UNIX_MS_STAMP": "unix_ms_stamp",
+    "ISO_8601": "iso_8601",
     "YYYY-MM-DD": "year_month_date",
 }
 
 
+# fast parsers for the date formatter methods. A parser returns None when the
+# date formatter method has to be used instead.
+FAST_PARSERS: Dict[str, Callable[[str], Optional[str]]] = {
+    "day_month_year": lambda date_str: day_month_year_to_iso(date_str, "-"),
+    "day_month_year_dotted": lambda date_str: day_month_year_to_iso(date_str, "."),
+    "year_month_day": lambda date_str: year_month_day_to_iso(date_str, "_"),
+    "unix_dt_stamp": timestamp_to_iso,
+}
+
+# parsers into a datetime in a given timezone for the date formatter methods of
+# formats that hold a date time
+DATETIME_PARSERS: Dict[str, Callable[[str, Optional[tzinfo]], datetime]] = {
+    "unix_dt_stamp": lambda date_str, tz: epoch_datetime(date_str, False, tz),
+    "unix_ms_stamp": lambda date_str, tz: epoch_datetime(date_str, True, tz),
+    "iso_8601": lambda date_str, tz: to_timezone(iso_datetime(date_str), tz),
+}
+
+format_default_output = compile_output_format(DEFAULT_OUTPUT_FORMAT)
+
+
 class DateFieldConvertor:
     """
     A class dedicated to converting date fields within records according to specified
@@ -86,6 +143,8 @@ class DateFieldConvertor:
 
     Available Conversions:
     - unix_dt_stamp: Converts Unix timestamp (string) to 'YYYY-MM-DD'.
+    - unix_ms_stamp: Converts Unix timestamp in milliseconds to 'YYYY-MM-DD'.
+    - iso_8601: Converts an ISO-8601 date (time) to 'YYYY-MM-DD'.
     - year_month_date: Converts 'YYYY-MM-DD' to 'YYYY-MM-DD' (identity transformation).
     - year_month_day_time: Extracts 'YYYY-MM-DD' from 'YYYY-MM-DD:time'.
     - year_month_day: Converts 'YYYY_MM_DD' to 'YYYY-MM-DD'.
@@ -113,6 +172,13 @@ class DateFieldConvertor:
         Then, call the `convert_date` method to apply the conversion.
     """
 
+    # parse dates with the fast parsers for the date formatter methods that are not
+    # overridden by a subclass
+    FAST_DATE_PARSING: bool = True
+    # number of converted date values that are kept per conversion rule. 0 disables
+    # the memo, None keeps all values.
+    DATE_CACHE_SIZE: Optional[int] = 1024
+
     def format_date_field(
         self, record: dict, conversion_rule: FormatDateRuleDict
     ) -> dict:
@@ -127,25 +193,100 @@ class DateFieldConvertor:
                 The conversion rules specifying the fieldname, actions, and optional
                 conditions.
         """
+        date_formatter = self._date_formatter(conversion_rule)
+        # the conversion state is kept on a shallow copy of the convertor so that a
+        # single convertor can be used by multiple record conversions at once
+        return copy(self)._format_date_field(record, conversion_rule, date_formatter)
+
+    def _format_date_field(
+        self,
+        record: dict,
+        conversion_rule: FormatDateRuleDict,
+        date_formatter: DateFormatter,
+    ) -> dict:
         self._record = record
         self.date_field_key_name: str = self._get_date_field_key_name(conversion_rule)
-        date_formatter_method = self._get_date_formatter_method_name(conversion_rule)
         date_field_value = self._get_field()
 
         if date_field_value and self.all_conditions_true(
             date_field_value, conversion_rule
         ):
-            date_in_new_format = getattr(self, date_formatter_method)(date_field_value)
+            date_in_new_format = date_formatter(date_field_value)
             self.update_field_with_date(date_in_new_format)
 
         return self._record
 
+    def _date_formatter(self, conversion_rule: FormatDateRuleDict) -> DateFormatter:
+        """Returns the date formatter for the conversion rule, compiled once."""
+        return compiled_rule_cache(self).get(
+            conversion_rule, self._compile_date_formatter, variant="date_formatter"
+        )
+
+    def _compile_date_formatter(
+        self, conversion_rule: FormatDateRuleDict
+    ) -> DateFormatter:
+        date_formatter: DateFormatter
+        if conversion_rule[FormatDateConvKeys.FORMAT] == AUTO_FORMAT:
+            date_formatter = AutoDateFormatter(
+                partial(self._compile_detected_format, conversion_rule)
+            )
+        else:
+            date_formatter = self._compile_format(conversion_rule)
+
+        if self.DATE_CACHE_SIZE == 0:
+            return date_formatter
+        return lru_cache(maxsize=self.DATE_CACHE_SIZE)(date_formatter)
+
+    def _compile_detected_format(
+        self, conversion_rule: FormatDateRuleDict, date_format: str
+    ) -> DateFormatter:
+        """Returns the date formatter for a format detected by the AUTO format."""
+        detected_format_rule = conversion_rule.copy()
+        detected_format_rule[FormatDateConvKeys.FORMAT] = date_format
+        return self._compile_format(detected_format_rule)
+
+    def _compile_format(self, conversion_rule: FormatDateRuleDict) -> DateFormatter:
+        """Returns the date formatter for the format of the conversion rule."""
+        date_formatter_method_name = self._get_date_formatter_method_name(
+            conversion_rule
+        )
+        date_formatter: DateFormatter = getattr(self, date_formatter_method_name)
+        default_method = getattr_static(
+            type(self), date_formatter_method_name
+        ) is getattr_static(DateFieldConvertor, date_formatter_method_name)
+
+        timezone_name = conversion_rule.get(FormatDateConvKeys.TIMEZONE)
+        output_format = conversion_rule.get(FormatDateConvKeys.OUTPUT_FORMAT)
+        fast_parser = FAST_PARSERS.get(date_formatter_method_name)
+        if timezone_name or output_format:
+            date_formatter = _with_timezone_and_output_format(
+                DATETIME_PARSERS.get(date_formatter_method_name)
+                if default_method
+                else None,
+                date_formatter,
+                _timezone(timezone_name) if timezone_name else None,
+                output_format or DEFAULT_OUTPUT_FORMAT,
+            )
+        elif self.FAST_DATE_PARSING and fast_parser is not None and default_method:
+            date_formatter = _with_fast_parser(fast_parser, date_formatter)
+        return date_formatter
+
     @staticmethod
     def unix_dt_stamp(unix_dt_stamp: str) -> str:
         """convert Unix date time stamp to YYYY-MM-DD"""
         datetime_date = datetime.fromtimestamp(int(unix_dt_stamp))
         return datetime_date.strftime("%Y-%m-%d")
 
+    @staticmethod
+    def unix_ms_stamp(unix_ms_stamp: str) -> str:
+        """convert Unix date time stamp in milliseconds to YYYY-MM-DD"""
+        return format_default_output(epoch_datetime(unix_ms_stamp, milliseconds=True))
+
+    @staticmethod
+    def iso_8601(date_str: str) -> str:
+        """convert ISO-8601 date (time) to YYYY-MM-DD"""
+        return format_default_output(iso_datetime(date_str))
+
     @staticmethod
     def year_month_date(date_str: str) -> str:
         """convert YYYY-MM-DD to YYYY-MM-DD"""
@@ -182,9 +323,10 @@ class DateFieldConvertor:
         if not conditions:
             return True
 
-        return EvaluateConditions(
-            provided_conditions=conditions, value=date_field_value
-        ).evaluate()
+        conditions_apply = compiled_rule_cache(self).get(
+            conditions, EvaluateConditions.compile, variant="conditions"
+        )
+        return conditions_apply(date_field_value)
 
     def update_field_with_date(self, date_in_new_format: str) -> None:
         """
@@ -205,14 +347,16 @@ class DateFieldConvertor:
         last_field = nested_field_names.pop()
 
         # find the nested dict in whih the last_field is a (nested) key
-        field_value = self._record.get(first_field_name, None)
+        # nested dicts that are shared with the input record of a copy-on-write record
+        # are copied before they are updated
+        field_value = writable_child(self._record, self._record, first_field_name)
         if field_value is None:
             return None
 
         # with the list of nested field name we dig deeper into the
         # structure to get to the dict containing the last field name
         for field_name in nested_field_names:
-            field_value = field_value.get(field_name, {})
+            field_value = writable_child(self._record, field_value, field_name, {})
 
         # update that value of `last_field` in that dict
         if field_value is not None:
@@ -232,16 +376,7 @@ class DateFieldConvertor:
         if value is not found or can not be converted into a string an empty
         string is returned
         """
-        # key elemenets in nested keys are surround with "". For exmample
-        # key.example-1 becomes "key"."example-1".
-        # Needed for jmespath can hande special characters in the keys
-        nested_field_names = self.date_field_key_name.split(".")
-        nested_key = ".".join(['"' + name + '"' for name in nested_field_names])
-        try:
-            date_value_from_record = jmespath.search(nested_key, self._record)
-        except ParseError:
-            return ""
-
+        date_value_from_record = get_field(self._record, self.date_field_key_name)
         return str(date_value_from_record) if date_value_from_record else ""
 
     @staticmethod
@@ -255,3 +390,41 @@ class DateFieldConvertor:
             raise FormatNotImplementedException(format)
 
         return date_formatter_method_name
+
+
+def _with_fast_parser(
+    fast_parser: Callable[[str], Optional[str]], date_formatter: DateFormatter
+) -> DateFormatter:
+    def format_date(date_str: str) -> str:
+        return fast_parser(date_str) or date_formatter(date_str)
+
+    return format_date
+
+
+def _with_timezone_and_output_format(
+    datetime_parser: Optional[Callable[[str, Optional[tzinfo]], datetime]],
+    date_formatter: DateFormatter,
+    tz: Optional[tzinfo],
+    output_format: str,
+) -> DateFormatter:
+    format_output = compile_output_format(output_format)
+    if datetime_parser is None:
+        # formats with only a date are converted to YYYY-MM-DD first
+
+        def format_date(date_str: str) -> str:
+            return format_output(datetime.fromisoformat(date_formatter(date_str)))
+
+        return format_date
+
+    def format_date_time(date_str: str) -> str:
+        return format_output(datetime_parser(date_str, tz))
+
+    return format_date_time
+
+
+def _timezone(timezone_name: str) -> tzinfo:
+    try:
+        return zone_info(timezone_name)
+    except (KeyError, ValueError):
+        # ZoneInfoNotFoundError is a KeyError
+        raise TimezoneNotFoundException(timezone_name) from None
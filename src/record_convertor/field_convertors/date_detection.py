@@ -0,0 +1,120 @@
+"""
+Module to detect the format of a date value for the `AUTO` date format.
+
+The format of a date is detected from its shape: the date with every digit replaced
+by `9` (so '21-02-2021' has the shape '99-99-9999'). Computing the shape is a single
+`str.translate` call, and for a given shape there is at most one supported format.
+
+An `AutoDateFormatter` converts the values of a single date field. It remembers the
+shape and format of the last value it converted and tries that format first, as
+values of the same field mostly have the same format.
+
+Classes:
+    - AutoDateFormatter
+
+Functions:
+    - date_shape: Returns the shape of a date value.
+    - detect_date_format: Returns the format of a date value.
+
+usage:
+>>> detect_date_format("21-02-2021")
+'DD-MM-YYYY'
+"""
+
+from typing import Callable, Optional
+
+from ..package_settings import DateFormatNotDetectedException
+
+__all__ = ["AutoDateFormatter", "date_shape", "detect_date_format"]
+
+DateFormatter = Callable[[str], str]
+
+AUTO_FORMAT = "AUTO"
+
+SHAPE_TABLE = str.maketrans("0123456789", "9999999999")
+
+# formats by the complete shape of the value
+FORMATS_BY_SHAPE = {
+    "99-99-9999": "DD-MM-YYYY",
+    "99.99.9999": "DD.MM.YYYY",
+    "9999_99_99": "YYYY_MM_DD",
+    "9999-99-99": "YYYY-MM-DD",
+}
+
+# formats by the start of the shape of the value, for values with a time
+FORMATS_BY_SHAPE_START = {
+    "9999_99_99:": "YYYY_MM_DD:Time",
+    "9999-99-99T": "ISO_8601",
+    "9999-99-99 ": "ISO_8601",
+}
+SHAPE_START_LENGTH = 11
+
+# formats of values with digits only, by number of digits
+FORMATS_BY_NUMBER_OF_DIGITS = {
+    9: "UNIX_DT_STAMP",
+    10: "UNIX_DT_STAMP",
+    12: "UNIX_MS_STAMP",
+    13: "UNIX_MS_STAMP",
+}
+
+
+def date_shape(date_str: str) -> str:
+    """Returns the date with every (ASCII) digit replaced by `9`."""
+    return date_str.translate(SHAPE_TABLE)
+
+
+def detect_date_format(date_str: str) -> Optional[str]:
+    """
+    Returns the date format of a date value, or None if the format is not detected.
+
+    Args:
+        date_str (str): The date value.
+
+    Returns:
+        Optional[str]: One of the format names of the DateFieldConvertor.
+    """
+    return _format_for_shape(date_shape(date_str))
+
+
+def _format_for_shape(shape: str) -> Optional[str]:
+    if date_format := FORMATS_BY_SHAPE.get(shape):
+        return date_format
+    if date_format := FORMATS_BY_SHAPE_START.get(shape[:SHAPE_START_LENGTH]):
+        return date_format
+    if shape and shape == "9" * len(shape):
+        return FORMATS_BY_NUMBER_OF_DIGITS.get(len(shape))
+    return None
+
+
+class AutoDateFormatter:
+    """
+    Converts the values of a date field with the format detected for every value.
+
+    Args:
+        formatter_for (Callable): Returns the date formatter for a format name.
+    """
+
+    __slots__ = ("_formatter_for", "_formatters", "_last")
+
+    def __init__(self, formatter_for: Callable[[str], DateFormatter]):
+        self._formatter_for = formatter_for
+        self._formatters: dict[str, DateFormatter] = {}
+        # shape and formatter of the last converted value, stored as a single tuple
+        # so concurrent conversions always see a matching pair
+        self._last: tuple[Optional[str], Optional[DateFormatter]] = (None, None)
+
+    def __call__(self, date_str: str) -> str:
+        shape = date_shape(date_str)
+        last_shape, last_formatter = self._last
+        if shape == last_shape and last_formatter is not None:
+            return last_formatter(date_str)
+
+        date_format = _format_for_shape(shape)
+        if date_format is None:
+            raise DateFormatNotDetectedException(date_str)
+        formatter = self._formatters.get(date_format)
+        if formatter is None:
+            formatter = self._formatters[date_format] = self._formatter_for(date_format)
+        date_in_new_format = formatter(date_str)
+        self._last = (shape, formatter)
+        return date_in_new_format
@@ -0,0 +1,238 @@
+"""
+Module with fast parsers and formatters for the date formats of the
+DateFieldConvertor.
+
+`datetime.strptime` has to interpret its format string for every call. The date
+formats supported by the DateFieldConvertor have a fixed layout, so a date in one of
+these formats can be converted by slicing the string and checking the parts.
+
+The parsers return None for any string that is not a valid date in the exact layout
+(a day or month of a single digit, a year before 1000, non-ASCII digits etc.). The
+DateFieldConvertor then falls back to `strptime`, which gives the same result or
+error as before for these strings.
+
+The ISO-8601 and epoch formats are parsed into datetimes, which are formatted with
+an output formatter compiled once per output pattern. Timezones are looked up once
+per name.
+
+Functions:
+    - day_month_year_to_iso: Converts 'DD<sep>MM<sep>YYYY' to 'YYYY-MM-DD'.
+    - year_month_day_to_iso: Converts 'YYYY<sep>MM<sep>DD' to 'YYYY-MM-DD'.
+    - timestamp_to_iso: Converts a Unix timestamp to a local 'YYYY-MM-DD' date.
+    - iso_datetime: Parses an ISO-8601 date or date time.
+    - epoch_datetime: Parses a Unix timestamp in seconds or milliseconds.
+    - to_timezone: Converts a timezone aware datetime to another timezone.
+    - zone_info: Returns the (cached) timezone for a timezone name.
+    - compile_output_format: Compiles a strftime pattern into a formatter.
+
+usage:
+>>> day_month_year_to_iso("21-02-2021", "-")
+'2021-02-21'
+"""
+
+import re
+from datetime import date, datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+__all__ = [
+    "DEFAULT_OUTPUT_FORMAT",
+    "day_month_year_to_iso",
+    "year_month_day_to_iso",
+    "timestamp_to_iso",
+    "iso_datetime",
+    "epoch_datetime",
+    "to_timezone",
+    "zone_info",
+    "compile_output_format",
+]
+
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+DEFAULT_OUTPUT_FORMAT = "%Y-%m-%d"
+
+# strftime directives that the compiled output formatters write out themselves
+OUTPUT_DIRECTIVES = {
+    "%Y": "{0.year:04d}",
+    "%m": "{0.month:02d}",
+    "%d": "{0.day:02d}",
+    "%H": "{0.hour:02d}",
+    "%M": "{0.minute:02d}",
+    "%S": "{0.second:02d}",
+    "%%": "%",
+}
+
+
+def day_month_year_to_iso(date_str: str, separator: str) -> Optional[str]:
+    """
+    Converts a 'DD<separator>MM<separator>YYYY' date to 'YYYY-MM-DD'.
+
+    Args:
+        date_str (str): The date.
+        separator (str): The single character between day, month and year.
+
+    Returns:
+        Optional[str]: The date as 'YYYY-MM-DD', or None if `date_str` is not a valid
+            date in this exact layout.
+    """
+    if len(date_str) != 10 or date_str[2] != separator or date_str[5] != separator:
+        return None
+    return _iso_date(date_str[6:], date_str[3:5], date_str[:2])
+
+
+def year_month_day_to_iso(date_str: str, separator: str) -> Optional[str]:
+    """
+    Converts a 'YYYY<separator>MM<separator>DD' date to 'YYYY-MM-DD'.
+
+    Args:
+        date_str (str): The date.
+        separator (str): The single character between year, month and day.
+
+    Returns:
+        Optional[str]: The date as 'YYYY-MM-DD', or None if `date_str` is not a valid
+            date in this exact layout.
+    """
+    if len(date_str) != 10 or date_str[4] != separator or date_str[7] != separator:
+        return None
+    return _iso_date(date_str[:4], date_str[5:7], date_str[8:])
+
+
+def timestamp_to_iso(timestamp: str) -> Optional[str]:
+    """
+    Converts a Unix timestamp to the 'YYYY-MM-DD' date in the local timezone.
+
+    Args:
+        timestamp (str): The timestamp in seconds.
+
+    Returns:
+        Optional[str]: The date as 'YYYY-MM-DD', or None for dates before the year
+            1000 (which `strftime` does not pad to four digits).
+
+    Raises:
+        ValueError, OverflowError, OSError: As `datetime.fromtimestamp` does.
+    """
+    local_date = date.fromtimestamp(int(timestamp))
+    if local_date.year < 1000:
+        return None
+    return local_date.isoformat()
+
+
+def iso_datetime(date_str: str) -> datetime:
+    """
+    Parses an ISO-8601 date or date time, with an optional UTC offset, as supported
+    by `datetime.fromisoformat`. A trailing `Z` is read as UTC.
+
+    Raises:
+        ValueError: If `date_str` is not an ISO-8601 date (time).
+    """
+    if date_str[-1:] in ("Z", "z"):
+        # not supported by `fromisoformat` before python 3.11
+        date_str = date_str[:-1] + "+00:00"
+    return datetime.fromisoformat(date_str)
+
+
+def epoch_datetime(
+    timestamp: str, milliseconds: bool = False, tz: Optional[tzinfo] = None
+) -> datetime:
+    """
+    Parses a Unix timestamp into a datetime in the timezone `tz`.
+
+    Args:
+        timestamp (str): The timestamp.
+        milliseconds (bool): The timestamp is in milliseconds instead of seconds.
+        tz (tzinfo, optional): The timezone of the datetime. The local timezone of
+            the host is used when not provided.
+
+    Returns:
+        datetime: The datetime, naive when no timezone is provided.
+    """
+    seconds = int(timestamp)
+    if not milliseconds:
+        return datetime.fromtimestamp(seconds, tz)
+    seconds, remaining_milliseconds = divmod(seconds, 1000)
+    return datetime.fromtimestamp(seconds, tz).replace(
+        microsecond=remaining_milliseconds * 1000
+    )
+
+
+def to_timezone(date_time: datetime, tz: Optional[tzinfo]) -> datetime:
+    """
+    Converts a timezone aware datetime to the timezone `tz`. A naive datetime is
+    taken to be in `tz` already and is returned as is.
+    """
+    if tz is None or date_time.tzinfo is None:
+        return date_time
+    return date_time.astimezone(tz)
+
+
+@lru_cache(maxsize=None)
+def zone_info(name: str) -> tzinfo:
+    """
+    Returns the timezone for an IANA timezone name (for example 'Europe/Amsterdam').
+
+    Raises:
+        zoneinfo.ZoneInfoNotFoundError, ValueError: For unknown timezone names.
+    """
+    if name.upper() == "UTC":
+        return timezone.utc
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=None)
+def compile_output_format(pattern: str) -> Callable[[datetime], str]:
+    """
+    Compiles a strftime pattern into a function that formats a datetime. Patterns
+    with only the %Y, %m, %d, %H, %M and %S directives are formatted without
+    `strftime`.
+
+    Args:
+        pattern (str): The strftime pattern.
+
+    Returns:
+        Callable: Function that takes a datetime and returns the formatted string.
+    """
+    parts = [part for part in re.split("(%.)", pattern) if part]
+    if any(
+        part not in OUTPUT_DIRECTIVES if part[0] == "%" else "%" in part
+        for part in parts
+    ):
+
+        def strftime(date_time: datetime) -> str:
+            return date_time.strftime(pattern)
+
+        return strftime
+
+    template = "".join(
+        OUTPUT_DIRECTIVES[part]
+        if part[0] == "%"
+        else part.replace("{", "{{").replace("}", "}}")
+        for part in parts
+    )
+
+    def format_date_time(date_time: datetime) -> str:
+        if date_time.year < 1000:
+            # strftime does not pad years before 1000 on all platforms
+            return date_time.strftime(pattern)
+        return template.format(date_time)
+
+    return format_date_time
+
+
+def _iso_date(year: str, month: str, day: str) -> Optional[str]:
+    digits = year + month + day
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    year_number, month_number, day_number = int(year), int(month), int(day)
+    if year_number < 1000 or not 1 <= month_number <= 12:
+        return None
+    days_in_month = DAYS_IN_MONTH[month_number - 1]
+    if month_number == 2 and _is_leap_year(year_number):
+        days_in_month = 29
+    if not 1 <= day_number <= days_in_month:
+        return None
+    return f"{year}-{month}-{day}"
+
+
+def _is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
@@ -1,4 +1,5 @@
 from .conditions import *  # NOQA
+from .conversion_context import *  # NOQA
 from .exceptions import *  # NOQA
 from .helpers import *  # NOQA
 from .package_types import *  # NOQA
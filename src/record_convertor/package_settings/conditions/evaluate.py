@@ -1,15 +1,26 @@
 """Module to define Conditions class.
 
+Conditions are evaluated for every record, so next to evaluating conditions with an
+`EvaluateConditions` instance, a set of conditions can be compiled once into a
+predicate function (`EvaluateConditions.compile`) that is called with the value.
+
 Classes:
     - EvaluateConditions
 """
 
 from datetime import datetime
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from .condition_settings import ConditionsDict, ConditionValue
 
-__all__ = ["EvaluateConditions", "ConditionsDict", "ConditionValue"]
+__all__ = [
+    "EvaluateConditions",
+    "ConditionsDict",
+    "ConditionValue",
+    "ConditionPredicate",
+]
+
+ConditionPredicate = Callable[[Any], bool]
 
 
 class EvaluateConditions:
@@ -35,6 +46,9 @@ class EvaluateConditions:
         evaluate() -> bool:
             Evaluates all provided conditions against the value and returns True
             if all conditions are met, otherwise False.
+        compile(provided_conditions) -> ConditionPredicate:
+            Class method that compiles the conditions into a function that returns
+            the result of `evaluate()` for the value it is called with.
 
     Supported Conditions:
         - is_a_string:
@@ -104,15 +118,36 @@ class EvaluateConditions:
         all_conditions_are_true = True
 
         for condition in self.provided_conditions:
-            if condition in dir(self):
-                all_conditions_are_true = (
-                    all_conditions_are_true and getattr(self, condition)()
-                )
-            else:
+            condition_method = getattr(self, condition, None)
+            if condition_method is None:
                 raise NotImplementedError(f"Condition {condition}")
+            all_conditions_are_true = all_conditions_are_true and condition_method()
 
         return all_conditions_are_true
 
+    @classmethod
+    def compile(
+        cls, provided_conditions: Optional[ConditionsDict] = None
+    ) -> ConditionPredicate:
+        """
+        Compiles the conditions into a predicate function.
+
+        Args:
+            provided_conditions (Optional[ConditionsDict]): The conditions.
+
+        Returns:
+            ConditionPredicate: Function that takes the value and returns the same
+                result as `evaluate()`.
+        """
+        if cls is not EvaluateConditions:
+            # subclasses can change how conditions are evaluated
+            def evaluate(value: Any) -> bool:
+                return cls(provided_conditions, value).evaluate()
+
+            return evaluate
+
+        return _compile_conditions(provided_conditions)
+
     def date_not_today(self) -> bool:
         return not (datetime.today().strftime("%Y-%m-%d") == self.value)
 
@@ -172,3 +207,149 @@ class EvaluateConditions:
             return False
 
         return self.provided_conditions["does_not_contain"] not in self.value
+
+
+##########################################################
+# predicates for the conditions supported by this module #
+##########################################################
+
+
+def _always_true(value: Any) -> bool:
+    return True
+
+
+def _is_a_string(argument: Any) -> ConditionPredicate:
+    return lambda value: isinstance(value, str)
+
+
+def _is_not_a_string(argument: Any) -> ConditionPredicate:
+    return lambda value: not isinstance(value, str)
+
+
+def _date_not_today(argument: Any) -> ConditionPredicate:
+    return lambda value: datetime.today().strftime("%Y-%m-%d") != value
+
+
+def _str_length(argument: Any) -> ConditionPredicate:
+    return lambda value: len(str(value)) == argument
+
+
+def _field_does_not_exist(argument: Any) -> ConditionPredicate:
+    return lambda value: value is None
+
+
+def _field_does_exist(argument: Any) -> ConditionPredicate:
+    return lambda value: value is not None
+
+
+def _is_null(argument: Any) -> ConditionPredicate:
+    return lambda value: (value is None) == argument
+
+
+def _equals(argument: Any) -> ConditionPredicate:
+    return lambda value: value == argument
+
+
+def _does_not_equal(argument: Any) -> ConditionPredicate:
+    return lambda value: value != argument
+
+
+def _membership(argument: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Returns a function that checks if a value is in the list `argument`. A frozenset
+    is used when possible, with a fallback to the list for unhashable values.
+    """
+    if not isinstance(argument, list):
+        return None
+    try:
+        members = frozenset(argument)
+    except TypeError:
+        return lambda value: value in argument
+
+    def is_member(value: Any) -> bool:
+        try:
+            return value in members
+        except TypeError:
+            return value in argument
+
+    return is_member
+
+
+def _in_list(argument: Any) -> ConditionPredicate:
+    is_member = _membership(argument)
+    if is_member is None:
+        return lambda value: False
+    return is_member
+
+
+def _not_in_list(argument: Any) -> ConditionPredicate:
+    is_member = _membership(argument)
+    if is_member is None:
+        return lambda value: False
+    return lambda value: not is_member(value)
+
+
+def _contains(argument: Any) -> ConditionPredicate:
+    if argument is None:
+
+        def raise_value_error(value: Any) -> bool:
+            raise ValueError("Condition 'contains' can not have None as input value.")
+
+        return raise_value_error
+    return lambda value: isinstance(value, (list, str)) and argument in value
+
+
+def _does_not_contain(argument: Any) -> ConditionPredicate:
+    if argument is None:
+
+        def raise_value_error(value: Any) -> bool:
+            raise ValueError(
+                "Condition 'does_not_contain' can not have None as input value."
+            )
+
+        return raise_value_error
+    return lambda value: isinstance(value, (list, str)) and argument not in value
+
+
+_CONDITION_PREDICATES: dict[str, Callable[[Any], ConditionPredicate]] = {
+    "date_not_today": _date_not_today,
+    "is_not_a_string": _is_not_a_string,
+    "is_a_string": _is_a_string,
+    "str_length": _str_length,
+    "field_does_not_exist": _field_does_not_exist,
+    "field_does_exist": _field_does_exist,
+    "is_null": _is_null,
+    "equals": _equals,
+    "in_list": _in_list,
+    "not_in_list": _not_in_list,
+    "does_not_equal": _does_not_equal,
+    "contains": _contains,
+    "does_not_contain": _does_not_contain,
+}
+
+
+def _compile_conditions(
+    provided_conditions: Optional[ConditionsDict],
+) -> ConditionPredicate:
+    """Compiles the conditions supported by `EvaluateConditions` into a predicate."""
+    conditions: dict = dict(provided_conditions or {})
+    unknown_conditions = [
+        condition for condition in conditions if condition not in _CONDITION_PREDICATES
+    ]
+    if unknown_conditions:
+        # evaluating always fails on the first unknown condition
+
+        def raise_not_implemented(value: Any) -> bool:
+            return EvaluateConditions(provided_conditions, value).evaluate()
+
+        return raise_not_implemented
+
+    predicates = tuple(
+        _CONDITION_PREDICATES[condition](argument)
+        for condition, argument in conditions.items()
+    )
+    if not predicates:
+        return _always_true
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda value: all(predicate(value) for predicate in predicates)
@@ -0,0 +1,36 @@
+"""
+Module to define the per call state of a record conversion.
+
+A record convertor (and the field convertors, date formatters, commands and dataclass
+processor it uses) only holds configuration: the compiled rules and the classes to
+use. Everything that belongs to the conversion of a single record is kept in a
+`ConversionContext` that is created for every conversion and passed along
+explicitly. This allows a single record convertor to convert records in multiple
+threads at the same time.
+
+Classes:
+    - ConversionContext
+"""
+
+from typing import Any, Optional
+
+__all__ = ["ConversionContext"]
+
+
+class ConversionContext:
+    """
+    Holds the state of the conversion of a single record.
+
+    Attributes:
+        record (dict): The input record as it is updated by the conversion rules
+            that change the input record (`$convert` and `$format_date` rules).
+        fields (dict, optional): The values of the field paths read by the rules, as
+            extracted from the record by the path trie of the plan (see
+            `PathTrie`). None until the values are extracted.
+    """
+
+    __slots__ = ("record", "fields")
+
+    def __init__(self, record: Any, fields: Optional[dict[str, Any]] = None):
+        self.record = record
+        self.fields = fields
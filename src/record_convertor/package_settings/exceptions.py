@@ -27,6 +27,16 @@ class FormatNotImplementedException(Exception):
         super().__init__(f"Requested format {format} not implememted.")
 
 
+class TimezoneNotFoundException(Exception):
+    def __init__(self, timezone: str):
+        super().__init__(f"Requested timezone {timezone} not found.")
+
+
+class DateFormatNotDetectedException(Exception):
+    def __init__(self, date_value: str):
+        super().__init__(f"Format of date {date_value} could not be detected.")
+
+
 class NoDateFieldException(Exception):
     def __init__(self):
         super().__init__("No input for dateformat provided in the ruleset.")
@@ -1,2 +1,6 @@
+from .compiled_rule_cache import *  # NOQA
+from .copy_on_write import *  # NOQA
 from .dict_helper import *  # NOQA
+from .field_path import *  # NOQA
+from .path_trie import *  # NOQA
 from .str_helper import *  # NOQA
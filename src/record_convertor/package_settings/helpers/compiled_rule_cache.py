@@ -0,0 +1,96 @@
+"""
+This module provides a cache for objects compiled from (parts of) a rule set.
+
+Rules are dicts that are created once and used for every record. Whatever is compiled
+from a rule (an action pipeline, a condition predicate) can therefore be stored by the
+identity of the rule dict, which is much cheaper than hashing its content. The cache
+holds the most recently used `MAX_COMPILED_RULES` rules, so callers that create a
+new rule dict for every call do not grow it without limit.
+
+Classes:
+    - CompiledRuleCache
+
+Functions:
+    - compiled_rule_cache:
+        Returns the cache of an object that compiles rules, creating it on first use.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+__all__ = ["CompiledRuleCache", "compiled_rule_cache", "MAX_COMPILED_RULES"]
+
+CACHE_ATTRIBUTE = "_compiled_rule_cache"
+
+# default number of compiled rules kept by a cache
+MAX_COMPILED_RULES = 1024
+
+T = TypeVar("T")
+
+
+class CompiledRuleCache:
+    """
+    Stores objects compiled from rules by the identity of the rule. The least
+    recently used rules are removed when the cache is full.
+
+    The rule is stored together with the compiled object, so the id of a rule can not
+    be reused by another object while its compiled object is in the cache.
+
+    Args:
+        max_size (int): maximum number of compiled objects in the cache.
+    """
+
+    __slots__ = ("_compiled", "max_size")
+
+    def __init__(self, max_size: int = MAX_COMPILED_RULES) -> None:
+        self.max_size = max_size
+        self._compiled: OrderedDict[tuple[int, Hashable], tuple[Any, Any]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def get(
+        self, rule: Any, compile_rule: Callable[[Any], T], variant: Hashable = None
+    ) -> T:
+        """
+        Returns the object compiled from the rule, compiling it on first use.
+
+        Args:
+            rule (Any): The rule (usually a dict from the rule set).
+            compile_rule (Callable): Compiles the rule.
+            variant (Hashable): Distinguishes different objects compiled from the
+                same rule.
+
+        Returns:
+            The compiled object.
+        """
+        key = (id(rule), variant)
+        stored = self._compiled.get(key)
+        if stored is not None and stored[0] is rule:
+            try:
+                self._compiled.move_to_end(key)
+            except KeyError:
+                # removed by a conversion in another thread
+                pass
+            return stored[1]
+        compiled = compile_rule(rule)
+        self._compiled[key] = (rule, compiled)
+        while len(self._compiled) > self.max_size:
+            try:
+                self._compiled.popitem(last=False)
+            except KeyError:
+                break
+        return compiled
+
+
+def compiled_rule_cache(instance: Any) -> CompiledRuleCache:
+    """
+    Returns the compiled rule cache of an instance (for example a field convertor),
+    creating it on first use. Shallow copies of the instance share the cache.
+    """
+    try:
+        return instance.__dict__[CACHE_ATTRIBUTE]
+    except KeyError:
+        return instance.__dict__.setdefault(CACHE_ATTRIBUTE, CompiledRuleCache())
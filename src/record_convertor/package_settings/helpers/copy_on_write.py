@@ -0,0 +1,96 @@
+"""
+This module provides a copy-on-write version of an input record.
+
+`$convert` and `$format_date` rules write their results into the input record. To
+leave the record of the caller untouched the record convertor can convert a
+`CopyOnWriteRecord` instead: a shallow copy of the input record. The nested dicts of
+the input record are shared with the copy until a conversion writes to them. Only then
+the nested dicts on the path to the field that is written are copied.
+
+Writes to nested dicts should go through `writable_child` to get this behaviour.
+For a plain dict `writable_child` returns the nested dict itself, so conversions on
+plain dicts still update the record in place.
+
+Classes:
+    - CopyOnWriteRecord
+
+Functions:
+    - writable_child:
+        Returns a nested value of a record in which a conversion can write.
+    - plain_record:
+        Returns a copy-on-write record as a plain dict.
+
+usage:
+>>> record = CopyOnWriteRecord(input_record)
+>>> writable_child(record, record, "key")["nested_key"] = "value"
+"""
+
+from typing import Any
+
+__all__ = ["CopyOnWriteRecord", "writable_child", "plain_record"]
+
+_MISSING = object()
+
+
+class CopyOnWriteRecord(dict):
+    """
+    Shallow copy of an input record that copies the nested dicts of the input record
+    when they are written to.
+
+    Args:
+        record (dict): The input record. It is never changed.
+    """
+
+    __slots__ = ("_copies",)
+
+    def __init__(self, record: dict):
+        super().__init__(record)
+        # the nested dicts copied so far by id. Holding on to the copies ensures their
+        # id can not be reused while the record is converted.
+        self._copies: dict[int, dict] = {}
+
+    def writable_child(self, parent: dict, key: str, value: dict) -> dict:
+        """
+        Returns the nested dict `value` (found under `key` in `parent`) such that it
+        can be written to. A nested dict that is still shared with the input record
+        is replaced in `parent` by a copy.
+        """
+        if id(value) in self._copies:
+            return value
+        value_copy = value.copy()
+        self._copies[id(value_copy)] = value_copy
+        parent[key] = value_copy
+        return value_copy
+
+
+def writable_child(record: dict, parent: dict, key: str, default: Any = None) -> Any:
+    """
+    Returns the value of `key` in `parent`, a (nested) dict of `record`, so that it
+    can be written to.
+
+    Args:
+        record (dict): The record that is converted.
+        parent (dict): The record itself or a writable nested dict of the record.
+        key (str): Key of the value in `parent`.
+        default (Any): Returned when `key` is not in `parent`.
+
+    Returns:
+        Any: The value. For a `CopyOnWriteRecord` a nested dict is replaced by a copy
+             first if it is shared with the input record.
+    """
+    value = parent.get(key, _MISSING)
+    if value is _MISSING:
+        return default
+    if isinstance(record, CopyOnWriteRecord) and isinstance(value, dict):
+        return record.writable_child(parent, key, value)
+    return value
+
+
+def plain_record(value: Any) -> Any:
+    """
+    Returns a `CopyOnWriteRecord` as a plain dict, so that it does not leave the
+    conversion. Any other value is returned as is.
+    """
+    if isinstance(value, CopyOnWriteRecord):
+        return dict(value)
+    return value
@@ -0,0 +1,134 @@
+"""
+This module provides the accessor used to retrieve values from (nested) fields in a
+record with a dotted field path, for example `item.brand.name`.
+
+Each field path is compiled once into a getter function. Paths that consist of plain
+keys are compiled into a function that walks the nested dicts directly. Only paths
+with characters that need escaping fall back to a precompiled jmespath expression in
+which every key is quoted. Both give the same result as searching the quoted jmespath
+expression: the value of the field, or None if the field can not be found.
+
+Compiled getters are cached by field path, so all users of this module share them.
+The cache holds the most recently used `FIELD_PATH_CACHE_SIZE` field paths.
+
+Functions:
+    - compile_field_path:
+        Returns the (cached) getter function for a field path.
+    - get_field:
+        Returns the value for a field path from a record.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import jmespath
+from jmespath.exceptions import ParseError
+
+__all__ = ["FieldGetter", "compile_field_path", "get_field"]
+
+FieldGetter = Callable[[Any], Any]
+
+# initially '__' was used as key seperator but the package migrated to using `.` as
+# seperator. Field paths can be compiled with `legacy_separator` to allow old
+# conversion yaml files not to fail.
+LEGACY_SEPARATOR = "__"
+SEPARATOR = "."
+
+# number of compiled field paths kept in the cache
+FIELD_PATH_CACHE_SIZE = 4096
+
+
+def _no_field(record: Any) -> None:
+    return None
+
+
+def _needs_jmespath(keys: list[str]) -> bool:
+    """
+    Returns True if a key contains characters that have a meaning within a quoted
+    jmespath identifier (quotes, escapes and control characters).
+    """
+    return any(char in ('"', "\\") or char < " " for key in keys for char in key)
+
+
+def _jmespath_getter(keys: list[str]) -> FieldGetter:
+    # key elements in nested keys are surrounded with "". For example
+    # key.example-1 becomes "key"."example-1".
+    nested_key = SEPARATOR.join(['"' + key + '"' for key in keys])
+    try:
+        return jmespath.compile(nested_key).search
+    except ParseError:
+        return _no_field
+
+
+def _single_key_getter(key: str) -> FieldGetter:
+    def get_field(record: Any) -> Any:
+        try:
+            return record.get(key)
+        except AttributeError:
+            return None
+
+    return get_field
+
+
+def _nested_keys_getter(keys: tuple[str, ...]) -> FieldGetter:
+    def get_field(record: Any) -> Any:
+        value = record
+        try:
+            for key in keys:
+                value = value.get(key)
+        except AttributeError:
+            # value is not a dict (or is None) so the nested field does not exist
+            return None
+        return value
+
+    return get_field
+
+
+@lru_cache(maxsize=FIELD_PATH_CACHE_SIZE)
+def compile_field_path(field_path: str, legacy_separator: bool = False) -> FieldGetter:
+    """
+    Compiles a dotted field path into a function that returns the value for that
+    field path from a record.
+
+    Args:
+        field_path (str): (nested) field name, for example `item.brand.name`.
+        legacy_separator (bool): also accept `__` as seperator between keys.
+
+    Returns:
+        FieldGetter: function that takes a record and returns the field value or None
+                     if the field does not exist.
+    """
+    if not field_path:
+        return _no_field
+
+    if legacy_separator:
+        field_path = field_path.replace(LEGACY_SEPARATOR, SEPARATOR)
+
+    keys = field_path.split(SEPARATOR)
+    if _needs_jmespath(keys):
+        return _jmespath_getter(keys)
+
+    if len(keys) == 1:
+        return _single_key_getter(keys[0])
+
+    return _nested_keys_getter(tuple(keys))
+
+
+def get_field(
+    record: Any, field_path: Optional[str], legacy_separator: bool = False
+) -> Any:
+    """
+    Returns the value from a (nested) field in the record.
+
+    Args:
+        record (Any): record (usually a dict) to retrieve the value from.
+        field_path (str, optional): dotted (nested) field name.
+        legacy_separator (bool): also accept `__` as seperator between keys.
+
+    Returns:
+        Any: the field value or None if the field does not exist or no field path is
+             provided.
+    """
+    if not field_path:
+        return None
+    return compile_field_path(field_path, legacy_separator)(record)
@@ -0,0 +1,109 @@
+"""
+This module provides the path trie used to extract the values of many field paths
+from a record in a single traversal.
+
+Looking up every field path on its own walks the shared prefix of field paths like
+`item.brand.name`, `item.name` and `item.sku` once per field path. The path trie
+groups the field paths by their keys, so every (nested) key is looked up only once
+per record. The values are returned in a dict with a slot for every field path,
+holding the same value as `get_field` returns for the field path: the value of the
+field, or None if the field can not be found.
+
+Field paths with characters that need escaping (see `field_path`) are not extracted
+by the trie and are looked up on their own.
+
+Classes:
+    - PathTrie:
+        Extracts the values of a set of field paths from a record.
+
+usage:
+>>> trie = PathTrie(["item.brand.name", "item.name", "item.sku"])
+>>> slots = trie.extract(record)
+>>> slots.get("item.sku", NOT_EXTRACTED)
+"""
+
+from typing import Any, Iterable
+
+from .field_path import SEPARATOR, _needs_jmespath
+
+__all__ = ["PathTrie", "NOT_EXTRACTED"]
+
+# default for lookups of field paths that are not extracted by the trie
+NOT_EXTRACTED = object()
+
+# node of the trie: the key, the field paths that end at the key and the child nodes
+_Node = tuple[str, tuple[str, ...], tuple]
+
+
+class PathTrie:
+    """
+    Trie of field paths that extracts the values of all field paths from a record in
+    a single traversal.
+
+    Args:
+        field_paths (Iterable[str]): dotted field paths, for example
+            `item.brand.name`.
+
+    Attributes:
+        field_paths (tuple[str, ...]): The field paths extracted by the trie.
+    """
+
+    __slots__ = ("field_paths", "_nodes")
+
+    def __init__(self, field_paths: Iterable[str]):
+        self.field_paths: tuple[str, ...] = tuple(
+            dict.fromkeys(
+                field_path
+                for field_path in field_paths
+                if field_path and not _needs_jmespath(field_path.split(SEPARATOR))
+            )
+        )
+        # nested dict of keys to the field paths ending at the key and the children
+        root: dict = {}
+        for field_path in self.field_paths:
+            children = root
+            *parent_keys, last_key = field_path.split(SEPARATOR)
+            for key in parent_keys:
+                children = children.setdefault(key, ([], {}))[1]
+            children.setdefault(last_key, ([], {}))[0].append(field_path)
+        self._nodes: tuple[_Node, ...] = _freeze(root)
+
+    def __len__(self) -> int:
+        return len(self.field_paths)
+
+    def extract(self, record: Any) -> dict[str, Any]:
+        """
+        Returns the values of the field paths of the trie.
+
+        Args:
+            record (Any): record (usually a dict) to retrieve the values from.
+
+        Returns:
+            dict[str, Any]: The value of every field path of the trie, None for
+                fields that do not exist.
+        """
+        slots: dict[str, Any] = dict.fromkeys(self.field_paths)
+        _extract(record, self._nodes, slots)
+        return slots
+
+
+def _freeze(children: dict) -> tuple[_Node, ...]:
+    return tuple(
+        (key, tuple(field_paths), _freeze(grandchildren))
+        for key, (field_paths, grandchildren) in children.items()
+    )
+
+
+def _extract(value: Any, nodes: tuple[_Node, ...], slots: dict[str, Any]) -> None:
+    for key, field_paths, children in nodes:
+        try:
+            child_value = value.get(key)
+        except AttributeError:
+            # value is not a dict, so none of the nested fields exist
+            return
+        if child_value is None:
+            continue
+        for field_path in field_paths:
+            slots[field_path] = child_value
+        if children:
+            _extract(child_value, children, slots)
@@ -12,13 +12,29 @@ __all__ = [
     "SkipConvKeys",
     "SkipRuleDict",
     "DataClassRuleKeys",
+    "CommandRuleKeys",
     "DataClassRuleDict",
+    "SkipRecordHandling",
 ]
 
 
 class RecConvKeys:
     SKIP: Literal["$skip"] = "$skip"
     CONVERT: Literal["$convert"] = "$convert"
+    FORMAT_DATE: Literal["$format_date"] = "$format_date"
+    DATACLASS: Literal["$dataclass"] = "$dataclass"
+    COMMAND_PREFIX: Literal["$"] = "$"
+
+
+class SkipRecordHandling:
+    """Options for the result of skipped records when converting many records."""
+
+    # return the DEFAULT_VALUE of the record convertor (as `convert` does)
+    DEFAULT: Literal["default"] = "default"
+    # leave skipped records out of the results
+    DROP: Literal["drop"] = "drop"
+    # return None for skipped records
+    NONE: Literal["none"] = "none"
 
 
 class BaseConvertorKeys:
@@ -34,6 +50,8 @@ class FormatDateConvKeys:
     CONDITION: Literal["condition"] = "condition"
     FORMAT: Literal["format"] = "format"
     DATEFIELD: Literal["date_field"] = "date_field"
+    TIMEZONE: Literal["timezone"] = "timezone"
+    OUTPUT_FORMAT: Literal["output_format"] = "output_format"
 
 
 class SkipConvKeys:
@@ -47,6 +65,18 @@ class DataClassRuleKeys:
     METHODS: Literal["methods"] = "methods"
 
 
+class CommandRuleKeys:
+    """Commands with nested rule sets and the keys of their arguments."""
+
+    FROM_LIST: Literal["$from_list"] = "$from_list"
+    FIRST_ITEM_FROM_LIST: Literal["$first_item_from_list"] = "$first_item_from_list"
+    TO_LIST_DYNAMIC: Literal["$to_list_dynamic"] = "$to_list_dynamic"
+    JOIN_KEY_VALUE: Literal["$join_key_value"] = "$join_key_value"
+    LIST_FIELD_NAME: Literal["list_field_name"] = "list_field_name"
+    KEY: Literal["key"] = "key"
+    VALUE: Literal["value"] = "value"
+
+
 class BaseRuleDict(TypedDict):
     condition: Optional[ConditionsDict]
     format: Optional[str]  # used by date convertor
@@ -60,6 +90,8 @@ class FormatDateRuleDict(TypedDict):
     condition: Optional[ConditionsDict]
     format: str
     date_field: str
+    timezone: Optional[str]
+    output_format: Optional[str]
 
 
 class SkipRuleDict(TypedDict):
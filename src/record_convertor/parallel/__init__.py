@@ -0,0 +1,211 @@
+"""
+Module to convert records in parallel with a pool of worker processes or threads.
+
+Record conversion is pure python (CPU bound) work, so a single record convertor can
+only use a single core. This module spreads the conversion of a batch of records over
+a pool of worker processes. Each worker process builds its own record convertor once,
+from the same arguments as the record convertor in the parent process, and keeps it
+for the life of the pool. The input records are split into chunks and every chunk is
+converted by one of the workers.
+
+On free-threaded python builds (3.13t and later) the same can be done with a pool of
+threads that share a single record convertor. This avoids pickling the records and
+building a record convertor per worker. On builds with the GIL the threads do not
+convert records in parallel.
+
+Functions:
+    - convert_parallel:
+        Converts an iterable of records with a pool of worker processes.
+    - convert_threaded:
+        Converts an iterable of records with a pool of threads.
+    - chunked:
+        Splits an iterable into lists of a given size.
+
+usage:
+>>> converted_records = convert_parallel(
+>>>     convertor_class=MyConvertor,
+>>>     convertor_arguments={"rule_source": "rules.yaml"},
+>>>     records=records,
+>>>     workers=8,
+>>> )
+"""
+
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
+
+from ..package_settings import SkipRecordHandling
+
+__all__ = ["convert_parallel", "convert_threaded", "chunked"]
+
+DEFAULT_CHUNKSIZE = 500
+# number of chunks per worker that are submitted to the pool ahead of the results
+# being consumed. Limits the memory use when converting large iterables.
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# record convertor of the worker process, set by `_init_worker`
+_worker_record_convertor: Any = None
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list]:
+    """
+    Splits an iterable into lists of (at most) `size` items.
+
+    Args:
+        iterable (Iterable): items to split
+        size (int): maximum number of items in a chunk
+
+    Returns:
+        Iterator[list]: the chunks in order
+    """
+    if size < 1:
+        raise ValueError(f"chunk size should be at least 1 but is {size}")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _init_worker(convertor_class: type, convertor_arguments: dict) -> None:
+    """Builds the record convertor of the worker process."""
+    global _worker_record_convertor
+    _worker_record_convertor = convertor_class(**convertor_arguments)
+
+
+def _convert_chunk(records: list[dict], skip_handling: str) -> list:
+    """Converts a chunk of records with the record convertor of the worker."""
+    return _worker_record_convertor.convert_list(records, skip_handling=skip_handling)
+
+
+def convert_parallel(
+    convertor_class: type,
+    convertor_arguments: dict,
+    records: Iterable[dict],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    skip_handling: str = SkipRecordHandling.DEFAULT,
+) -> Iterator[Any]:
+    """
+    Converts records with a pool of worker processes.
+
+    The input is read lazily: only a limited number of chunks is submitted to the
+    pool ahead of the results being consumed. The pool is shut down when all results
+    have been returned or when the returned iterator is closed.
+
+    Args:
+        convertor_class (type): record convertor class to be build in each worker.
+            Should be importable by the worker processes (i.e. defined at module
+            level).
+        convertor_arguments (dict): keyword arguments to build the record convertor.
+            Should be picklable.
+        records (Iterable[dict]): input records.
+        workers (int, optional): number of worker processes. Defaults to the number
+            of CPUs.
+        chunksize (int): number of records sent to a worker in one go.
+        ordered (bool): return the converted records in the order of the input
+            records. When False, chunks are returned as soon as they are converted.
+        skip_handling (str): what to return for skipped records (see
+            `SkipRecordHandling`).
+
+    Returns:
+        Iterator: converted records
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunked(records, chunksize)
+    max_chunks_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(convertor_class, convertor_arguments),
+    ) as executor:
+
+        def submit(chunk: list[dict]) -> Future:
+            return executor.submit(_convert_chunk, chunk, skip_handling)
+
+        if ordered:
+            yield from _ordered_results(submit, chunks, max_chunks_in_flight)
+        else:
+            yield from _unordered_results(submit, chunks, max_chunks_in_flight)
+
+
+def convert_threaded(
+    record_convertor: Any,
+    records: Iterable[dict],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    skip_handling: str = SkipRecordHandling.DEFAULT,
+) -> Iterator[Any]:
+    """
+    Converts records with a pool of threads that share one record convertor.
+
+    The record convertor keeps no state between conversions so it can be used by all
+    threads at the same time. The input is read lazily in the same way as by
+    `convert_parallel`.
+
+    Args:
+        record_convertor (RecordConvertor): record convertor used by all threads.
+        records (Iterable[dict]): input records.
+        workers (int, optional): number of threads. Defaults to the number of CPUs.
+        chunksize (int): number of records converted by a thread in one go.
+        ordered (bool): return the converted records in the order of the input
+            records. When False, chunks are returned as soon as they are converted.
+        skip_handling (str): what to return for skipped records (see
+            `SkipRecordHandling`).
+
+    Returns:
+        Iterator: converted records
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunked(records, chunksize)
+    max_chunks_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def submit(chunk: list[dict]) -> Future:
+            return executor.submit(
+                record_convertor.convert_list, chunk, skip_handling=skip_handling
+            )
+
+        if ordered:
+            yield from _ordered_results(submit, chunks, max_chunks_in_flight)
+        else:
+            yield from _unordered_results(submit, chunks, max_chunks_in_flight)
+
+
+def _ordered_results(
+    submit, chunks: Iterator[Any], max_chunks_in_flight: int
+) -> Iterator[Any]:
+    """Yields the converted records in the order of the input chunks."""
+    pending: deque[Future] = deque(
+        submit(chunk) for chunk in islice(chunks, max_chunks_in_flight)
+    )
+    while pending:
+        converted_records = pending.popleft().result()
+        if (chunk := next(chunks, None)) is not None:
+            pending.append(submit(chunk))
+        yield from converted_records
+
+
+def _unordered_results(
+    submit, chunks: Iterator[Any], max_chunks_in_flight: int
+) -> Iterator[Any]:
+    """Yields the converted records per chunk as soon as a chunk is converted."""
+    pending: set[Future] = {
+        submit(chunk) for chunk in islice(chunks, max_chunks_in_flight)
+    }
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if (chunk := next(chunks, None)) is not None:
+                pending.add(submit(chunk))
+            yield from future.result()
@@ -0,0 +1,206 @@
+"""
+Module to convert an async stream of records without blocking the event loop.
+
+The records of the async iterable are collected into batches by a producer task and
+put on a bounded queue. The batches are converted in an executor (a thread or process
+pool), so the event loop stays free to fetch the next records while earlier records
+are converted. When the queue is full the producer stops reading from the async
+iterable until the conversion has caught up: the memory use is bounded by the size of
+the queue, whatever the speed of the source.
+
+The size of the batches is adapted to the time it takes to convert them: large
+enough to keep the overhead of the executor low, small enough to return converted
+records quickly. A batch that is not full yet is converted anyway when no record has
+been added to the queue for `max_batch_delay` seconds, for example while the next
+page of an API is fetched.
+
+Functions:
+    - aconvert_stream: Converts an async iterable of records in an executor.
+    - convert_batch_in_process: Converts a batch of records in a worker process.
+
+usage:
+>>> async for converted_record in aconvert_stream(
+>>>     convert_batch=record_convertor.convert_list,
+>>>     records=fetch_records(),
+>>> ):
+>>>     ...
+"""
+
+import asyncio
+import pickle
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional
+
+__all__ = [
+    "aconvert_stream",
+    "convert_batch_in_process",
+    "DEFAULT_QUEUE_SIZE",
+    "DEFAULT_MAX_BATCH_DELAY",
+]
+
+# number of batches waiting in the queue, and of batches being converted
+DEFAULT_QUEUE_SIZE = 4
+# seconds a batch that is not full waits for more records
+DEFAULT_MAX_BATCH_DELAY = 0.05
+
+# the adaptive batch size aims at batches that take this number of seconds to convert
+TARGET_BATCH_SECONDS = 0.02
+INITIAL_BATCH_SIZE = 100
+MIN_BATCH_SIZE = 1
+MAX_BATCH_SIZE = 10_000
+
+# record convertors of the worker processes used by `aconvert_stream`, by the pickled
+# record convertor class and arguments
+_process_record_convertors: dict[bytes, Any] = {}
+
+# marker put on the queue by the producer when all records have been read
+_END = object()
+
+
+class _ProducerError:
+    """Carries an exception raised by the async iterable to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _BatchSize:
+    """Batch size that follows the measured conversion time per record."""
+
+    def __init__(self, fixed_size: Optional[int]):
+        self.size = fixed_size or INITIAL_BATCH_SIZE
+        self.adaptive = fixed_size is None
+
+    def update(self, records: int, seconds: float) -> None:
+        if not self.adaptive or records == 0:
+            return
+        ideal_size = TARGET_BATCH_SECONDS * records / max(seconds, 1e-6)
+        # move halfway to the ideal size to smooth out single slow batches
+        self.size = round(
+            min(max((self.size + ideal_size) / 2, MIN_BATCH_SIZE), MAX_BATCH_SIZE)
+        )
+
+
+async def aconvert_stream(
+    convert_batch: Callable[[list], list],
+    records: AsyncIterable[dict],
+    executor: Optional[Executor] = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    batch_size: Optional[int] = None,
+    max_batch_delay: float = DEFAULT_MAX_BATCH_DELAY,
+) -> AsyncIterator[Any]:
+    """
+    Converts an async iterable of records in batches in an executor and yields the
+    converted records in the order of the input records.
+
+    Args:
+        convert_batch (Callable): Converts a list of records into a list of converted
+            records. Should be picklable when a process pool is used.
+        records (AsyncIterable[dict]): input records.
+        executor (Executor, optional): executor the batches are converted in. The
+            default executor of the event loop (a thread pool) if None.
+        queue_size (int): maximum number of batches waiting to be converted, and of
+            batches being converted.
+        batch_size (int, optional): fixed number of records per batch. The batch
+            size is adapted to the conversion time when None.
+        max_batch_delay (float): seconds after which a batch that is not full is
+            converted when no new records arrive.
+
+    Returns:
+        AsyncIterator: the converted records.
+    """
+    if queue_size < 1:
+        raise ValueError(f"queue size should be at least 1 but is {queue_size}")
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    current_batch_size = _BatchSize(batch_size)
+    # the batch being filled by the producer, in a list so the flusher can take it
+    filling: list[list] = [[]]
+    last_record_time = [loop.time()]
+    # held while a batch is taken and put on the queue, so that a batch can not
+    # overtake an older batch waiting for room on the queue
+    put_lock = asyncio.Lock()
+
+    async def put_filling_batch() -> None:
+        async with put_lock:
+            if filling[0]:
+                batch, filling[0] = filling[0], []
+                await queue.put(batch)
+
+    async def produce() -> None:
+        try:
+            async for record in records:
+                filling[0].append(record)
+                last_record_time[0] = loop.time()
+                if len(filling[0]) >= current_batch_size.size:
+                    await put_filling_batch()
+            await put_filling_batch()
+            async with put_lock:
+                await queue.put(_END)
+        except Exception as error:
+            async with put_lock:
+                await queue.put(_ProducerError(error))
+
+    async def flush_stalled_batches() -> None:
+        while True:
+            await asyncio.sleep(max_batch_delay)
+            if filling[0] and loop.time() - last_record_time[0] >= max_batch_delay:
+                await put_filling_batch()
+
+    def convert(batch: list) -> asyncio.Future:
+        return loop.run_in_executor(executor, _timed, convert_batch, batch)
+
+    producer = asyncio.create_task(produce())
+    flusher = asyncio.create_task(flush_stalled_batches())
+    pending: deque[tuple[int, asyncio.Future]] = deque()
+    end_of_input = False
+    try:
+        while True:
+            # keep `queue_size` batches in the executor while there is input
+            while not end_of_input and len(pending) < queue_size:
+                if pending and queue.empty():
+                    break
+                item = await queue.get()
+                if item is _END:
+                    end_of_input = True
+                elif isinstance(item, _ProducerError):
+                    raise item.error
+                else:
+                    pending.append((len(item), convert(item)))
+            if not pending:
+                return
+            number_of_records, future = pending.popleft()
+            converted_records, seconds = await future
+            current_batch_size.update(number_of_records, seconds)
+            for converted_record in converted_records:
+                yield converted_record
+    finally:
+        flusher.cancel()
+        producer.cancel()
+        for _, future in pending:
+            future.cancel()
+        await asyncio.gather(producer, flusher, return_exceptions=True)
+
+
+def _timed(convert_batch: Callable[[list], list], batch: list) -> tuple[list, float]:
+    """Converts a batch and returns the converted records and the conversion time."""
+    start = time.perf_counter()
+    converted_records = convert_batch(batch)
+    return converted_records, time.perf_counter() - start
+
+
+def convert_batch_in_process(
+    convertor_key: bytes, skip_handling: str, records: list[dict]
+) -> list:
+    """
+    Converts a batch of records in a worker process with a record convertor that is
+    built on first use from the pickled record convertor class and arguments.
+    """
+    record_convertor = _process_record_convertors.get(convertor_key)
+    if record_convertor is None:
+        convertor_class, convertor_arguments = pickle.loads(convertor_key)
+        record_convertor = convertor_class(**convertor_arguments)
+        _process_record_convertors[convertor_key] = record_convertor
+    return record_convertor.convert_list(records, skip_handling=skip_handling)
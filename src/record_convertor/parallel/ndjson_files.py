@@ -0,0 +1,297 @@
+"""
+Module to convert NDJSON files (one JSON record per line) in parallel, with each worker
+process reading its own part of the file.
+
+When records are read in the parent process and sent to the workers, the parent has
+to decode, pickle and unpickle every record and soon becomes the bottleneck. Instead,
+the file is split into byte ranges that end at a newline. Only the end of every range
+is searched for in the memory-mapped file, so splitting the file takes almost no time.
+Every worker maps the file into memory itself and decodes, converts and encodes the
+records of a byte range. The parent process only receives the NDJSON output of a
+range, or nothing at all when the workers write their output to a file per range.
+
+Classes:
+    - ByteRange: A part of a file that starts and ends at a line boundary.
+    - ConvertedShard: The result of converting the records of a byte range.
+
+Functions:
+    - byte_ranges: Splits a file into byte ranges aligned to line boundaries.
+    - ndjson_records: Decodes the records of a byte range of an NDJSON buffer.
+    - to_ndjson: Encodes records as NDJSON.
+    - convert_ndjson_file: Converts an NDJSON file with a pool of worker processes.
+
+usage:
+>>> for shard in convert_ndjson_file(
+>>>     convertor_class=MyConvertor,
+>>>     convertor_arguments={"rule_source": "rules.yaml"},
+>>>     filename="export.ndjson",
+>>>     workers=8,
+>>> ):
+>>>     output.write(shard.data)
+"""
+
+import json
+import mmap
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+from ..package_settings import SkipRecordHandling
+from . import (
+    CHUNKS_IN_FLIGHT_PER_WORKER,
+    _init_worker,
+    _ordered_results,
+    _unordered_results,
+)
+
+__all__ = [
+    "ByteRange",
+    "ConvertedShard",
+    "DEFAULT_SHARD_SIZE",
+    "byte_ranges",
+    "ndjson_records",
+    "to_ndjson",
+    "convert_ndjson_file",
+]
+
+DEFAULT_SHARD_SIZE = 16 * 1024 * 1024
+
+NEWLINE = b"\n"
+
+
+class ByteRange(NamedTuple):
+    """The bytes `start` up to `end` of a file, starting and ending at a line."""
+
+    start: int
+    end: int
+
+
+class ConvertedShard(NamedTuple):
+    """
+    The result of converting the records of a byte range.
+
+    Attributes:
+        shard (int): Number of the byte range in the file, starting at 0.
+        byte_range (ByteRange): The converted part of the input file.
+        records_read (int): Number of records in the byte range.
+        records_written (int): Number of converted records (without dropped records).
+        data (bytes): The converted records as NDJSON, empty if they have been
+            written to `output_filename`.
+        output_filename (str, optional): The file the converted records have been
+            written to.
+    """
+
+    shard: int
+    byte_range: ByteRange
+    records_read: int
+    records_written: int
+    data: bytes
+    output_filename: Optional[str]
+
+
+def byte_ranges(
+    filename: Union[str, os.PathLike], shard_size: int = DEFAULT_SHARD_SIZE
+) -> list[ByteRange]:
+    """
+    Splits a file into byte ranges of about `shard_size` bytes that end at a newline
+    (or at the end of the file).
+
+    Args:
+        filename (str | os.PathLike): The file.
+        shard_size (int): Minimum size of a byte range (except for the last one).
+
+    Returns:
+        list[ByteRange]: Consecutive byte ranges that together cover the file.
+    """
+    if shard_size < 1:
+        raise ValueError(f"shard size should be at least 1 but is {shard_size}")
+    with open(filename, "rb") as file:
+        file_size = os.fstat(file.fileno()).st_size
+        if file_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            ranges = []
+            start = 0
+            while start < file_size:
+                newline = buffer.find(NEWLINE, min(start + shard_size, file_size) - 1)
+                end = file_size if newline == -1 else newline + 1
+                ranges.append(ByteRange(start, end))
+                start = end
+            return ranges
+
+
+def ndjson_records(
+    buffer: Union[bytes, mmap.mmap],
+    byte_range: ByteRange,
+    name: str = "<input>",
+    parse: Optional[Callable[[bytes], dict]] = None,
+) -> Iterator[dict]:
+    """
+    Decodes the records of a byte range of an NDJSON buffer. Empty lines are skipped.
+
+    Args:
+        buffer (bytes | mmap): The content of the NDJSON file.
+        byte_range (ByteRange): The part of the buffer to decode.
+        name (str): Name of the file used in error messages.
+        parse (Callable, optional): Parses a line into a record, for example the
+            `parse_json` method of a record convertor which only parses the fields
+            read by its rules. Should raise a ValueError for a line that is not a
+            JSON object. Lines are decoded with `json.loads` when None.
+
+    Returns:
+        Iterator[dict]: The records in the byte range.
+
+    Raises:
+        ValueError: If a line is not a JSON object.
+    """
+    parse = parse or _json_record
+    lines = buffer[byte_range.start : byte_range.end].split(NEWLINE)
+    for line_index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            record = parse(line)
+        except ValueError as error:
+            location = _location(buffer, byte_range, line_index, name)
+            raise ValueError(f"{location}: {error}") from error
+        yield record
+
+
+def to_ndjson(records: Iterable[Any]) -> bytes:
+    """
+    Encodes records as NDJSON. Values that are not JSON types (dates, decimals etc.)
+    are written as strings.
+    """
+    lines = [
+        json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        for record in records
+    ]
+    if not lines:
+        return b""
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def convert_ndjson_file(
+    convertor_class: type,
+    convertor_arguments: dict,
+    filename: Union[str, os.PathLike],
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    ordered: bool = True,
+    skip_handling: str = SkipRecordHandling.DEFAULT,
+    shard_output: Optional[str] = None,
+) -> Iterator[ConvertedShard]:
+    """
+    Converts an NDJSON file with a pool of worker processes that each read and
+    convert their own byte ranges of the file.
+
+    Args:
+        convertor_class (type): record convertor class to be build in each worker.
+            Should be importable by the worker processes.
+        convertor_arguments (dict): keyword arguments to build the record convertor.
+        filename (str | os.PathLike): The (uncompressed) NDJSON file.
+        workers (int, optional): number of worker processes. Defaults to the number
+            of CPUs.
+        shard_size (int): size in bytes of the byte range converted in one go.
+        ordered (bool): return the shards in the order of the file. When False,
+            shards are returned as soon as they are converted.
+        skip_handling (str): what to write for skipped records (see
+            `SkipRecordHandling`).
+        shard_output (str, optional): filename pattern with a `{shard}` field (for
+            example 'converted-{shard:05d}.ndjson'). When given, the workers write
+            the records of every shard to their own file instead of returning them.
+
+    Returns:
+        Iterator[ConvertedShard]: the converted shards.
+    """
+    workers = workers or os.cpu_count() or 1
+    filename = os.fspath(filename)
+    shards = iter(enumerate(byte_ranges(filename, shard_size)))
+    max_shards_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(convertor_class, convertor_arguments),
+    ) as executor:
+
+        def submit(shard: tuple[int, ByteRange]) -> Future:
+            index, byte_range = shard
+            output_filename = None
+            if shard_output is not None:
+                output_filename = shard_output.format(shard=index)
+            return executor.submit(
+                _convert_shard,
+                filename,
+                index,
+                byte_range,
+                skip_handling,
+                output_filename,
+            )
+
+        if ordered:
+            results = _ordered_results(submit, shards, max_shards_in_flight)
+        else:
+            results = _unordered_results(submit, shards, max_shards_in_flight)
+        yield from results
+
+
+def _convert_shard(
+    filename: str,
+    index: int,
+    byte_range: ByteRange,
+    skip_handling: str,
+    output_filename: Optional[str],
+) -> list[ConvertedShard]:
+    """Converts the records of a byte range with the record convertor of the worker."""
+    # imported here as the worker record convertor is set on the package module
+    from . import _worker_record_convertor
+
+    with (
+        open(filename, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+    ):
+        # only the fields read by the rules are parsed
+        parse = _worker_record_convertor.parse_json
+        records = list(ndjson_records(buffer, byte_range, filename, parse))
+    converted_records = _worker_record_convertor.convert_list(
+        records, skip_handling=skip_handling
+    )
+    data = to_ndjson(converted_records)
+    if output_filename is not None:
+        with open(output_filename, "wb") as output:
+            output.write(data)
+        data = b""
+    # returned as a list of one, as the results of the pool are lists of results
+    return [
+        ConvertedShard(
+            index,
+            byte_range,
+            len(records),
+            len(converted_records),
+            data,
+            output_filename,
+        )
+    ]
+
+
+def _json_record(line: bytes) -> dict:
+    try:
+        record = json.loads(line)
+    except ValueError as error:
+        raise ValueError(f"invalid JSON: {error}") from error
+    if not isinstance(record, dict):
+        raise ValueError("not a JSON object")
+    return record
+
+
+def _location(
+    buffer: Union[bytes, mmap.mmap],
+    byte_range: ByteRange,
+    line_index: int,
+    name: str,
+) -> str:
+    """Returns 'name:line number' for a line of a byte range (for error messages)."""
+    line_number = buffer[: byte_range.start].count(NEWLINE) + line_index + 1
+    return f"{name}:{line_number}"
@@ -0,0 +1,469 @@
+"""
+Module to derive the fields of the input record a rule set reads, and to parse and
+project input records onto these fields.
+
+Most rule sets read a small part of large input records. The fields a rule set reads
+follow from the rules themselves: the paths of path copies, the `fieldname` of
+`$skip` and `$convert` rules, the `date_field` of `$format_date` rules and the field
+arguments of commands and conversion actions. The `ReadSet` of a plan holds these
+field paths. It projects a record onto them: a new record with only the (nested)
+fields that are read, which gives the same conversion result as the full record.
+
+A rule that can read any field of the record (the `$full_record` command, commands
+and actions of custom classes etc.) makes the read set cover the whole record, in
+which case records are not projected.
+
+Raw JSON input is parsed with the lazy parser of `pysimdjson` when it is installed,
+so only the projected fields are turned into python objects. Without it the record is
+parsed with the `json` module and then projected.
+
+Classes:
+    - ReadSet: The field paths of the input record read by a rule set.
+
+Functions:
+    - read_set: Returns the (cached) read set of a plan for a record convertor.
+
+usage:
+>>> fields = read_set(plan)
+>>> record = fields.parse(b'{"name": "Jan", "large": {...}}')
+"""
+
+import json
+import threading
+from inspect import getattr_static
+from typing import Any, Iterable, Optional, Union
+
+from ..command_processor import ProcessCommand, command_field_paths
+from ..dataclass_processor import DataClassProcessor
+from ..field_convertors import BaseFieldConvertor, DateFieldConvertor
+from ..package_settings import (
+    BaseConvertorKeys,
+    CommandRuleKeys,
+    DataClassRuleKeys,
+    FormatDateConvKeys,
+    SkipConvKeys,
+)
+from ..rules_compiler import RuleKind, RulePlan
+
+__all__ = ["ReadSet", "ProjectionTree", "read_set"]
+
+# nested dict of the keys to keep. A key with None as value is kept with its value as
+# a whole, a key with a dict is projected onto the keys in that dict.
+ProjectionTree = dict[str, Optional[dict]]
+
+FieldPath = tuple[str, ...]
+
+SEPARATOR = "."
+LEGACY_SEPARATOR = "__"
+
+# methods of the command class that are used to run the commands
+COMMAND_METHODS = ("__init__", "get_value", "_get_field", "_rules_convertor")
+
+# actions of `BaseFieldConvertor` with a field name or list of field names as value
+FIELD_ACTIONS = (
+    "add_value_from_field",
+    "add_key_value_from_field",
+    "add_data_from_dict",
+    "get_country_code_from_phone_nr",
+    "join_fields",
+    "change_key_name_to",
+)
+# methods of the field convertor that are used to run the actions
+FIELD_CONVERTOR_METHODS = (
+    "convert_field",
+    "_run_action_pipeline",
+    "_get_field",
+    "set_field_value",
+    "pop_nested_field",
+)
+# methods of the date formatter that read the record
+DATE_FORMATTER_METHODS = (
+    "format_date_field",
+    "_format_date_field",
+    "_get_field",
+    "update_field_with_date",
+)
+
+
+class _WholeRecord(Exception):
+    """Raised when a rule can read any field of the record."""
+
+
+class ReadSet:
+    """
+    The field paths of the input record read by a rule set.
+
+    Args:
+        paths (Iterable[tuple[str, ...]]): The field paths as tuples of keys. The
+            value of a path is read as a whole (including all its nested fields).
+        whole_record (bool): The rule set can read any field of the record.
+
+    Attributes:
+        paths (frozenset[tuple[str, ...]]): The field paths.
+        whole_record (bool): The rule set can read any field of the record.
+        tree (ProjectionTree): The field paths as nested dict of keys. A path that
+            is a prefix of another path replaces the longer path.
+    """
+
+    __slots__ = ("paths", "whole_record", "tree")
+
+    def __init__(self, paths: Iterable[FieldPath] = (), whole_record: bool = False):
+        self.paths: frozenset[FieldPath] = frozenset(paths)
+        self.whole_record = whole_record
+        self.tree: ProjectionTree = _projection_tree(self.paths)
+
+    def __repr__(self) -> str:
+        if self.whole_record:
+            return "ReadSet(whole_record=True)"
+        paths = sorted(SEPARATOR.join(path) for path in self.paths)
+        return f"ReadSet({paths})"
+
+    def project(self, record: dict, lower_case_keys: bool = False) -> dict:
+        """
+        Returns a new record with only the fields of the read set. Values of the
+        fields are not copied.
+
+        Args:
+            record (dict): The input record.
+            lower_case_keys (bool): The keys of the record are converted to lower
+                case before the conversion (see `KEYS_IN_LOWER_CASE`), so keys of
+                the record are matched in lower case.
+
+        Returns:
+            dict: The projected record, or the record itself when the read set
+                covers the whole record.
+        """
+        if self.whole_record:
+            return record
+        return _project(record, self.tree, lower_case_keys)
+
+    def parse(self, raw: Union[bytes, str], lower_case_keys: bool = False) -> dict:
+        """
+        Parses a JSON object and returns it projected onto the read set.
+
+        Args:
+            raw (bytes | str): The JSON object.
+            lower_case_keys (bool): see `project`.
+
+        Returns:
+            dict: The projected record.
+
+        Raises:
+            ValueError: If `raw` is not valid JSON or not a JSON object.
+        """
+        simdjson = _simdjson()
+        if simdjson is None:
+            try:
+                record = json.loads(raw)
+            except ValueError as error:
+                raise ValueError(f"invalid JSON: {error}") from error
+            if not isinstance(record, dict):
+                raise ValueError("not a JSON object")
+            return self.project(record, lower_case_keys)
+
+        try:
+            document = _simdjson_parser(simdjson).parse(raw)
+        except ValueError as error:
+            raise ValueError(f"invalid JSON: {error}") from error
+        try:
+            if not isinstance(document, simdjson.Object):
+                raise ValueError("not a JSON object")
+            if self.whole_record:
+                return document.as_dict()
+            return _project_document(simdjson, document, self.tree, lower_case_keys)
+        finally:
+            # the parser can only parse the next document when this one is released
+            del document
+
+
+def read_set(
+    plan: RulePlan,
+    command_class: type[ProcessCommand] = ProcessCommand,
+    field_convertor: Any = None,
+    date_formatter: Any = None,
+    dataclass_processor: Any = None,
+) -> ReadSet:
+    """
+    Returns the fields of the input record read by the rules of a plan. The read set
+    is derived once per plan and type of the arguments and stored with the plan.
+
+    Args:
+        plan (RulePlan): The compiled rule set.
+        command_class (type): The command class of the record convertor. Commands are
+            only analysed if the command class runs them as `ProcessCommand`.
+        field_convertor: The field convertor of the record convertor. Conversion
+            actions are only analysed for (subclasses of) `BaseFieldConvertor` that
+            run them as `BaseFieldConvertor`. The default field convertor if None.
+        date_formatter: The date formatter of the record convertor. The default
+            date formatter if None.
+        dataclass_processor: The dataclass processor of the record convertor. The
+            default dataclass processor if None.
+
+    Returns:
+        ReadSet: the read set of the plan.
+    """
+    key = (
+        command_class,
+        BaseFieldConvertor if field_convertor is None else type(field_convertor),
+        DateFieldConvertor if date_formatter is None else type(date_formatter),
+        DataClassProcessor
+        if dataclass_processor is None
+        else type(dataclass_processor),
+    )
+    try:
+        return plan.read_sets[key]
+    except KeyError:
+        pass
+    analyser = _ReadSetAnalyser(*key)
+    try:
+        analyser.add_plan(plan)
+        result = ReadSet(analyser.paths)
+    except _WholeRecord:
+        result = ReadSet(whole_record=True)
+    plan.read_sets[key] = result
+    return result
+
+
+class _ReadSetAnalyser:
+    """Collects the field paths read by the rules of a plan."""
+
+    def __init__(
+        self,
+        command_class: type,
+        field_convertor_class: type,
+        date_formatter_class: type,
+        dataclass_processor_class: type,
+    ):
+        self.command_class = command_class
+        self.field_convertor_class = field_convertor_class
+        self.date_formatter_class = date_formatter_class
+        self.dataclass_processor_class = dataclass_processor_class
+        self.paths: set[FieldPath] = set()
+        self._plans: set[int] = set()
+
+    def add_plan(self, plan: RulePlan) -> None:
+        # a rule dict used more than once in the rule set is analysed once
+        if id(plan) in self._plans:
+            return
+        self._plans.add(id(plan))
+
+        for compiled_rule in plan:
+            kind, rule = compiled_rule.kind, compiled_rule.rule
+            if kind == RuleKind.SKIP:
+                self.add_field(_rule_dict(rule).get(SkipConvKeys.FIELDNAME))
+            elif kind == RuleKind.FIELD_CONVERT:
+                self.add_field_conversion(_rule_dict(rule))
+            elif kind == RuleKind.DATE_FORMAT:
+                self.add_date_format(_rule_dict(rule))
+            elif kind == RuleKind.DATACLASS:
+                self.add_dataclass(plan, _rule_dict(rule))
+            elif kind == RuleKind.COMMAND:
+                self.add_command(plan, compiled_rule.key, rule)
+            elif kind == RuleKind.NESTED:
+                self.add_plan(compiled_rule.sub_plan)  # type: ignore[arg-type]
+            else:
+                self.add_field(rule)
+
+    def add_field(self, field_path: Any, legacy_separator: bool = False) -> None:
+        """Adds a field path. Arguments that are not a field path are ignored."""
+        if not (field_path and isinstance(field_path, str)):
+            return
+        if legacy_separator:
+            field_path = field_path.replace(LEGACY_SEPARATOR, SEPARATOR)
+        self.paths.add(tuple(field_path.split(SEPARATOR)))
+
+    def add_fields(self, field_paths: Any, legacy_separator: bool = False) -> None:
+        """Adds a field path or a list of field paths."""
+        if isinstance(field_paths, list):
+            for field_path in field_paths:
+                self.add_field(field_path, legacy_separator)
+        else:
+            self.add_field(field_paths, legacy_separator)
+
+    def add_converted_field(self, field_name: Any) -> None:
+        """
+        Adds a field that is read and set by a field conversion. The field is read
+        with the legacy separator but set without it.
+        """
+        self.add_field(field_name, legacy_separator=True)
+        self.add_field(field_name)
+
+    def add_field_conversion(self, rule: dict) -> None:
+        if not _runs_as(
+            self.field_convertor_class, BaseFieldConvertor, FIELD_CONVERTOR_METHODS
+        ):
+            raise _WholeRecord
+        self.add_converted_field(rule.get(BaseConvertorKeys.FIELDNAME))
+        for action_dict in rule.get(BaseConvertorKeys.ACTIONS) or []:
+            for action, action_value in _rule_dict(action_dict).items():
+                if action == BaseConvertorKeys.ACTIONTARGET:
+                    self.add_converted_field(action_value)
+                    continue
+                if not _runs_as(self.field_convertor_class, BaseFieldConvertor, action):
+                    raise _WholeRecord
+                if action in FIELD_ACTIONS:
+                    self.add_fields(action_value, legacy_separator=True)
+                    self.add_fields(action_value)
+
+    def add_date_format(self, rule: dict) -> None:
+        if not _runs_as(
+            self.date_formatter_class, DateFieldConvertor, DATE_FORMATTER_METHODS
+        ):
+            raise _WholeRecord
+        self.add_field(rule.get(FormatDateConvKeys.DATEFIELD), legacy_separator=True)
+
+    def add_dataclass(self, plan: RulePlan, rule: dict) -> None:
+        if self.dataclass_processor_class is not DataClassProcessor:
+            raise _WholeRecord
+        params = rule.get(DataClassRuleKeys.RECORD_CONVERSION_ARGUMENTS)
+        if isinstance(params, dict):
+            self.add_plan(plan.plan_for(params))
+        for method_dict in rule.get(DataClassRuleKeys.METHODS) or []:
+            for method_argument_rules in _rule_dict(method_dict).values():
+                if isinstance(method_argument_rules, dict):
+                    self.add_plan(plan.plan_for(method_argument_rules))
+
+    def add_command(self, plan: RulePlan, command: str, arguments: Any) -> None:
+        field_paths = command_field_paths(command, arguments)
+        if field_paths is None or not _is_default_command(
+            self.command_class, command[1:]
+        ):
+            raise _WholeRecord
+        for field_path in field_paths:
+            self.add_field(field_path)
+
+        # rule sets in the arguments are converted with the same record, except for
+        # the rules for the list items of `$from_list` (which are covered by reading
+        # the list as a whole)
+        if command == CommandRuleKeys.TO_LIST_DYNAMIC:
+            for rules in arguments if isinstance(arguments, list) else []:
+                if isinstance(rules, dict):
+                    self.add_plan(plan.plan_for(rules))
+        elif command == CommandRuleKeys.JOIN_KEY_VALUE:
+            for key in (CommandRuleKeys.KEY, CommandRuleKeys.VALUE):
+                key_or_value = _rule_dict(arguments).get(key)
+                if isinstance(key_or_value, dict):
+                    self.add_plan(plan.plan_for(key_or_value))
+
+
+def _rule_dict(rule: Any) -> dict:
+    """Returns the rule if it is a dict. Other rules can read any field."""
+    if not isinstance(rule, dict):
+        raise _WholeRecord
+    return rule
+
+
+def _runs_as(klass: type, base_class: type, names: Union[str, tuple]) -> bool:
+    """
+    Returns True if the class is a subclass of the base class and has the same
+    attributes for the given names.
+    """
+    if not issubclass(klass, base_class):
+        return False
+    if isinstance(names, str):
+        names = (names,)
+    return all(
+        getattr_static(klass, name, None) is getattr_static(base_class, name, None)
+        and getattr_static(base_class, name, None) is not None
+        for name in names
+    )
+
+
+def _is_default_command(command_class: type, name: str) -> bool:
+    """Returns True if the command class runs the command as `ProcessCommand`."""
+    default_command = ProcessCommand.COMMANDS.get(name)
+    return (
+        default_command is not None
+        and getattr(command_class, "COMMANDS", {}).get(name) is default_command
+        and _runs_as(command_class, ProcessCommand, COMMAND_METHODS)
+    )
+
+
+def _projection_tree(paths: Iterable[FieldPath]) -> ProjectionTree:
+    """Returns the paths as nested dict of keys, see `ProjectionTree`."""
+    tree: ProjectionTree = {}
+    # shorter paths first, so a path that is a prefix of another path replaces it
+    for path in sorted(paths, key=len):
+        node = tree
+        for key in path[:-1]:
+            child = node.setdefault(key, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[path[-1]] = None
+    return tree
+
+
+def _project(record: dict, tree: ProjectionTree, lower_case_keys: bool) -> dict:
+    projected = {}
+    if lower_case_keys:
+        # all keys are matched, as keys that only differ in case replace each other
+        # when the record is converted to lower case
+        for key, value in record.items():
+            lower_case_key = key.lower() if isinstance(key, str) else key
+            if lower_case_key not in tree:
+                continue
+            subtree = tree[lower_case_key]
+            if subtree is not None and isinstance(value, dict):
+                value = _project(value, subtree, lower_case_keys)
+            projected[key] = value
+        return projected
+
+    for key, subtree in tree.items():
+        if key not in record:
+            continue
+        value = record[key]
+        if subtree is not None and isinstance(value, dict):
+            value = _project(value, subtree, lower_case_keys)
+        projected[key] = value
+    return projected
+
+
+def _project_document(
+    simdjson: Any, document: Any, tree: ProjectionTree, lower_case_keys: bool
+) -> dict:
+    """Projects a lazy `simdjson.Object`, materialising only the projected fields."""
+    projected = {}
+    keys = document.keys() if lower_case_keys else tree
+    for key in keys:
+        tree_key = key.lower() if lower_case_keys else key
+        if tree_key not in tree or key not in document:
+            continue
+        value, subtree = document[key], tree[tree_key]
+        if isinstance(value, simdjson.Object):
+            value = (
+                value.as_dict()
+                if subtree is None
+                else _project_document(simdjson, value, subtree, lower_case_keys)
+            )
+        elif isinstance(value, simdjson.Array):
+            value = value.as_list()
+        projected[key] = value
+    return projected
+
+
+# the optional simdjson module (False if it is not installed) and the parser of every
+# thread, as a parser can only hold one document at a time
+_simdjson_module: Any = None
+_parsers = threading.local()
+
+
+def _simdjson() -> Any:
+    """Returns the `simdjson` module of pysimdjson, or None if it is not installed."""
+    global _simdjson_module
+    if _simdjson_module is None:
+        try:
+            import simdjson  # type: ignore[import-not-found]
+
+            _simdjson_module = simdjson
+        except ImportError:
+            _simdjson_module = False
+    return _simdjson_module or None
+
+
+def _simdjson_parser(simdjson: Any) -> Any:
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = simdjson.Parser()
+    return parser
@@ -0,0 +1,427 @@
+"""
+Module to compile a rule set into an execution plan.
+
+The meaning of an entry in a rule set is derived from its key and value (a `$skip`
+key is a skip rule, a `$convert` key a field conversion, a string value a path to
+copy etc.). Instead of working this out for every record, the rule set is compiled
+once into a `RulePlan`: an ordered tuple of pre-classified rules that the
+`RecordConvertor` only has to walk.
+
+The field paths read by the path copies, nested rule sets and commands of a plan are
+grouped into a `PathTrie`, so their values are extracted from a record in a single
+traversal. The values are extracted after the last rule that changes the input record
+(`$convert` and `$format_date` rules), and only when none of the later rules (or the
+rule sets nested in them) change the input record.
+
+A `PlanRegistry` shares the plans of rule sets with the same content between record
+convertors, so a rule set used by many record convertors in a process is compiled
+(and kept in memory) only once.
+
+Classes:
+    - RuleKind: Names of the different kinds of rules in a plan.
+    - CompiledRule: A single pre-classified rule.
+    - RulePlan: The ordered, pre-classified rules of a rule set.
+    - PlanRegistry: Process-wide store of plans by the content of their rule set.
+
+Functions:
+    - compile_rules: Compiles a rule dict into a RulePlan.
+
+usage:
+>>> plan = compile_rules(rules)
+>>> [compiled_rule.kind for compiled_rule in plan]
+"""
+
+import hashlib
+import threading
+from copy import deepcopy
+from datetime import date, datetime, time
+from typing import Any, Iterable, Iterator, Literal, NamedTuple, Optional
+
+from ..command_processor import command_field_paths
+from ..package_settings import (
+    CommandRuleKeys,
+    DataClassRuleKeys,
+    PathTrie,
+    RecConvKeys,
+    RulesDict,
+)
+
+__all__ = [
+    "RuleKind",
+    "CompiledRule",
+    "RulePlan",
+    "PlanRegistry",
+    "PLAN_REGISTRY",
+    "SKIPPED",
+    "LIST_ITEM_IGNORED_KEYS",
+    "compile_rules",
+    "is_skip_rule",
+    "is_convert_field_rule",
+    "is_format_date_rule",
+    "is_dataclass_rule",
+    "is_command_rule",
+]
+
+
+# marker returned by a conversion with a plan when the record is skipped by one of
+# the skip rules of the plan
+SKIPPED = object()
+
+# key of a plan in the store of plans: id of the rule dict and the ignored keys
+PlanKey = tuple[int, tuple[str, ...]]
+
+
+class _PlanStore(dict[PlanKey, "RulePlan"]):
+    """
+    Store of the plans compiled from the same root rule set. The store is closed
+    once the root rule set is compiled, so that only the plans of rule dicts that
+    are part of the rule set are kept.
+    """
+
+    __slots__ = ("closed",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed = False
+
+
+# types of the values in rule sets that can be shared by content. Other values (for
+# example objects with a default repr) make the rule set private to its convertor.
+PLAIN_DATA_TYPES = (str, int, float, bool, type(None), date, datetime, time)
+
+# the `$from_list` arguments that are not part of the rule set for the list items
+LIST_ITEM_IGNORED_KEYS = (CommandRuleKeys.LIST_FIELD_NAME,)
+
+
+class RuleKind:
+    SKIP: Literal["skip"] = "skip"
+    FIELD_CONVERT: Literal["field_convert"] = "field_convert"
+    DATE_FORMAT: Literal["date_format"] = "date_format"
+    DATACLASS: Literal["dataclass"] = "dataclass"
+    COMMAND: Literal["command"] = "command"
+    NESTED: Literal["nested"] = "nested"
+    PATH_COPY: Literal["path_copy"] = "path_copy"
+
+
+def is_skip_rule(rule_key: str) -> bool:
+    return RecConvKeys.SKIP in rule_key.lower()
+
+
+def is_convert_field_rule(rule_key: str) -> bool:
+    return RecConvKeys.CONVERT in rule_key
+
+
+def is_format_date_rule(rule_key: str) -> bool:
+    return RecConvKeys.FORMAT_DATE in rule_key
+
+
+def is_dataclass_rule(rule_key: str) -> bool:
+    return RecConvKeys.DATACLASS in rule_key
+
+
+def is_command_rule(rule_key: str) -> bool:
+    return rule_key[0] == RecConvKeys.COMMAND_PREFIX
+
+
+class CompiledRule(NamedTuple):
+    """
+    A single rule from a rule set with its kind determined at compile time.
+
+    Attributes:
+        kind (str): One of the `RuleKind` values.
+        key (str): The key of the rule in the rule set.
+        rule (Any): The value of the rule in the rule set.
+        sub_plan (RulePlan, optional): Compiled plan for nested rules.
+    """
+
+    kind: str
+    key: str
+    rule: Any
+    sub_plan: Optional["RulePlan"] = None
+
+
+class RulePlan:
+    """
+    The ordered, pre-classified rules of a rule set.
+
+    Rules that will never have any effect on the output (for example an output key
+    with a list or None as value) are left out of the plan. Nested rule sets are
+    compiled into sub plans, as are the rule dicts in the arguments of the
+    `$from_list`, `$first_item_from_list`, `$to_list_dynamic` and `$join_key_value`
+    commands. All plans compiled from the same root rule set share a store of plans
+    by rule dict, so that asking for the plan of a nested rule dict (as done by the
+    dataclass processor and these commands) does not compile it again.
+
+    Args:
+        rules (RulesDict): The rule set to compile.
+        ignored_keys (tuple[str, ...]): Keys of the rule set that are not compiled
+            (for example the `list_field_name` argument of `$from_list`).
+
+    Attributes:
+        rules (RulesDict): The rule set the plan was compiled from.
+        compiled_rules (tuple[CompiledRule, ...]): The compiled rules in order.
+        generated_functions (dict): Functions generated from the plan by the code
+            generation backend (see `record_convertor.codegen`).
+        read_sets (dict): Fields of the input record read by the plan (see
+            `record_convertor.projection`).
+        path_trie (PathTrie, optional): Trie of the field paths read by the rules
+            from `path_trie_position` on, including the rules of nested rule sets.
+            None if these rules have no field paths or change the input record.
+        path_trie_position (int): Index of the compiled rule before which the values
+            of the field paths are extracted with the path trie.
+    """
+
+    def __init__(
+        self,
+        rules: RulesDict,
+        ignored_keys: tuple[str, ...] = (),
+        _plans: Optional[_PlanStore] = None,
+    ):
+        self.rules: RulesDict = rules or {}
+        # plans by id of their rule dict and ignored keys. As every plan holds a
+        # reference to its own rule dict the id can not be reused while the plan is
+        # in the store.
+        self._plans: _PlanStore = _PlanStore() if _plans is None else _plans
+        self._plans[(id(self.rules), ignored_keys)] = self
+        self.generated_functions: dict[Any, Any] = {}
+        self.read_sets: dict[Any, Any] = {}
+        self.compiled_rules: tuple[CompiledRule, ...] = tuple(
+            compiled_rule
+            for rule in self.rules.items()  # type: ignore
+            if rule[0] not in ignored_keys
+            and (compiled_rule := self._compile_rule(*rule)) is not None
+        )
+        self.path_trie_position: int = 0
+        self.path_trie: Optional[PathTrie] = self._compile_path_trie()
+        if _plans is None:
+            self._plans.closed = True
+
+    def __iter__(self) -> Iterator[CompiledRule]:
+        return iter(self.compiled_rules)
+
+    def __len__(self) -> int:
+        return len(self.compiled_rules)
+
+    def plan_for(
+        self, rules: RulesDict, ignored_keys: tuple[str, ...] = ()
+    ) -> "RulePlan":
+        """
+        Returns the plan for the given rule dict. Plans for rule dicts that are part
+        of this rule set are compiled only once, other rule dicts are compiled on
+        every call without being added to the store.
+        """
+        plan = self._plans.get((id(rules), ignored_keys))
+        if plan is not None and plan.rules is rules:
+            return plan
+        if self._plans.closed:
+            return RulePlan(rules, ignored_keys)
+        return RulePlan(rules, ignored_keys, _plans=self._plans)
+
+    def _compile_rule(self, rule_key: str, rule_value: Any) -> Optional[CompiledRule]:
+        """
+        Classifies a single rule. The order of the checks determines the precedence
+        of the rule kinds (a `$skip_convert` key is a skip rule for example).
+        """
+        if is_skip_rule(rule_key):
+            return CompiledRule(RuleKind.SKIP, rule_key, rule_value)
+
+        if is_convert_field_rule(rule_key):
+            return CompiledRule(RuleKind.FIELD_CONVERT, rule_key, rule_value)
+
+        if is_format_date_rule(rule_key):
+            return CompiledRule(RuleKind.DATE_FORMAT, rule_key, rule_value)
+
+        if is_dataclass_rule(rule_key):
+            self._compile_dataclass_rules(rule_value)
+            return CompiledRule(RuleKind.DATACLASS, rule_key, rule_value)
+
+        if is_command_rule(rule_key):
+            self._compile_command_rules(rule_key, rule_value)
+            return CompiledRule(RuleKind.COMMAND, rule_key, rule_value)
+
+        if isinstance(rule_value, dict):
+            return CompiledRule(
+                RuleKind.NESTED, rule_key, rule_value, self.plan_for(rule_value)
+            )
+
+        if isinstance(rule_value, str):
+            return CompiledRule(RuleKind.PATH_COPY, rule_key, rule_value)
+
+        return None
+
+    def _compile_path_trie(self) -> Optional[PathTrie]:
+        """
+        Returns the trie of the field paths read after the last rule that changes the
+        input record, or None if a later rule can change the input record as well.
+        """
+        for index, compiled_rule in enumerate(self.compiled_rules):
+            if compiled_rule.kind in (RuleKind.FIELD_CONVERT, RuleKind.DATE_FORMAT):
+                self.path_trie_position = index + 1
+        compiled_rules = self.compiled_rules[self.path_trie_position :]
+        if any(_changes_record(compiled_rule.rule) for compiled_rule in compiled_rules):
+            return None
+        path_trie = PathTrie(_field_paths(compiled_rules))
+        return path_trie if len(path_trie) else None
+
+    def _compile_dataclass_rules(self, dataclass_rule: Any) -> None:
+        """
+        Compiles the rule dicts used by the dataclass processor to create the
+        dataclass arguments and the arguments for the dataclass methods.
+        """
+        if not isinstance(dataclass_rule, dict):
+            return
+
+        params = dataclass_rule.get(DataClassRuleKeys.RECORD_CONVERSION_ARGUMENTS)
+        if isinstance(params, dict):
+            self.plan_for(params)
+
+        for method_dict in dataclass_rule.get(DataClassRuleKeys.METHODS) or []:
+            if not isinstance(method_dict, dict):
+                continue
+            for method_argument_rules in method_dict.values():
+                if isinstance(method_argument_rules, dict):
+                    self.plan_for(method_argument_rules)
+
+    def _compile_command_rules(self, command: str, arguments: Any) -> None:
+        """
+        Compiles the rule dicts in the arguments of commands that convert (items of)
+        the record with a nested rule set.
+        """
+        if command in (CommandRuleKeys.FROM_LIST, CommandRuleKeys.FIRST_ITEM_FROM_LIST):
+            if isinstance(arguments, dict):
+                self.plan_for(arguments, LIST_ITEM_IGNORED_KEYS)
+        elif command == CommandRuleKeys.TO_LIST_DYNAMIC:
+            for rules in arguments if isinstance(arguments, list) else []:
+                if isinstance(rules, dict):
+                    self.plan_for(rules)
+        elif command == CommandRuleKeys.JOIN_KEY_VALUE:
+            if isinstance(arguments, dict):
+                for key in (CommandRuleKeys.KEY, CommandRuleKeys.VALUE):
+                    if isinstance(arguments.get(key), dict):
+                        self.plan_for(arguments[key])
+
+
+def _changes_record(rules: Any) -> bool:
+    """Returns True if the (nested) rules have a rule that changes the input record."""
+    if isinstance(rules, dict):
+        return any(
+            (
+                isinstance(key, str)
+                and (is_convert_field_rule(key) or is_format_date_rule(key))
+            )
+            or _changes_record(value)
+            for key, value in rules.items()
+        )
+    if isinstance(rules, list):
+        return any(_changes_record(value) for value in rules)
+    return False
+
+
+def _field_paths(compiled_rules: Iterable[CompiledRule]) -> Iterator[str]:
+    """
+    Yields the field paths read from the record by path copies, commands and the
+    nested rule sets (which convert the same record).
+    """
+    for compiled_rule in compiled_rules:
+        if compiled_rule.kind == RuleKind.PATH_COPY:
+            yield compiled_rule.rule
+        elif compiled_rule.kind == RuleKind.NESTED:
+            yield from _field_paths(compiled_rule.sub_plan)  # type: ignore[arg-type]
+        elif compiled_rule.kind == RuleKind.COMMAND:
+            yield from command_field_paths(compiled_rule.key, compiled_rule.rule) or []
+
+
+def compile_rules(rules: RulesDict) -> RulePlan:
+    """
+    Compiles a rule set into a `RulePlan`.
+
+    Args:
+        rules (RulesDict): The rule set as provided by one of the rule generators.
+
+    Returns:
+        RulePlan: The compiled plan.
+    """
+    return RulePlan(rules)
+
+
+class PlanRegistry:
+    """
+    Process-wide store of plans by the content of their rule set.
+
+    Rule sets with the same content (same keys and values in the same order) get the
+    same plan. A plan is compiled when its rule set is first asked for, from a deep
+    copy of the rule set, so later changes to the rule dict of the caller do not
+    affect the shared plan. Rule sets with values other than plain data (strings,
+    numbers, booleans, None, dates, lists and dicts of these) are not shared and are
+    compiled for every call.
+
+    Plans can be preloaded, for example before forking worker processes so that all
+    workers share the memory of the plans.
+    """
+
+    __slots__ = ("_plans", "_lock")
+
+    def __init__(self) -> None:
+        self._plans: dict[bytes, RulePlan] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def plan(self, rules: RulesDict) -> RulePlan:
+        """
+        Returns the shared plan for the content of the rule set, compiling it on
+        first use.
+
+        Args:
+            rules (RulesDict): The rule set.
+
+        Returns:
+            RulePlan: The plan, shared with all callers with the same rule content.
+        """
+        key = _content_key(rules or {})
+        if key is None:
+            return RulePlan(rules)
+        plan = self._plans.get(key)
+        if plan is None:
+            with self._lock:
+                plan = self._plans.get(key)
+                if plan is None:
+                    plan = self._plans[key] = RulePlan(deepcopy(rules))
+        return plan
+
+    def preload(self, rule_sets: Iterable[RulesDict]) -> None:
+        """Compiles the plans of the rule sets that are not in the registry yet."""
+        for rules in rule_sets:
+            self.plan(rules)
+
+    def clear(self) -> None:
+        """Removes all plans from the registry."""
+        with self._lock:
+            self._plans.clear()
+
+
+# the registry used by record convertors with `SHARE_PLANS` set
+PLAN_REGISTRY = PlanRegistry()
+
+
+def _content_key(rules: RulesDict) -> Optional[bytes]:
+    """
+    Returns a digest of the content of the rule set, or None if the rule set has
+    values that are not plain data. The repr of plain data is unique for its content
+    and keeps the order of the rules.
+    """
+    if not _is_plain_data(rules):
+        return None
+    return hashlib.blake2b(repr(rules).encode("utf-8", "surrogatepass")).digest()
+
+
+def _is_plain_data(value: Any) -> bool:
+    value_type = type(value)
+    if value_type is dict:
+        return all(
+            _is_plain_data(key) and _is_plain_data(item) for key, item in value.items()
+        )
+    if value_type is list or value_type is tuple:
+        return all(_is_plain_data(item) for item in value)
+    return value_type in PLAIN_DATA_TYPES
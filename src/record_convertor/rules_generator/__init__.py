@@ -1,2 +1,3 @@
 from .from_dict import RulesFromDict  # NOQA
 from .from_yaml import RulesFromYAML  # NOQA
+from .rule_file_cache import RuleFileCache  # NOQA
@@ -1,16 +1,18 @@
 """
 Module to provide a YAML reader including validation.
 
+The YAML files are parsed with the libyaml based `CSafeLoader` when libyaml is
+available. Set `CACHE_DIRECTORY` to keep the parsed rules in an on-disk cache (see
+`rule_file_cache`), so unchanged rule files are not parsed again by later processes.
+
 Classes:
     RulesFromYAML: Creates a rule dictionary from a YAML file.
 """
 
-from typing import Dict, Union
-
-import yaml
-from yaml.scanner import ScannerError
+from typing import Any, Dict, Optional, Union
 
 from ..package_settings import RulesDict
+from .rule_file_cache import RuleFileCache
 
 
 class RulesFromYAML:
@@ -23,6 +25,8 @@ class RulesFromYAML:
 
     Attributes:
         RULE_SOURCE_TYPE (str): Type hint for the rule source file name.
+        CACHE_DIRECTORY (str, optional): Directory of the on-disk cache of parsed
+            rule files. The cache is not used when None (default).
 
     Parameters:
         rule_source (RULE_SOURCE_TYPE): The filename, including path, of the YAML file.
@@ -36,6 +40,7 @@ class RulesFromYAML:
     """
 
     RULE_SOURCE_TYPE = str
+    CACHE_DIRECTORY: Optional[str] = None
 
     def __init__(self, rule_source: Union[str, dict]):
         """
@@ -83,9 +88,16 @@ class RulesFromYAML:
         attribute and convert it into a dictionary. If the YAML file cannot be
         parsed, the _error attribute is set with the error message.
         """
+        # imported on first use to keep the import of the package fast
+        from yaml.scanner import ScannerError
+
         try:
-            with open(self._rule_source, "r") as file:
-                self._dict = yaml.load(file, Loader=yaml.FullLoader)
+            if self.CACHE_DIRECTORY is None:
+                with open(self._rule_source, "rb") as file:
+                    self._dict = _parse_yaml(file.read())
+            else:
+                cache = RuleFileCache(self.CACHE_DIRECTORY)
+                self._dict = cache.load(self._rule_source, parse=_parse_yaml)
         except ScannerError as error:
             self._error = str(error)
 
@@ -100,3 +112,10 @@ class RulesFromYAML:
             str: The filename of the YAML source file.
         """
         return self._rule_source
+
+
+def _parse_yaml(content: bytes) -> Any:
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
@@ -0,0 +1,130 @@
+"""
+Module to provide an on-disk cache of the rules parsed from rule files.
+
+Loading a pickled copy of the rules is much faster than parsing a YAML rule file.
+The cache stores the rules of a rule file together with the modification time, size
+and content hash of the file:
+
+- if the modification time and size of the file are unchanged, the cached rules are
+  returned without reading the file;
+- otherwise the file is read and its content hash is compared, so a file that is
+  touched or copied without changes is not parsed again.
+
+Cache entries are written atomically, so several processes can share a cache
+directory. Loading a pickle can execute code: the cache directory must be as trusted
+as the rule files themselves.
+
+Classes:
+    RuleFileCache
+
+usage:
+>>> cache = RuleFileCache("/var/cache/record_convertor")
+>>> rules = cache.load("rules.yaml", parse=parse_yaml)
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+__all__ = ["RuleFileCache"]
+
+# increase when the layout of a cache entry changes
+CACHE_FORMAT_VERSION = 1
+
+# a file modified this recently can be modified again without a change of its
+# modification time, so it is checked by content hash on the next load
+RACY_INTERVAL_NS = 2_000_000_000
+
+# modification time stored for files that are always checked by content hash
+UNTRUSTED_MTIME = -1
+
+
+class RuleFileCache:
+    """
+    Cache of the rules parsed from rule files, stored as pickle files in a directory.
+
+    Args:
+        directory (str | os.PathLike): The cache directory, created on first write.
+    """
+
+    __slots__ = ("_directory",)
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        self._directory = Path(directory)
+
+    def load(
+        self, filename: Union[str, os.PathLike], parse: Callable[[bytes], Any]
+    ) -> Any:
+        """
+        Returns the rules of a rule file, from the cache if the file is unchanged.
+
+        Args:
+            filename (str | os.PathLike): The rule file.
+            parse (Callable): Parses the content of the rule file into rules. Errors
+                raised by `parse` are not caught and nothing is cached for the file.
+
+        Returns:
+            The rules returned by `parse` for the current content of the file.
+
+        Raises:
+            FileNotFoundError: If the rule file does not exist.
+        """
+        path = Path(filename).resolve()
+        file_stat = path.stat()
+        entry_path = self._entry_path(path)
+        entry = _read_entry(entry_path)
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if entry is not None and entry[1:3] == file_key:
+            return entry[4]
+
+        content = path.read_bytes()
+        digest = hashlib.blake2b(content).hexdigest()
+        if entry is not None and entry[3] == digest:
+            rules = entry[4]
+        else:
+            rules = parse(content)
+
+        mtime_ns = file_stat.st_mtime_ns
+        if time.time_ns() - mtime_ns < RACY_INTERVAL_NS:
+            mtime_ns = UNTRUSTED_MTIME
+        entry = (CACHE_FORMAT_VERSION, mtime_ns, len(content), digest, rules)
+        self._write_entry(entry_path, entry)
+        return rules
+
+    def _entry_path(self, path: Path) -> Path:
+        name = hashlib.blake2b(str(path).encode(), digest_size=16).hexdigest()
+        return self._directory / f"{name}.pickle"
+
+    def _write_entry(self, entry_path: Path, entry: tuple) -> None:
+        # the cache only speeds up loading, failing to write it is not an error
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temporary_name = tempfile.mkstemp(
+                dir=self._directory, suffix=".tmp"
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_name, entry_path)
+        except OSError:
+            with suppress(OSError):
+                os.unlink(temporary_name)
+
+
+def _read_entry(entry_path: Path) -> Optional[tuple]:
+    try:
+        with open(entry_path, "rb") as file:
+            entry = pickle.load(file)
+    except Exception:
+        # a missing or damaged entry is (re)written after parsing the rule file
+        return None
+    if not isinstance(entry, tuple) or entry[:1] != (CACHE_FORMAT_VERSION,):
+        return None
+    return entry
@@ -0,0 +1,207 @@
+"""Tests for the `record-convertor` command."""
+
+import gzip
+import io
+import json
+
+import pytest
+
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.cli import convert_ndjson, main
+
+RULES_YAML = """
+name: item.name
+$skip:
+  fieldname: status
+  condition:
+    equals: deleted
+"""
+
+RECORDS = [
+    {"item": {"name": "chair"}},
+    {"status": "deleted"},
+    {"item": {"name": "café"}},
+]
+
+NDJSON = "".join(json.dumps(record) + "\n" for record in RECORDS).encode()
+
+
+class CountingWrites(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+@pytest.fixture
+def rule_file(tmp_path):
+    rule_file = tmp_path / "rules.yaml"
+    rule_file.write_text(RULES_YAML)
+    return str(rule_file)
+
+
+def output_records(data: bytes) -> list:
+    return [json.loads(line) for line in data.decode().splitlines()]
+
+
+def test_convert_file(tmp_path, rule_file):
+    input_file = tmp_path / "input.ndjson"
+    input_file.write_bytes(NDJSON)
+    output_file = tmp_path / "output.ndjson"
+
+    assert main(["-r", rule_file, str(input_file), "-o", str(output_file)]) == 0
+    assert output_records(output_file.read_bytes()) == [
+        {"name": "chair"},
+        {"name": "café"},
+    ]
+
+
+def test_convert_gzip_files(tmp_path, rule_file):
+    input_file = tmp_path / "input.ndjson.gz"
+    input_file.write_bytes(gzip.compress(NDJSON))
+    output_file = tmp_path / "output.ndjson.gz"
+
+    arguments = ["-r", rule_file, str(input_file), str(input_file)]
+    assert main(arguments + ["-o", str(output_file), "--skipped", "none"]) == 0
+    converted_records = [{"name": "chair"}, None, {"name": "café"}]
+    assert output_records(gzip.decompress(output_file.read_bytes())) == (
+        converted_records * 2
+    )
+
+
+def test_convert_stdin_to_stdout(rule_file, monkeypatch):
+    stdout = io.TextIOWrapper(io.BytesIO())
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(NDJSON)))
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    assert main(["-r", rule_file, "--skipped", "default"]) == 0
+    assert output_records(stdout.buffer.getvalue()) == [
+        {"name": "chair"},
+        {},
+        {"name": "café"},
+    ]
+
+
+def test_stdin_is_not_closed(rule_file, tmp_path, monkeypatch):
+    stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(NDJSON)))
+    monkeypatch.setattr("sys.stdin", stdin)
+    input_file = tmp_path / "input.ndjson"
+    input_file.write_bytes(NDJSON)
+    output_file = str(tmp_path / "output.ndjson")
+
+    assert main(["-r", rule_file, "-", str(input_file), "-o", output_file]) == 0
+    assert not stdin.buffer.closed
+
+
+def test_convert_with_workers(tmp_path, rule_file):
+    input_file = tmp_path / "input.ndjson"
+    input_file.write_bytes(NDJSON * 10)
+    output_file = tmp_path / "output.ndjson"
+
+    arguments = ["-r", rule_file, str(input_file), "-o", str(output_file)]
+    assert main(arguments + ["--workers", "2", "--chunksize", "4"]) == 0
+    assert (
+        output_records(output_file.read_bytes())
+        == [
+            {"name": "chair"},
+            {"name": "café"},
+        ]
+        * 10
+    )
+
+
+def test_progress_is_reported(tmp_path, rule_file, capsys):
+    input_file = tmp_path / "input.ndjson"
+    input_file.write_bytes(NDJSON)
+
+    arguments = ["-r", rule_file, str(input_file), "-o", str(tmp_path / "out")]
+    assert main(arguments + ["--progress"]) == 0
+    assert "read 3 records, wrote 2 records" in capsys.readouterr().err
+
+
+def test_invalid_input_line(tmp_path, rule_file, capsys):
+    input_file = tmp_path / "input.ndjson"
+    input_file.write_bytes(NDJSON + b"\n{invalid\n")
+
+    arguments = ["-r", rule_file, str(input_file), "-o", str(tmp_path / "out")]
+    assert main(arguments) == 1
+    assert "input.ndjson:5: invalid JSON" in capsys.readouterr().err
+
+
+def test_missing_rule_file(capsys):
+    assert main(["-r", "/nonexistent/rules.yaml"]) == 1
+    assert "No such file" in capsys.readouterr().err
+
+
+def test_malformed_rule_file(tmp_path, capsys):
+    rule_file = tmp_path / "rules.yaml"
+    rule_file.write_text("name: [item.name\n")
+    assert main(["-r", str(rule_file)]) == 1
+    assert capsys.readouterr().err.startswith("record-convertor: ")
+
+
+def test_unwritable_output_file(tmp_path, rule_file, capsys):
+    output_file = str(tmp_path / "missing" / "output.ndjson")
+    assert main(["-r", rule_file, "-o", output_file]) == 1
+    assert "No such file" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "convertor_class",
+    ["not_a_module:RecordConvertor", "record_convertor:NotAClass", "record_convertor"],
+)
+def test_invalid_convertor_class(rule_file, capsys, convertor_class):
+    assert main(["-r", rule_file, "--convertor-class", convertor_class]) == 1
+    assert "can not import convertor class" in capsys.readouterr().err
+
+
+def test_records_are_written_in_batches():
+    record_convertor = RecordConvertorWithRulesDict(rule_dict={"name": "item.name"})
+    output = CountingWrites()
+    stats = convert_ndjson(
+        record_convertor.convert_many,
+        [io.BytesIO(NDJSON), io.BytesIO(NDJSON)],
+        output,
+        batch_size=4,
+    )
+    assert (stats.records_read, stats.records_written) == (6, 6)
+    assert output.writes == 2
+    assert len(output_records(output.getvalue())) == 6
+
+
+def test_convert_file_in_shards(tmp_path, rule_file, capsys):
+    input_file = tmp_path / "input.ndjson"
+    input_file.write_bytes(NDJSON * 10)
+    shard_output = str(tmp_path / "out-{shard:02d}.ndjson")
+
+    arguments = ["-r", rule_file, str(input_file), "--shard-size", "100"]
+    assert main(arguments + ["--shard-output", shard_output, "--progress"]) == 0
+    shard_files = sorted(tmp_path.glob("out-*.ndjson"))
+    assert len(shard_files) > 1
+    converted_records = [
+        record
+        for shard_file in shard_files
+        for record in output_records(shard_file.read_bytes())
+    ]
+    assert converted_records == [{"name": "chair"}, {"name": "café"}] * 10
+    assert "read 30 records, wrote 20 records" in capsys.readouterr().err
+
+
+def test_invalid_line_in_shard(tmp_path, rule_file, capsys):
+    input_file = tmp_path / "input.ndjson"
+    input_file.write_bytes(NDJSON * 10 + b"[]\n")
+
+    arguments = ["-r", rule_file, str(input_file), "-o", str(tmp_path / "out")]
+    assert main(arguments + ["--workers", "2", "--shard-size", "100"]) == 1
+    assert "input.ndjson:31: not a JSON object" in capsys.readouterr().err
+
+
+def test_shard_output_needs_uncompressed_file(tmp_path, rule_file):
+    input_file = tmp_path / "input.ndjson.gz"
+    input_file.write_bytes(gzip.compress(NDJSON))
+
+    with pytest.raises(SystemExit):
+        main(["-r", rule_file, str(input_file), "--shard-output", "{shard}.ndjson"])
@@ -0,0 +1,178 @@
+"""Tests for generating convert functions from a RulePlan."""
+
+from copy import deepcopy
+
+import pytest
+
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.codegen import (
+    generate_convert_function,
+    generated_convert_function,
+)
+from record_convertor.command_processor import ProcessCommand
+from record_convertor.rules_compiler import SKIPPED, compile_rules
+
+RECORDS = [
+    {
+        "id": 1,
+        "Name": "First",
+        "status": "active",
+        "item": {"brand": {"name": "Brand", "country": "NL"}, "zero": 0},
+        "geo": {"lat": "52.123456", "lon": "4.5"},
+        "tags": ["a", "b"],
+        "list": [{"key": "in list"}],
+        'with"quote': "quote",
+        "date": "21-02-2021",
+    },
+    {"id": 2, "status": "inactive", "item": "not a dict", "geo": {"lat": "x"}},
+    {"id": 3, "item": {"brand": None}, "tag1": "t1", "tag3": "", "date": None},
+    {},
+]
+
+RULES = [
+    {"id": "id", "name": "Name", "brand": "item.brand.name", "zero": "item.zero"},
+    {"not_a_dict": "item.brand.name.deeper", "list": "list.key", "empty": ""},
+    {"quoted": 'with"quote', "legacy": "item__brand__name"},
+    {"brand": {"name": "item.brand.name", "country": {"code": "item.brand.country"}}},
+    {"label": {"$join": ["$seperator ", "item.brand.name", "$-", "id"]}},
+    {"label": {"$join": ["Name", "item.brand.country"]}},
+    {"location": {"$point": {"lat": "geo.lat", "lon": "geo.lon"}}},
+    {"tags": {"$to_list": ["tag1", "tag2", "tag3", "id"]}},
+    {"source": {"$fixed_value": {"name": "feed"}}, "nothing": {"$fixed_value": None}},
+    {"result": {"ignored": "id", "$join": ["id", "Name"], "after": "id"}},
+    {"nested": {"$to_list_dynamic": [{"id": "id"}]}},
+    {"nested": {"$from_list": {"list_field_name": "list", "value": "key"}}},
+    {"nested": {"$split_field": {"field_name": "Name", "seperator": "i", "index": 0}}},
+    {"nested": {"$SKIP": {"fieldname": "id", "condition": {"equals": 2}}, "id": "id"}},
+    {
+        "$SKIP": {"fieldname": "status", "condition": {"equals": "inactive"}},
+        "$convert1": {"fieldname": "Name", "actions": [{"to_upper_str": None}]},
+        "$format_date": {"date_field": "date", "format": "DD-MM-YYYY"},
+        "name": "Name",
+        "date": "date",
+    },
+    {"empty_nested": {}, "empty_join": {"$join": []}},
+]
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    DEFAULT_VALUE = {"skipped": True}
+
+
+class GeneratedRecordConvertorTest(RecordConvertorTest):
+    GENERATE_CODE = True
+
+
+def convert_all(convertor_class, rules, keys_in_lower_case=False):
+    class RecordConvertor(convertor_class):
+        KEYS_IN_LOWER_CASE = keys_in_lower_case
+
+    record_convertor = RecordConvertor(rule_dict=rules)
+    results = []
+    for record in deepcopy(RECORDS):
+        try:
+            results.append(record_convertor.convert(record))
+        except Exception as exception:
+            results.append(type(exception))
+    return results
+
+
+@pytest.mark.parametrize("keys_in_lower_case", [False, True])
+@pytest.mark.parametrize("rules", RULES)
+def test_generated_function_gives_same_result_as_plan(rules, keys_in_lower_case):
+    assert convert_all(
+        GeneratedRecordConvertorTest, rules, keys_in_lower_case
+    ) == convert_all(RecordConvertorTest, rules, keys_in_lower_case)
+
+
+def test_generated_source_writes_out_path_copies_and_commands():
+    rules = {"id": "id", "label": {"$join": ["id", "$_", "Name"]}}
+    source = generate_convert_function(compile_rules(rules)).source  # type: ignore
+    assert "record.get('id')" in source
+    assert "'_'" in source
+    assert "$join" not in source
+
+
+def test_unsupported_nested_rule_set_is_converted_by_the_record_convertor():
+    rules = {"nested": {"$from_list": {"list_field_name": "list", "key": "key"}}}
+    source = generate_convert_function(compile_rules(rules)).source  # type: ignore
+    assert "record_convertor._convert_nested(" in source
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        {"$dataclass": {"data_class_name": "test", "params": {}}},
+        {"$join": ["id"]},
+    ],
+)
+def test_plan_with_top_level_dataclass_or_command_is_not_generated(rules):
+    assert generate_convert_function(compile_rules(rules)) is None
+
+
+def test_generated_function_returns_skipped_marker():
+    rules = {"$SKIP": {"fieldname": "id", "condition": {"equals": 2}}, "id": "id"}
+    function = generated_convert_function(compile_rules(rules))
+    record_convertor = RecordConvertorTest(rule_dict=rules)
+    assert function(record_convertor, {"id": 2}) is SKIPPED  # type: ignore
+
+
+def test_generated_function_is_stored_with_the_plan():
+    plan = compile_rules({"id": "id"})
+    function = generated_convert_function(plan)
+    assert function is not None
+    assert generated_convert_function(plan) is function
+    assert generated_convert_function(plan, keys_in_lower_case=True) is not function
+
+
+def test_commands_of_custom_command_class_are_not_generated():
+    class CommandClass(ProcessCommand):
+        def join(self):
+            return "custom join"
+
+    rules = {"label": {"$join": ["id"]}, "tags": {"$to_list": ["id"]}}
+    source = generate_convert_function(  # type: ignore
+        compile_rules(rules), command_class=CommandClass
+    ).source
+    assert "_convert_nested(" in source
+    assert "filter(None" in source
+
+    record_convertor = GeneratedRecordConvertorTest(
+        rule_dict=rules, command_class=CommandClass
+    )
+    assert record_convertor.convert({"id": 1}) == {
+        "label": "custom join",
+        "tags": [1],
+    }
+
+
+def test_record_convertor_with_custom_get_field_is_not_generated():
+    class RecordConvertor(GeneratedRecordConvertorTest):
+        def _get_field(self, key, record):
+            return super()._get_field(key, record) or "default"
+
+    rules = {"id": "id", "name": "Name"}
+    plan = compile_rules(rules)
+    assert generated_convert_function(plan, custom_get_field=True) is None
+    assert generated_convert_function(plan) is not None
+
+    record_convertor = RecordConvertor(rule_dict=rules)
+    assert record_convertor.convert({"id": 1}) == {"id": 1, "name": "default"}
+
+
+def test_new_rules_are_generated_again():
+    record_convertor = GeneratedRecordConvertorTest(rule_dict={"id": "id"})
+    assert record_convertor.convert({"id": 1, "other": 2}) == {"id": 1}
+    record_convertor._rules = {"other": "other"}  # type: ignore
+    assert record_convertor.convert({"id": 1, "other": 2}) == {"other": 2}
+
+
+def test_registered_commands_of_custom_command_class_are_not_generated():
+    class CommandClass(ProcessCommand):
+        pass
+
+    CommandClass.register_command("join", lambda command: "registered join")
+    record_convertor = GeneratedRecordConvertorTest(
+        rule_dict={"label": {"$join": ["id"]}}, command_class=CommandClass
+    )
+    assert record_convertor.convert({"id": 1}) == {"label": "registered join"}
@@ -0,0 +1,85 @@
+"""Tests that compiled conditions give the same result as evaluating conditions."""
+
+from datetime import datetime
+
+import pytest
+from record_convertor.package_settings import EvaluateConditions
+
+TODAY = datetime.today().strftime("%Y-%m-%d")
+
+VALUES = [None, "", "a string", "item1", 0, 1, 1.0, True, 8, TODAY, ["item1"], {}]
+
+CONDITIONS = [
+    {},
+    {"is_a_string": None},
+    {"is_not_a_string": None},
+    {"date_not_today": None},
+    {"str_length": 8},
+    {"field_does_not_exist": None},
+    {"field_does_exist": None},
+    {"is_null": True},
+    {"is_null": False},
+    {"equals": "a string"},
+    {"equals": 1},
+    {"does_not_equal": 1},
+    {"in_list": ["item1", 1, None]},
+    {"in_list": [["item1"], "item1"]},
+    {"in_list": "item1"},
+    {"not_in_list": ["item1", 1, None]},
+    {"not_in_list": [{}, "item1"]},
+    {"not_in_list": "item1"},
+    {"contains": "item1"},
+    {"contains": "str"},
+    {"does_not_contain": "item1"},
+    {"is_a_string": None, "str_length": 8},
+    {"field_does_exist": None, "in_list": ["item1", 8]},
+]
+
+
+def evaluate(conditions, value):
+    try:
+        return EvaluateConditions(conditions, value).evaluate()
+    except Exception as exception:
+        return type(exception)
+
+
+def compiled(conditions, value):
+    try:
+        return EvaluateConditions.compile(conditions)(value)
+    except Exception as exception:
+        return type(exception)
+
+
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("conditions", CONDITIONS)
+def test_compiled_conditions_give_same_result_as_evaluate(conditions, value):
+    assert compiled(conditions, value) == evaluate(conditions, value)
+
+
+@pytest.mark.parametrize(
+    "conditions, exception",
+    [
+        ({"contains": None}, ValueError),
+        ({"does_not_contain": None}, ValueError),
+        ({"not_existing": None}, NotImplementedError),
+        ({"is_a_string": None, "not_existing": None}, NotImplementedError),
+    ],
+)
+def test_compiled_conditions_raise_when_called(conditions, exception):
+    predicate = EvaluateConditions.compile(conditions)
+    with pytest.raises(exception):
+        predicate("a string")
+
+
+def test_compiled_conditions_without_conditions_are_true():
+    assert EvaluateConditions.compile(None)("value")
+
+
+def test_compiled_conditions_of_subclass_use_evaluate():
+    class CustomConditions(EvaluateConditions):
+        def is_custom(self) -> bool:
+            return self.value == "custom"
+
+    predicate = CustomConditions.compile({"is_custom": None, "is_a_string": None})
+    assert predicate("custom")
+    assert not predicate("other")
@@ -102,56 +102,50 @@ def test_register_dict_of_data_classes_method():
     assert getattr(data_class_processor, "datackasstwo") is DataClassTestTwo  # noqa: B009, E501
 
 
-def test_dataclass_name_setter_method():
+def test_dataclass_name_getter_method():
     data_class_processor = DataClassProcessor()
     data_class_processor.register_dataclass(DataClassTest)
     rule = deepcopy(base_data_class_rule)
     rule[DataClassRuleKeys.NAME] = "data_class_test"
-    data_class_processor._set_dataclass_to_use(rule)
 
-    assert data_class_processor._dataclass_to_be_used is DataClassTest
+    assert data_class_processor._get_dataclass_to_use(rule) is DataClassTest
 
 
-def test_dataclass_name_setter_raises_value_error_when_dataclass_name_not_known():
+def test_dataclass_name_getter_raises_value_error_when_dataclass_name_not_known():
     data_class_processor = DataClassProcessor()
     with pytest.raises(ValueError):
-        data_class_processor._set_dataclass_to_use(base_data_class_rule)
+        data_class_processor._get_dataclass_to_use(base_data_class_rule)
 
 
-def test_dataclass_set_record_convertor_arguments_method():
+def test_dataclass_get_record_convertor_arguments_method():
     data_class_processor = DataClassProcessor()
-    data_class_processor._set_record_covertor_arguments(base_data_class_rule)
     assert (
-        data_class_processor._record_convertor_args
+        data_class_processor._get_record_covertor_arguments(base_data_class_rule)
         == base_data_class_rule[DataClassRuleKeys.RECORD_CONVERSION_ARGUMENTS]
     )
 
 
-def test_dataclass_set_dataclass_methods_method():
+def test_dataclass_get_dataclass_methods_method():
     data_class_processor = DataClassProcessor()
-    data_class_processor._set_dataclass_methods(base_data_class_rule)
     assert (
-        data_class_processor._data_class_methods
+        data_class_processor._get_dataclass_methods(base_data_class_rule)
         == base_data_class_rule[DataClassRuleKeys.METHODS]
     )
 
 
-def test_prepare_data_class_settings_method():
-    """Test that all relevant attributes are set to run the processing the dataclass"""
+def test_get_data_class_settings_method():
+    """Test that all relevant settings are returned to run the processing"""
     data_class_processor = DataClassProcessor()
     data_class_processor.register_dataclass(DataClassTest)
     rule = deepcopy(base_data_class_rule)
     rule[DataClassRuleKeys.NAME] = "data_class_test"
-    data_class_processor._prepare_dataclass_settings(rule)
-    assert data_class_processor._dataclass_to_be_used is DataClassTest
+    settings = data_class_processor._get_dataclass_settings(rule)
+    assert settings.dataclass is DataClassTest
     assert (
-        data_class_processor._record_convertor_args
+        settings.record_convertor_args
         == base_data_class_rule[DataClassRuleKeys.RECORD_CONVERSION_ARGUMENTS]
     )
-    assert (
-        data_class_processor._data_class_methods
-        == base_data_class_rule[DataClassRuleKeys.METHODS]
-    )
+    assert settings.methods == base_data_class_rule[DataClassRuleKeys.METHODS]
 
 
 def test_data_class_return_without_method():
@@ -0,0 +1,81 @@
+"""Module to test compiling the actions of a conversion rule into a pipeline"""
+
+import pytest
+from record_convertor.field_convertors import BaseFieldConvertor
+from record_convertor.field_convertors.base_convertor.base_convertor_helpers import (
+    compile_action_pipeline,
+)
+
+RULE = {
+    "fieldname": "name",
+    "actions": [
+        {"to_upper_str": None, "target_field_name": "upper_name"},
+        {"remove": None},
+    ],
+}
+
+
+class FieldConvertorTest(BaseFieldConvertor):
+    @staticmethod
+    def static_action(action_value):
+        return action_value * 2
+
+
+def test_pipeline_resolves_actions_once():
+    pipeline = compile_action_pipeline(BaseFieldConvertor, RULE)
+    assert pipeline.field_name == "name"
+    assert [step.action for step in pipeline.steps] == ["to_upper_str", "remove"]
+    assert pipeline.steps[0].method is BaseFieldConvertor.to_upper_str
+    assert pipeline.steps[0].target_field == "upper_name"
+    assert pipeline.steps[1].target_field is None
+    assert not pipeline.steps[1].sets_field
+
+
+def test_pipeline_leaves_conversion_rule_untouched():
+    rule = {
+        "fieldname": "name",
+        "actions": [{"to_str": None, "target_field_name": "a"}],
+    }
+    BaseFieldConvertor().convert_field({"name": 1}, rule)
+    assert rule["actions"] == [{"to_str": None, "target_field_name": "a"}]
+
+
+def test_pipeline_is_compiled_once_per_conversion_rule():
+    convertor = BaseFieldConvertor()
+    pipeline = convertor._action_pipeline(RULE)
+    assert convertor._action_pipeline(RULE) is pipeline
+    assert convertor._action_pipeline(dict(RULE)) is not pipeline
+
+
+def test_pipeline_runs_actions_in_order():
+    record = BaseFieldConvertor().convert_field({"name": "name"}, RULE)
+    assert record == {"upper_name": "NAME"}
+
+
+def test_pipeline_runs_static_methods():
+    rule = {"fieldname": "name", "actions": [{"static_action": 21}]}
+    assert FieldConvertorTest().convert_field({}, rule) == {"name": 42}
+
+
+def test_unknown_action_raises_not_implemented_error():
+    rule = {"fieldname": "name", "actions": [{"unknown_action": None}]}
+    with pytest.raises(NotImplementedError):
+        BaseFieldConvertor().convert_field({"name": "name"}, rule)
+
+
+def test_container_action_values_are_not_shared_between_records():
+    rule = {"fieldname": "list", "actions": [{"fixed_value": [1, 2]}]}
+    convertor = BaseFieldConvertor()
+    first_record = convertor.convert_field({}, rule)
+    first_record["list"].append(3)
+    assert convertor.convert_field({}, rule) == {"list": [1, 2]}
+    assert rule["actions"] == [{"fixed_value": [1, 2]}]
+
+
+def test_pipeline_uses_overridden_get_field():
+    class FieldConvertorWithDefault(BaseFieldConvertor):
+        def _get_field(self, key, rec=None):
+            return super()._get_field(key, rec) or "default"
+
+    rule = {"fieldname": "name", "actions": [{"to_upper_str": None}]}
+    assert FieldConvertorWithDefault().convert_field({}, rule) == {"name": "DEFAULT"}
@@ -0,0 +1,92 @@
+"""Tests for the command registry of the ProcessCommand class."""
+
+import pytest
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.command_processor import ProcessCommand
+
+
+def run_command(command_class, process_command, process_args, record):
+    return command_class(
+        record=record,
+        process_command=process_command,
+        process_args=process_args,
+        record_convertor=None,
+    ).get_value()
+
+
+def test_registry_contains_the_default_commands():
+    assert ProcessCommand.COMMANDS["join"] is ProcessCommand.join
+    assert "get_value" not in ProcessCommand.COMMANDS
+    assert "_get_field" not in ProcessCommand.COMMANDS
+
+
+@pytest.mark.parametrize("process_command", ["$get_value", "$record", "$_get_field"])
+def test_non_command_attributes_are_not_run_as_command(process_command):
+    with pytest.raises(NotImplementedError):
+        run_command(ProcessCommand, process_command, None, {"field": 1})
+
+
+def test_register_custom_command():
+    class CommandClass(ProcessCommand):
+        pass
+
+    @CommandClass.register_command("$reverse")
+    def reverse(command):
+        return command.get_field(command.process_args["field_name"])[::-1]
+
+    assert run_command(CommandClass, "$reverse", {"field_name": "a"}, {"a": "abc"}) == (
+        "cba"
+    )
+    assert "reverse" not in ProcessCommand.COMMANDS
+
+
+def test_commands_of_subclass_override_base_class():
+    class CommandClass(ProcessCommand):
+        def join(self):
+            return "custom join"
+
+        @staticmethod
+        def static_command():
+            return "static"
+
+    class SubCommandClass(CommandClass):
+        pass
+
+    CommandClass.register_command("registered", lambda command: "registered")
+
+    assert run_command(SubCommandClass, "$join", ["a"], {"a": 1}) == "custom join"
+    assert run_command(SubCommandClass, "$static_command", None, {}) == "static"
+    # commands registered on a base class after a subclass was created
+    assert run_command(SubCommandClass, "$registered", None, {}) == "registered"
+    assert run_command(ProcessCommand, "$join", ["a"], {"a": 1}) == "1"
+
+
+def test_record_convertor_runs_registered_command():
+    class CommandClass(ProcessCommand):
+        pass
+
+    CommandClass.register_command(
+        "upper", lambda command: command.get_field(command.process_args).upper()
+    )
+    record_convertor = RecordConvertorWithRulesDict(
+        rule_dict={"name": {"$upper": "name"}}, command_class=CommandClass
+    )
+    assert record_convertor.convert({"name": "name"}) == {"name": "NAME"}
+
+
+def test_add_process_commands_are_run_for_unknown_commands():
+    class Double:
+        def __init__(self, record, process_args):
+            self.value = record[process_args]
+
+        def convert(self):
+            return self.value * 2
+
+    command = ProcessCommand(
+        record={"a": 2},
+        process_command="$double",
+        process_args="a",
+        record_convertor=None,
+        add_process_commands={"double": Double},
+    )
+    assert command.get_value() == 4
@@ -0,0 +1,64 @@
+"""Tests for the indexed country code lookups and the country conversion actions."""
+
+import pytest
+from record_convertor.field_convertors import BaseFieldConvertor
+from record_convertor.field_convertors.base_convertor.base_convertor_helpers import (
+    alpha_3_from_country_name,
+    alpha_3_from_iso3116_country_code,
+    country_indexes,
+    country_name_from_iso3116_country_code,
+    iso3116_from_alpha_3_country_code,
+    iso3116_from_country_name,
+)
+from record_convertor.field_convertors.base_convertor.base_convertor_helpers.data_files import (  # NOQA: E501
+    ALL_COUNTRY_CODES,
+)
+
+
+@pytest.mark.parametrize("country", ALL_COUNTRY_CODES)
+def test_every_alpha_3_code_is_indexed(country):
+    let2, let3 = country["let2"].strip(), country["let3"].strip()
+    assert iso3116_from_alpha_3_country_code(let3) == let2
+    assert iso3116_from_alpha_3_country_code(let3.lower()) == let2
+    assert alpha_3_from_iso3116_country_code(let2) == let3
+
+
+def test_unknown_codes_and_names_return_empty_string():
+    assert iso3116_from_alpha_3_country_code("XXX") == ""
+    assert alpha_3_from_iso3116_country_code("XX") == ""
+    assert iso3116_from_country_name("Atlantis") == ""
+
+
+def test_name_lookups():
+    assert iso3116_from_country_name(" NETHERLANDS ") == "NL"
+    assert iso3116_from_country_name("netherlands  antilles") == "AN"
+    assert alpha_3_from_country_name("france") == "FRA"
+    assert country_name_from_iso3116_country_code("fr") == "France"
+    # names of more than one country are not indexed
+    assert iso3116_from_country_name("Korea") == ""
+
+
+def test_indexes_are_built_once():
+    assert country_indexes() is country_indexes()
+
+
+@pytest.mark.parametrize(
+    "action, value, expected",
+    [
+        ("alpha3_to_iso3116_cc", "HKG", "HK"),
+        ("iso3116_to_alpha3_cc", "NL", "NLD"),
+        ("country_name_to_iso3116_cc", "Netherlands", "NL"),
+        ("country_name_to_alpha3_cc", "netherlands", "NLD"),
+        ("iso3116_cc_to_country_name", "NL", "Netherlands"),
+    ],
+)
+def test_country_actions(action, value, expected):
+    rule = {"fieldname": "country", "actions": [{action: None}]}
+    converted_record = BaseFieldConvertor().convert_field({"country": value}, rule)  # type: ignore
+    assert converted_record["country"] == expected
+
+
+def test_country_action_on_non_string_raises_type_error():
+    rule = {"fieldname": "country", "actions": [{"iso3116_to_alpha3_cc": None}]}
+    with pytest.raises(TypeError):
+        BaseFieldConvertor().convert_field({"country": 1}, rule)  # type: ignore
@@ -0,0 +1,76 @@
+"""Tests for the AUTO date format."""
+
+import pytest
+from record_convertor.field_convertors import DateFieldConvertor
+from record_convertor.field_convertors.date_detection import (
+    AutoDateFormatter,
+    detect_date_format,
+)
+from record_convertor.package_settings import DateFormatNotDetectedException
+
+AUTO_RULE = {"date_field": "date", "format": "AUTO", "timezone": "UTC"}
+
+
+@pytest.mark.parametrize(
+    "date_str, date_format",
+    [
+        ("21-02-2021", "DD-MM-YYYY"),
+        ("21.02.2021", "DD.MM.YYYY"),
+        ("2021_02_21", "YYYY_MM_DD"),
+        ("2021_02_21:10:30", "YYYY_MM_DD:Time"),
+        ("2021-02-21", "YYYY-MM-DD"),
+        ("2021-02-21T10:30:00+01:00", "ISO_8601"),
+        ("2021-02-21 10:30:00", "ISO_8601"),
+        ("1613902200", "UNIX_DT_STAMP"),
+        ("1613902200000", "UNIX_MS_STAMP"),
+        ("21/02/2021", None),
+        ("12345", None),
+        ("", None),
+    ],
+)
+def test_detect_date_format(date_str, date_format):
+    assert detect_date_format(date_str) == date_format
+
+
+def test_auto_format_converts_mixed_formats_of_a_field():
+    convertor = DateFieldConvertor()
+    dates = ["21-02-2021", "2021-02-21", "1613902200", "22-02-2021", "1613902200000"]
+    assert [
+        convertor.format_date_field({"date": date_str}, AUTO_RULE)["date"]  # type: ignore
+        for date_str in dates
+    ] == ["2021-02-21", "2021-02-21", "2021-02-21", "2021-02-22", "2021-02-21"]
+
+
+def test_auto_format_raises_exception_for_unknown_format():
+    with pytest.raises(DateFormatNotDetectedException):
+        DateFieldConvertor().format_date_field({"date": "21/02/2021"}, AUTO_RULE)  # type: ignore
+
+
+def test_auto_date_formatter_tries_last_format_first():
+    compiled_formats = []
+
+    def formatter_for(date_format):
+        compiled_formats.append(date_format)
+        return lambda date_str: date_format
+
+    formatter = AutoDateFormatter(formatter_for)
+    results = [formatter(date_str) for date_str in ["01-01-2021", "02-01-2021"]]
+    assert results == ["DD-MM-YYYY", "DD-MM-YYYY"]
+    assert formatter("2021-01-01") == "YYYY-MM-DD"
+    assert formatter("03-01-2021") == "DD-MM-YYYY"
+    assert compiled_formats == ["DD-MM-YYYY", "YYYY-MM-DD"]
+
+
+def test_failed_conversion_is_not_learned():
+    def formatter_for(date_format):
+        def format_date(date_str):
+            if date_str == "99-99-9999":
+                raise ValueError
+            return date_format
+
+        return format_date
+
+    formatter = AutoDateFormatter(formatter_for)
+    with pytest.raises(ValueError):
+        formatter("99-99-9999")
+    assert formatter._last == (None, None)
@@ -0,0 +1,71 @@
+"""Tests for the ISO-8601 and epoch formats and the timezone and output format."""
+
+import pytest
+from record_convertor.field_convertors import DateFieldConvertor
+from record_convertor.field_convertors.date_parsers import (
+    compile_output_format,
+    iso_datetime,
+    zone_info,
+)
+from record_convertor.package_settings import TimezoneNotFoundException
+
+
+def format_date(date_str, date_format, **rule_options):
+    rule = {"date_field": "date", "format": date_format, **rule_options}
+    return DateFieldConvertor().format_date_field({"date": date_str}, rule)["date"]
+
+
+@pytest.mark.parametrize(
+    "date_str, date_format, rule_options, expected",
+    [
+        ("2021-02-21T23:30:00+01:00", "ISO_8601", {}, "2021-02-21"),
+        (
+            "2021-02-21T23:30:00Z",
+            "ISO_8601",
+            {"timezone": "Europe/Amsterdam"},
+            "2021-02-22",
+        ),
+        ("2021-02-21T23:30:00-05:00", "ISO_8601", {"timezone": "UTC"}, "2021-02-22"),
+        ("2021-02-21T23:30:00", "ISO_8601", {"timezone": "Asia/Tokyo"}, "2021-02-21"),
+        ("2021-02-21", "ISO_8601", {"output_format": "%d/%m/%Y"}, "21/02/2021"),
+        ("1613950200000", "UNIX_MS_STAMP", {"timezone": "UTC"}, "2021-02-21"),
+        ("1613950200000", "UNIX_MS_STAMP", {"timezone": "Asia/Tokyo"}, "2021-02-22"),
+        ("1613950200", "UNIX_DT_STAMP", {"timezone": "Asia/Tokyo"}, "2021-02-22"),
+        (
+            "1613950200123",
+            "UNIX_MS_STAMP",
+            {"timezone": "UTC", "output_format": "%Y-%m-%dT%H:%M:%S.%f%z"},
+            "2021-02-21T23:30:00.123000+0000",
+        ),
+        ("21-02-2021", "DD-MM-YYYY", {"output_format": "%Y%m%d"}, "20210221"),
+        ("21-02-2021", "DD-MM-YYYY", {"timezone": "Asia/Tokyo"}, "2021-02-21"),
+    ],
+)
+def test_date_formats_with_timezone_and_output_format(
+    date_str, date_format, rule_options, expected
+):
+    assert format_date(date_str, date_format, **rule_options) == expected
+
+
+def test_unknown_timezone_raises_exception():
+    with pytest.raises(TimezoneNotFoundException):
+        format_date("2021-02-21", "ISO_8601", timezone="Not/A_Timezone")
+
+
+def test_invalid_iso_date_raises_value_error():
+    with pytest.raises(ValueError):
+        format_date("21-02-2021", "ISO_8601")
+
+
+def test_timezones_are_cached():
+    assert zone_info("Europe/Amsterdam") is zone_info("Europe/Amsterdam")
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["%Y-%m-%d", "%d/%m/%Y %H:%M:%S", "{%Y}", "%Y%%", "%A %d", "%Y%", "%y"],
+)
+@pytest.mark.parametrize("date_str", ["2021-02-03T04:05:06", "0999-01-01"])
+def test_compiled_output_format_gives_same_result_as_strftime(pattern, date_str):
+    date_time = iso_datetime(date_str)
+    assert compile_output_format(pattern)(date_time) == date_time.strftime(pattern)
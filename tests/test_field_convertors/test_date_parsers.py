@@ -0,0 +1,105 @@
+"""Tests that the fast date parsers give the same result as strptime."""
+
+import pytest
+from record_convertor.field_convertors import DateFieldConvertor
+from record_convertor.field_convertors.date_parsers import (
+    day_month_year_to_iso,
+    timestamp_to_iso,
+    year_month_day_to_iso,
+)
+
+DATES = [
+    "21-02-2021",
+    "29-02-2024",
+    "29-02-2023",
+    "29-02-2000",
+    "29-02-1900",
+    "31-04-2021",
+    "31-12-9999",
+    "00-01-2021",
+    "01-13-2021",
+    "1-2-2021",
+    "01-02-0021",
+    "01-02-2021 ",
+    "0a-02-2021",
+    "٠١-02-2021",
+    "2021-02-21",
+]
+
+FORMATS = ["DD-MM-YYYY", "DD.MM.YYYY", "YYYY_MM_DD"]
+
+
+def layouts(date_str):
+    """The date in the layout of every format."""
+    day, month, year = date_str[:2], date_str[3:5], date_str[6:]
+    return [
+        date_str,
+        date_str.replace("-", "."),
+        f"{year}_{month}_{day}" if len(date_str) == 10 else date_str.replace("-", "_"),
+    ]
+
+
+def format_date(convertor_class, date_format, date_str):
+    record = {"date": date_str}
+    rule = {"date_field": "date", "format": date_format}
+    try:
+        return convertor_class().format_date_field(record, rule)["date"]
+    except Exception as exception:
+        return type(exception)
+
+
+class StrptimeDateFieldConvertor(DateFieldConvertor):
+    FAST_DATE_PARSING = False
+    DATE_CACHE_SIZE = 0
+
+
+@pytest.mark.parametrize("date_str", DATES)
+def test_fast_parsers_give_same_result_as_strptime(date_str):
+    for date_format, date_in_layout in zip(FORMATS, layouts(date_str)):
+        assert format_date(DateFieldConvertor, date_format, date_in_layout) == (
+            format_date(StrptimeDateFieldConvertor, date_format, date_in_layout)
+        )
+
+
+@pytest.mark.parametrize("timestamp", ["1613865600", "0", "-1", "253402214400"])
+def test_fast_timestamp_parser_gives_same_result_as_datetime(timestamp):
+    assert format_date(DateFieldConvertor, "UNIX_DT_STAMP", timestamp) == (
+        format_date(StrptimeDateFieldConvertor, "UNIX_DT_STAMP", timestamp)
+    )
+
+
+def test_fast_parsers_return_none_for_other_layouts():
+    assert day_month_year_to_iso("21-02-2021", ".") is None
+    assert year_month_day_to_iso("2021_02_30", "_") is None
+    assert year_month_day_to_iso("2021_02_28", "_") == "2021-02-28"
+    assert timestamp_to_iso("1613865600") is not None
+
+
+def test_overridden_date_formatter_method_is_used():
+    class CustomDateFieldConvertor(DateFieldConvertor):
+        @staticmethod
+        def day_month_year(date_str: str) -> str:
+            return "custom"
+
+    assert format_date(CustomDateFieldConvertor, "DD-MM-YYYY", "21-02-2021") == (
+        "custom"
+    )
+
+
+def test_converted_dates_are_memoised_per_rule():
+    calls = []
+
+    class CountingDateFieldConvertor(DateFieldConvertor):
+        DATE_CACHE_SIZE = 2
+
+        @staticmethod
+        def day_month_year(date_str: str) -> str:
+            calls.append(date_str)
+            return date_str
+
+    convertor = CountingDateFieldConvertor()
+    rule = {"date_field": "date", "format": "DD-MM-YYYY"}
+    for date_str in ["01-01-2021", "01-01-2021", "02-01-2021", "03-01-2021"]:
+        convertor.format_date_field({"date": date_str}, rule)  # type: ignore
+    convertor.format_date_field({"date": "01-01-2021"}, rule)  # type: ignore
+    assert calls == ["01-01-2021", "02-01-2021", "03-01-2021", "01-01-2021"]
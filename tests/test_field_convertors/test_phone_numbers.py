@@ -0,0 +1,73 @@
+"""Tests for the cached phone number country lookup."""
+
+import phonenumbers
+import pytest
+from record_convertor.field_convertors import BaseFieldConvertor
+from record_convertor.field_convertors.base_convertor.base_convertor_helpers import (
+    PhoneNumberCountryLookup,
+    country_code_from_phone_nr,
+)
+
+
+def parsed_country_code(phone_nr):
+    """The lookup as originally done by the field convertor."""
+    try:
+        phone_object = phonenumbers.parse(phone_nr)
+    except phonenumbers.phonenumberutil.NumberParseException:
+        return None
+    if phone_object and phone_object.country_code:
+        return phonenumbers.region_codes_for_country_code(phone_object.country_code)[0]
+    return None
+
+
+E164_NUMBERS = [
+    f"+{calling_code}{'1234567890123'[: length - len(str(calling_code))]}"
+    for calling_code in phonenumbers.COUNTRY_CODE_TO_REGION_CODE
+    for length in (8, 11, 15)
+]
+
+OTHER_NUMBERS = [
+    "+31 20 123 4567",
+    "+31-20-1234567",
+    "0201234567",
+    "+0201234567",
+    "+999123456789",
+    "+2891234567",
+    "+1234567",
+    "+1234567890123456",
+    "+31",
+    "+٣١٢٠١٢٣٤٥٦٧",
+    "not a number",
+]
+
+
+@pytest.mark.parametrize("phone_nr", E164_NUMBERS + OTHER_NUMBERS)
+def test_lookup_gives_same_result_as_parsing(phone_nr):
+    assert country_code_from_phone_nr(phone_nr) == parsed_country_code(phone_nr)
+
+
+def test_lookup_keeps_cache_statistics():
+    lookup = PhoneNumberCountryLookup(maxsize=2)
+    assert [lookup("+31201234567") for _ in range(3)] == ["NL", "NL", "NL"]
+    lookup("+4930123456")
+    lookup("+33123456789")
+    cache_info = lookup.cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (2, 3, 2)
+    lookup.cache_clear()
+    assert lookup.cache_info().misses == 0
+
+
+def test_field_convertor_uses_shared_cache():
+    class FieldConvertor(BaseFieldConvertor):
+        PHONE_NUMBER_CACHE_SIZE = 10
+
+    rule = {
+        "fieldname": "country_code",
+        "actions": [{"get_country_code_from_phone_nr": "phone"}],
+    }
+    misses = FieldConvertor.phone_number_cache_info().misses
+    for _ in range(2):
+        record = FieldConvertor().convert_field({"phone": "+3222222222"}, rule)  # type: ignore
+        assert record["country_code"] == "BE"
+    assert FieldConvertor.phone_number_cache_info().misses == misses + 1
+    assert FieldConvertor.phone_number_cache_info().maxsize == 10
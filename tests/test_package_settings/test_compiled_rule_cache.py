@@ -0,0 +1,65 @@
+from record_convertor.field_convertors import BaseFieldConvertor
+from record_convertor.package_settings import (
+    MAX_COMPILED_RULES,
+    CompiledRuleCache,
+    compiled_rule_cache,
+)
+
+
+def test_rule_is_compiled_once():
+    compiled_rules = []
+    cache = CompiledRuleCache()
+    rule = {"key": "value"}
+
+    def compile_rule(rule):
+        compiled_rules.append(rule)
+        return object()
+
+    compiled = cache.get(rule, compile_rule)
+    assert cache.get(rule, compile_rule) is compiled
+    assert compiled_rules == [rule]
+
+
+def test_equal_rules_and_variants_are_compiled_separately():
+    cache = CompiledRuleCache()
+    rule = {"key": "value"}
+    compiled = cache.get(rule, lambda rule: object())
+    assert cache.get(dict(rule), lambda rule: object()) is not compiled
+    assert cache.get(rule, lambda rule: object(), variant="other") is not compiled
+
+
+def test_compiled_rule_cache_is_created_once_per_instance():
+    class Convertor:
+        pass
+
+    convertor = Convertor()
+    assert compiled_rule_cache(convertor) is compiled_rule_cache(convertor)
+    assert compiled_rule_cache(convertor) is not compiled_rule_cache(Convertor())
+
+
+def test_least_recently_used_rules_are_removed_when_cache_is_full():
+    cache = CompiledRuleCache(max_size=2)
+    first_rule, second_rule, third_rule = {"a": 1}, {"b": 2}, {"c": 3}
+    compiled_first = cache.get(first_rule, lambda rule: object())
+    cache.get(second_rule, lambda rule: object())
+    # using the first rule makes the second rule the least recently used
+    assert cache.get(first_rule, lambda rule: object()) is compiled_first
+    cache.get(third_rule, lambda rule: object())
+    assert len(cache) == 2
+    assert cache.get(first_rule, lambda rule: object()) is compiled_first
+    assert cache.get(second_rule, lambda rule: object()) is not None
+    assert len(cache) == 2
+
+
+def test_field_convertor_cache_does_not_grow_with_new_rule_dicts():
+    convertor = BaseFieldConvertor()
+    for index in range(MAX_COMPILED_RULES + 100):
+        convertor.convert_field(
+            record={"name": f"name {index}"},
+            conversion_rule={
+                "fieldname": "name",
+                "condition": {"does_not_equal": "skip"},
+                "actions": [{"to_upper_str": None}],
+            },
+        )
+    assert len(compiled_rule_cache(convertor)) <= MAX_COMPILED_RULES
@@ -0,0 +1,40 @@
+from copy import deepcopy
+
+from record_convertor.package_settings import CopyOnWriteRecord, writable_child
+
+RECORD = {"top": 1, "nested": {"key": {"deeper": 1}, "other": {"deeper": 2}}}
+
+
+def test_copy_on_write_record_is_a_shallow_copy():
+    record = CopyOnWriteRecord(RECORD)
+    assert record == RECORD
+    assert record is not RECORD
+    assert record["nested"] is RECORD["nested"]
+
+
+def test_writable_child_copies_only_the_written_path():
+    input_record = deepcopy(RECORD)
+    record = CopyOnWriteRecord(input_record)
+    nested = writable_child(record, record, "nested")
+    writable_child(record, nested, "key")["deeper"] = "changed"
+
+    assert input_record == RECORD
+    assert record["nested"]["key"] == {"deeper": "changed"}
+    assert record["nested"]["other"] is input_record["nested"]["other"]
+
+
+def test_writable_child_copies_a_nested_dict_once():
+    record = CopyOnWriteRecord(RECORD)
+    nested = writable_child(record, record, "nested")
+    assert writable_child(record, record, "nested") is nested
+
+
+def test_writable_child_returns_default_for_missing_key():
+    record = CopyOnWriteRecord(RECORD)
+    assert writable_child(record, record, "missing", {}) == {}
+    assert "missing" not in record
+
+
+def test_writable_child_of_plain_dict_is_not_copied():
+    record = deepcopy(RECORD)
+    assert writable_child(record, record, "nested") is record["nested"]
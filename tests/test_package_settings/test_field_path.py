@@ -0,0 +1,91 @@
+import jmespath
+import pytest
+from jmespath.exceptions import ParseError
+from record_convertor.package_settings import compile_field_path, get_field
+from record_convertor.package_settings.helpers.field_path import (
+    FIELD_PATH_CACHE_SIZE,
+)
+
+RECORD = {
+    "key": "value",
+    "zero": 0,
+    "1": "numeric key",
+    "key-with-dash": "dash",
+    "nested": {"key": {"deeper": "nested value"}, "none": None},
+    "list": [{"key": "in list"}],
+    'with"quote': "quote",
+    "with\\backslash": "backslash",
+}
+
+
+def quoted_jmespath_search(field_path: str, record):
+    """The lookup as originally done by the record convertor classes."""
+    nested_key = ".".join(['"' + key + '"' for key in field_path.split(".")])
+    try:
+        return jmespath.search(nested_key, record)
+    except ParseError:
+        return None
+
+
+@pytest.mark.parametrize(
+    "field_path",
+    [
+        "key",
+        "zero",
+        "1",
+        "key-with-dash",
+        "nested.key.deeper",
+        "nested.key",
+        "nested.none",
+        "nested.none.deeper",
+        "nested.key.deeper.too_deep",
+        "key.not_a_dict",
+        "list.key",
+        "non_existing",
+        "nested..key",
+        'with"quote',
+        "with\\backslash",
+    ],
+)
+def test_get_field_gives_same_result_as_quoted_jmespath_search(field_path):
+    assert get_field(RECORD, field_path) == quoted_jmespath_search(field_path, RECORD)
+
+
+def test_get_field_returns_value_from_nested_field():
+    assert get_field(RECORD, "nested.key.deeper") == "nested value"
+
+
+def test_get_field_returns_none_without_field_path():
+    assert get_field(RECORD, None) is None
+    assert get_field(RECORD, "") is None
+
+
+def test_get_field_returns_none_for_record_that_is_not_a_dict():
+    assert get_field(["key"], "key") is None
+    assert get_field(None, "nested.key") is None
+
+
+def test_get_field_with_legacy_separator():
+    assert get_field(RECORD, "nested__key__deeper", legacy_separator=True) == (
+        "nested value"
+    )
+    assert get_field(RECORD, "nested__key__deeper") is None
+
+
+def test_compiled_field_path_is_cached():
+    assert compile_field_path("nested.key.deeper") is compile_field_path(
+        "nested.key.deeper"
+    )
+
+
+def test_compiled_field_path_cache_is_bounded():
+    for index in range(FIELD_PATH_CACHE_SIZE + 100):
+        compile_field_path(f"generated.key_{index}")
+    assert compile_field_path.cache_info().currsize <= FIELD_PATH_CACHE_SIZE
+
+
+def test_compiled_field_path_can_be_reused_for_other_records():
+    getter = compile_field_path("nested.key")
+    assert getter({"nested": {"key": 1}}) == 1
+    assert getter({"nested": {"key": 2}}) == 2
+    assert getter({}) is None
@@ -0,0 +1,76 @@
+import pytest
+from record_convertor.package_settings import NOT_EXTRACTED, PathTrie, get_field
+
+RECORD = {
+    "key": "value",
+    "zero": 0,
+    "1": "numeric key",
+    "nested": {"key": {"deeper": "nested value"}, "none": None, "zero": 0},
+    "list": [{"key": "in list"}],
+    "": {"": "empty keys"},
+    'with"quote': "quote",
+}
+
+FIELD_PATHS = [
+    "key",
+    "zero",
+    "1",
+    "nested.key.deeper",
+    "nested.key",
+    "nested.none",
+    "nested.none.deeper",
+    "nested.zero.deeper",
+    "nested.key.deeper.too_deep",
+    "key.not_a_dict",
+    "list.key",
+    "non_existing",
+    "non_existing.deeper",
+    "nested..key",
+    ".",
+]
+
+
+class CountingDict(dict):
+    """Dict that counts the lookups of its keys."""
+
+    lookups: list = []
+
+    def get(self, key, default=None):
+        self.lookups.append(key)
+        return super().get(key, default)
+
+
+def test_extract_gives_same_result_as_get_field():
+    slots = PathTrie(FIELD_PATHS).extract(RECORD)
+    assert slots == {
+        field_path: get_field(RECORD, field_path) for field_path in FIELD_PATHS
+    }
+
+
+@pytest.mark.parametrize("record", [["key"], None, "key", {}])
+def test_extract_from_record_that_is_not_a_dict_or_empty(record):
+    slots = PathTrie(["key", "nested.key"]).extract(record)
+    assert slots == {"key": None, "nested.key": None}
+
+
+def test_shared_prefixes_are_looked_up_once():
+    CountingDict.lookups = []
+    record = CountingDict(
+        inventory=CountingDict(item=CountingDict(name="n", sku="s", brand={"name": 1}))
+    )
+    trie = PathTrie(
+        ["inventory.item.brand.name", "inventory.item.name", "inventory.item.sku"]
+    )
+    assert trie.extract(record) == {
+        "inventory.item.brand.name": 1,
+        "inventory.item.name": "n",
+        "inventory.item.sku": "s",
+    }
+    assert CountingDict.lookups == ["inventory", "item", "brand", "name", "sku"]
+
+
+def test_field_paths_that_need_escaping_are_not_extracted():
+    trie = PathTrie(['with"quote', "key", "key", ""])
+    assert trie.field_paths == ("key",)
+    assert len(trie) == 1
+    assert trie.extract(RECORD).get('with"quote', NOT_EXTRACTED) is NOT_EXTRACTED
@@ -0,0 +1,204 @@
+import asyncio
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.package_settings import SkipRecordHandling
+from record_convertor.parallel.async_stream import _BatchSize, aconvert_stream
+
+RULES = {
+    "$SKIP": {"fieldname": "skip", "condition": {"equals": True}},
+    "id": "item.id",
+    "name": {"$join": ["$name_", "item.id"]},
+}
+
+RECORDS = [{"item": {"id": index}, "skip": index % 10 == 0} for index in range(250)]
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    DEFAULT_VALUE = {"skipped": True}
+
+
+def expected_records(skip_handling=SkipRecordHandling.DEFAULT):
+    return RecordConvertorTest(rule_dict=RULES).convert_list(
+        RECORDS, skip_handling=skip_handling
+    )
+
+
+async def async_records(records, produced=None):
+    for record in records:
+        if produced is not None:
+            produced.append(record)
+        yield record
+        await asyncio.sleep(0)
+
+
+async def collect(converted_records):
+    return [converted_record async for converted_record in converted_records]
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 7, 1000])
+def test_aconvert_stream_in_default_executor(batch_size):
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    converted_records = record_convertor.aconvert_stream(
+        async_records(RECORDS), batch_size=batch_size
+    )
+    assert asyncio.run(collect(converted_records)) == expected_records()
+
+
+@pytest.mark.parametrize(
+    "executor_class, skip_handling",
+    [
+        (ThreadPoolExecutor, SkipRecordHandling.DROP),
+        (ProcessPoolExecutor, SkipRecordHandling.NONE),
+    ],
+)
+def test_aconvert_stream_in_executor(executor_class, skip_handling):
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    with executor_class(max_workers=2) as executor:
+        converted_records = record_convertor.aconvert_stream(
+            async_records(RECORDS),
+            executor=executor,
+            skip_handling=skip_handling,
+            batch_size=20,
+        )
+        assert asyncio.run(collect(converted_records)) == expected_records(
+            skip_handling
+        )
+
+
+def test_producer_is_held_back_by_slow_consumer():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    produced: list = []
+
+    async def consume_slowly():
+        converted_records = record_convertor.aconvert_stream(
+            async_records(RECORDS, produced), queue_size=2, batch_size=10
+        )
+        async for _ in converted_records:
+            await asyncio.sleep(0.05)
+            return len(produced)
+
+    # 2 batches converted, 2 batches in the queue and 1 batch being filled
+    assert asyncio.run(consume_slowly()) <= 50
+
+
+def test_batch_is_converted_when_source_stalls():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+
+    async def pages(event):
+        for record in RECORDS[1:4]:
+            yield record
+        # the next page is only fetched once the first records have been converted
+        await event.wait()
+        yield RECORDS[4]
+
+    async def convert():
+        event = asyncio.Event()
+        converted = []
+        async for converted_record in record_convertor.aconvert_stream(
+            pages(event), batch_size=100
+        ):
+            converted.append(converted_record)
+            if len(converted) == 3:
+                event.set()
+        return converted
+
+    converted = asyncio.run(asyncio.wait_for(convert(), timeout=5))
+    assert converted == expected_records()[1:5]
+
+
+def test_order_is_kept_when_source_stalls_while_queue_is_full():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    records = [{"item": {"id": index}} for index in range(150)]
+    random_generator = random.Random(0)
+
+    async def stalling_records():
+        for record in records:
+            yield record
+            if random_generator.random() < 0.5:
+                await asyncio.sleep(random_generator.random() * 0.004)
+            else:
+                await asyncio.sleep(0)
+
+    def slow_convert_list(batch):
+        # keeps the queue full while the source stalls
+        time.sleep(0.005)
+        return record_convertor.convert_list(batch)
+
+    async def convert():
+        return await collect(
+            aconvert_stream(
+                slow_convert_list,
+                stalling_records(),
+                queue_size=1,
+                batch_size=3,
+                max_batch_delay=0.001,
+            )
+        )
+
+    expected = record_convertor.convert_list(records)
+    for _ in range(5):
+        assert asyncio.run(asyncio.wait_for(convert(), timeout=10)) == expected
+
+
+def test_error_of_source_is_raised():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+
+    async def failing_records():
+        yield RECORDS[1]
+        raise ConnectionError("page not available")
+
+    with pytest.raises(ConnectionError, match="page not available"):
+        asyncio.run(collect(record_convertor.aconvert_stream(failing_records())))
+
+
+def test_source_is_closed_when_consumer_stops():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    source_closed = []
+
+    async def endless_records():
+        try:
+            while True:
+                yield RECORDS[1]
+                await asyncio.sleep(0)
+        finally:
+            source_closed.append(True)
+
+    async def take_one():
+        converted_records = record_convertor.aconvert_stream(endless_records())
+        async for converted_record in converted_records:
+            await converted_records.aclose()
+            return converted_record
+
+    assert asyncio.run(take_one()) == expected_records()[1]
+    assert source_closed == [True]
+
+
+def test_invalid_arguments():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    with pytest.raises(ValueError):
+        record_convertor.aconvert_stream(async_records(RECORDS), skip_handling="x")
+    with pytest.raises(ValueError):
+        asyncio.run(
+            collect(
+                record_convertor.aconvert_stream(async_records(RECORDS), queue_size=0)
+            )
+        )
+
+
+def test_adaptive_batch_size():
+    batch_size = _BatchSize(None)
+    for _ in range(20):
+        # 1 ms per record
+        batch_size.update(batch_size.size, batch_size.size * 0.001)
+    assert 15 <= batch_size.size <= 25
+    for _ in range(30):
+        batch_size.update(batch_size.size, 0.0)
+    assert batch_size.size == 10_000
+
+    fixed_batch_size = _BatchSize(50)
+    fixed_batch_size.update(50, 10.0)
+    assert fixed_batch_size.size == 50
@@ -0,0 +1,143 @@
+import json
+
+import pytest
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.package_settings import SkipRecordHandling
+from record_convertor.parallel import _init_worker
+from record_convertor.parallel.ndjson_files import (
+    ByteRange,
+    _convert_shard,
+    byte_ranges,
+    ndjson_records,
+    to_ndjson,
+)
+
+RULES = {
+    "$SKIP": {"fieldname": "skip", "condition": {"equals": True}},
+    "id": "item.id",
+    "name": {"$join": ["$name_", "item.id"]},
+}
+
+RECORDS = [{"item": {"id": index}, "skip": index % 10 == 0} for index in range(250)]
+
+NDJSON = to_ndjson(RECORDS)
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    DEFAULT_VALUE = {"skipped": True}
+
+
+def expected_ndjson(skip_handling=SkipRecordHandling.DEFAULT):
+    return to_ndjson(
+        RecordConvertorTest(rule_dict=RULES).convert_many(
+            RECORDS, skip_handling=skip_handling
+        )
+    )
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    ndjson_file = tmp_path / "records.ndjson"
+    ndjson_file.write_bytes(NDJSON)
+    return ndjson_file
+
+
+@pytest.mark.parametrize("shard_size", [1, 7, 100, 1000, len(NDJSON), 10**6])
+def test_byte_ranges_cover_file_and_end_at_lines(ndjson_file, shard_size):
+    ranges = byte_ranges(ndjson_file, shard_size)
+    assert ranges[0].start == 0
+    assert ranges[-1].end == len(NDJSON)
+    for byte_range, next_byte_range in zip(ranges, ranges[1:]):
+        assert byte_range.end == next_byte_range.start
+        assert byte_range.end - byte_range.start >= shard_size
+    assert all(NDJSON[byte_range.end - 1] == ord("\n") for byte_range in ranges)
+    records = [
+        record for byte_range in ranges for record in ndjson_records(NDJSON, byte_range)
+    ]
+    assert records == RECORDS
+
+
+def test_byte_ranges_of_file_without_last_newline(tmp_path):
+    ndjson_file = tmp_path / "records.ndjson"
+    ndjson_file.write_bytes(b'{"a": 1}\n\n{"a": 2}')
+    assert byte_ranges(ndjson_file, 3) == [ByteRange(0, 9), ByteRange(9, 18)]
+    assert list(ndjson_records(ndjson_file.read_bytes(), ByteRange(9, 18))) == [
+        {"a": 2}
+    ]
+
+
+def test_byte_ranges_of_empty_file(tmp_path):
+    ndjson_file = tmp_path / "empty.ndjson"
+    ndjson_file.write_bytes(b"")
+    assert byte_ranges(ndjson_file) == []
+
+
+def test_byte_ranges_raises_with_invalid_shard_size(ndjson_file):
+    with pytest.raises(ValueError):
+        byte_ranges(ndjson_file, 0)
+
+
+def test_invalid_line_is_reported_with_line_number_in_file():
+    data = b'{"a": 1}\n{"a": 2}\n{"a": 3}\n[4]\n'
+    with pytest.raises(ValueError, match="data.ndjson:4: not a JSON object"):
+        list(ndjson_records(data, ByteRange(18, len(data)), "data.ndjson"))
+    with pytest.raises(ValueError, match="data.ndjson:2: invalid JSON"):
+        list(ndjson_records(b'{"a": 1}\n{"a": \n', ByteRange(0, 16), "data.ndjson"))
+
+
+def test_to_ndjson():
+    assert to_ndjson([]) == b""
+    assert to_ndjson([{"name": "café"}, None]) == '{"name":"café"}\nnull\n'.encode()
+
+
+def test_worker_converts_shard(ndjson_file, tmp_path):
+    _init_worker(RecordConvertorTest, {"rule_dict": RULES})
+    byte_range = byte_ranges(ndjson_file, 10**6)[0]
+    (shard,) = _convert_shard(
+        str(ndjson_file), 0, byte_range, SkipRecordHandling.DROP, None
+    )
+    assert shard.data == expected_ndjson(SkipRecordHandling.DROP)
+    assert (shard.records_read, shard.records_written) == (250, 225)
+
+    output_filename = str(tmp_path / "shard.ndjson")
+    (shard,) = _convert_shard(
+        str(ndjson_file), 0, byte_range, SkipRecordHandling.DROP, output_filename
+    )
+    assert (shard.data, shard.output_filename) == (b"", output_filename)
+    with open(output_filename, "rb") as output_file:
+        assert output_file.read() == expected_ndjson(SkipRecordHandling.DROP)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_convert_ndjson_file(ndjson_file, ordered):
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    shards = list(
+        record_convertor.convert_ndjson_file(
+            ndjson_file, workers=2, shard_size=500, ordered=ordered
+        )
+    )
+    assert len(shards) > 2
+    shards.sort(key=lambda shard: shard.shard)
+    assert b"".join(shard.data for shard in shards) == expected_ndjson()
+    assert sum(shard.records_read for shard in shards) == 250
+
+
+def test_convert_ndjson_file_to_shard_files(ndjson_file, tmp_path):
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    shard_output = str(tmp_path / "converted-{shard:03d}.ndjson")
+    shards = list(
+        record_convertor.convert_ndjson_file(
+            ndjson_file,
+            workers=2,
+            shard_size=500,
+            skip_handling=SkipRecordHandling.NONE,
+            shard_output=shard_output,
+        )
+    )
+    converted = b""
+    for index, shard in enumerate(shards):
+        assert shard.output_filename == shard_output.format(shard=index)
+        with open(shard.output_filename, "rb") as output_file:
+            converted += output_file.read()
+    assert converted == expected_ndjson(SkipRecordHandling.NONE)
+    assert json.loads(converted.splitlines()[0]) is None
@@ -0,0 +1,99 @@
+import pytest
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.package_settings import SkipRecordHandling
+from record_convertor.parallel import _convert_chunk, _init_worker, chunked
+
+RULES = {
+    "$SKIP": {"fieldname": "skip", "condition": {"equals": True}},
+    "id": "item.id",
+    "name": {"$join": ["$name_", "item.id"]},
+}
+
+RECORDS = [{"item": {"id": index}, "skip": index % 10 == 0} for index in range(250)]
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    DEFAULT_VALUE = {"skipped": True}
+
+
+def expected_records(skip_handling=SkipRecordHandling.DEFAULT):
+    return RecordConvertorTest(rule_dict=RULES).convert_list(
+        RECORDS, skip_handling=skip_handling
+    )
+
+
+def test_chunked_splits_iterable_in_chunks():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_chunked_with_empty_iterable():
+    assert list(chunked([], 2)) == []
+
+
+def test_chunked_raises_with_invalid_size():
+    with pytest.raises(ValueError):
+        list(chunked(range(5), 0))
+
+
+def test_worker_builds_record_convertor_once_and_converts_chunks():
+    _init_worker(RecordConvertorTest, {"rule_dict": RULES})
+    assert _convert_chunk(RECORDS[:3], SkipRecordHandling.DROP) == [
+        {"id": 1, "name": "name_1"},
+        {"id": 2, "name": "name_2"},
+    ]
+
+
+def test_convert_parallel_returns_records_in_order():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    converted_records = record_convertor.convert_parallel(
+        RECORDS, workers=2, chunksize=7
+    )
+    assert list(converted_records) == expected_records()
+
+
+def test_convert_parallel_unordered_returns_all_records():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    converted_records = record_convertor.convert_parallel(
+        iter(RECORDS),
+        workers=2,
+        chunksize=7,
+        ordered=False,
+        skip_handling=SkipRecordHandling.DROP,
+    )
+    expected = expected_records(skip_handling=SkipRecordHandling.DROP)
+    assert sorted(converted_records, key=lambda record: record["id"]) == expected
+
+
+def test_convert_parallel_raises_on_unknown_skip_handling():
+    with pytest.raises(ValueError):
+        RecordConvertorTest(rule_dict=RULES).convert_parallel(
+            RECORDS, skip_handling="unknown"
+        )
+
+
+def test_convert_threaded_returns_records_in_order():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    converted_records = record_convertor.convert_threaded(
+        RECORDS, workers=4, chunksize=7
+    )
+    assert list(converted_records) == expected_records()
+
+
+def test_convert_threaded_unordered_returns_all_records():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    converted_records = record_convertor.convert_threaded(
+        iter(RECORDS),
+        workers=4,
+        chunksize=7,
+        ordered=False,
+        skip_handling=SkipRecordHandling.DROP,
+    )
+    expected = expected_records(skip_handling=SkipRecordHandling.DROP)
+    assert sorted(converted_records, key=lambda record: record["id"]) == expected
+
+
+def test_convert_threaded_raises_on_unknown_skip_handling():
+    with pytest.raises(ValueError):
+        RecordConvertorTest(rule_dict=RULES).convert_threaded(
+            RECORDS, skip_handling="unknown"
+        )
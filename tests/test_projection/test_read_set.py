@@ -0,0 +1,227 @@
+"""Tests for the read set of a rule set and the projection of input records."""
+
+import json
+import mmap
+from copy import deepcopy
+
+import pytest
+
+from record_convertor import RecordConvertorWithRulesDict, projection
+from record_convertor.command_processor import ProcessCommand
+from record_convertor.field_convertors import BaseFieldConvertor
+from record_convertor.parallel.ndjson_files import ByteRange, ndjson_records
+from record_convertor.projection import ReadSet, read_set
+from record_convertor.rules_compiler import compile_rules
+
+RECORDS = [
+    {
+        "id": 1,
+        "Name": "First",
+        "status": "active",
+        "item": {
+            "brand": {"name": "Brand", "country": "NL", "logo": "x" * 100},
+            "sku": "A-1",
+            "stock": [{"store": "a", "count": 2}],
+        },
+        "geo": {"lat": "52.123456", "lon": "4.5", "accuracy": 10},
+        "list": [{"key": "in list", "other": 1}],
+        "phone": "+31201234567",
+        'with"quote': "quote",
+        "date": "21-02-2021",
+        "payload": {"large": list(range(100))},
+    },
+    {"id": 2, "status": "inactive", "item": "not a dict", "geo": {"lat": "x"}},
+    {"id": 3, "ID": 4, "Item": {"Brand": {"Name": "upper"}}, "date": None},
+    {},
+]
+
+RULES = [
+    {"id": "id", "name": "Name", "brand": "item.brand.name", "sku": "item.sku"},
+    {"not_a_dict": "item.brand.name.deeper", "list": "list.key", "empty": ""},
+    {"quoted": 'with"quote', "brand": {"name": "item.brand.name"}},
+    {"label": {"$join": ["$seperator ", "item.brand.name", "$-", "id"]}},
+    {"location": {"$point": {"lat": "geo.lat", "lon": "geo.lon"}}},
+    {"tags": {"$to_list": ["id", "item.sku", "status"]}},
+    {"nested": {"$to_list_dynamic": [{"id": "id"}, {"sku": "item.sku"}]}},
+    {"nested": {"$from_list": {"list_field_name": "item.stock", "store": "store"}}},
+    {"nested": {"$join_key_value": {"key": "item.sku", "value": {"id": "id"}}}},
+    {
+        "$SKIP": {"fieldname": "status", "condition": {"equals": "inactive"}},
+        "$convert1": {"fieldname": "Name", "actions": [{"to_upper_str": None}]},
+        "$convert2": {
+            "fieldname": "country",
+            "actions": [
+                {"get_country_code_from_phone_nr": "phone"},
+                {"add_value_from_field": "item__brand__country"},
+            ],
+        },
+        "$convert3": {
+            "fieldname": "item.sku",
+            "actions": [{"to_lower_str": None, "target_field_name": "sku.lower"}],
+        },
+        "$format_date": {"date_field": "date", "format": "DD-MM-YYYY"},
+        "name": "Name",
+        "country": "country",
+        "sku": "sku.lower",
+        "date": "date",
+    },
+]
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    DEFAULT_VALUE = {"skipped": True}
+
+
+@pytest.fixture(params=["json", "simdjson"])
+def json_parser(request, monkeypatch):
+    """Parses JSON input with the `json` module or with pysimdjson."""
+    if request.param == "simdjson":
+        simdjson = pytest.importorskip("simdjson")
+        monkeypatch.setattr(projection, "_simdjson_module", simdjson)
+    else:
+        monkeypatch.setattr(projection, "_simdjson_module", False)
+    return request.param
+
+
+def test_read_set_of_path_copies_and_nested_rules():
+    fields = RecordConvertorTest(rule_dict=RULES[2]).read_set()
+    assert fields.paths == {('with"quote',), ("item", "brand", "name")}
+    assert fields.tree == {'with"quote': None, "item": {"brand": {"name": None}}}
+    assert not fields.whole_record
+
+
+def test_read_set_of_commands():
+    def paths(rules):
+        return {".".join(path) for path in read_set(compile_rules(rules)).paths}
+
+    assert paths(RULES[3]) == {"item.brand.name", "id"}
+    assert paths(RULES[4]) == {"geo.lat", "geo.lon"}
+    assert paths(RULES[7]) == {"item.stock"}
+    assert paths(RULES[8]) == {"item.sku", "id"}
+    assert paths({"a": {"$fixed_value": "x"}, "b": {"$current_year": None}}) == set()
+
+
+def test_read_set_of_conversion_rules():
+    fields = read_set(compile_rules(RULES[9]))
+    assert {".".join(path) for path in fields.paths} == {
+        "status",
+        "Name",
+        "country",
+        "phone",
+        "item.brand.country",
+        "item__brand__country",
+        "item.sku",
+        "sku.lower",
+        "date",
+    }
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        {"all": {"$full_record": None}},
+        {"unknown": {"$no_such_command": None}},
+        {"$convert": {"fieldname": "id", "actions": [{"no_such_action": None}]}},
+        {"$convert": "not a rule dict"},
+    ],
+)
+def test_rules_that_can_read_any_field_read_the_whole_record(rules):
+    fields = read_set(compile_rules(rules))
+    assert fields.whole_record
+    record = {"id": 1}
+    assert fields.project(record) is record
+
+
+def test_custom_commands_and_actions_read_the_whole_record():
+    class CommandClass(ProcessCommand):
+        def join(self):
+            return self.record
+
+    class FieldConvertor(BaseFieldConvertor):
+        def to_str(self, action_value):
+            return str(self.record)
+
+    plan = compile_rules({"a": "id", "b": {"$join": ["id"]}})
+    assert not read_set(plan).whole_record
+    assert read_set(plan, command_class=CommandClass).whole_record
+
+    plan = compile_rules({"$convert": {"fieldname": "id", "actions": [{"to_str": 1}]}})
+    assert not read_set(plan).whole_record
+    assert read_set(plan, field_convertor=FieldConvertor()).whole_record
+
+
+def test_read_set_is_derived_once_per_plan():
+    record_convertor = RecordConvertorTest(rule_dict=RULES[0])
+    assert record_convertor.read_set() is record_convertor.read_set()
+
+
+def test_shorter_paths_replace_longer_paths_in_the_tree():
+    fields = ReadSet([("item", "brand", "name"), ("item", "brand"), ("id",)])
+    assert fields.tree == {"id": None, "item": {"brand": None}}
+    assert repr(fields) == "ReadSet(['id', 'item.brand', 'item.brand.name'])"
+
+
+def test_project_keeps_only_the_fields_read():
+    fields = RecordConvertorTest(rule_dict=RULES[0]).read_set()
+    projected = fields.project(RECORDS[0])
+    assert projected == {
+        "id": 1,
+        "Name": "First",
+        "item": {"brand": {"name": "Brand"}, "sku": "A-1"},
+    }
+    assert fields.project(RECORDS[1]) == {"id": 2, "item": "not a dict"}
+
+
+@pytest.mark.parametrize("keys_in_lower_case", [False, True])
+@pytest.mark.parametrize("rules", RULES)
+def test_projected_records_convert_as_the_full_records(
+    rules, keys_in_lower_case, json_parser
+):
+    class RecordConvertor(RecordConvertorTest):
+        KEYS_IN_LOWER_CASE = keys_in_lower_case
+
+    record_convertor = RecordConvertor(rule_dict=rules)
+    for record in RECORDS:
+        expected = record_convertor.convert(deepcopy(record))
+        raw = json.dumps(record)
+        assert record_convertor.convert_json(raw) == expected
+        assert record_convertor.convert_json(raw.encode()) == expected
+
+
+@pytest.mark.parametrize(
+    "rules", [{"id": "id", "brand": "item.brand"}, {"all": {"$full_record": None}}]
+)
+def test_parse_json_returns_plain_values(rules, json_parser):
+    record_convertor = RecordConvertorTest(rule_dict=rules)
+    for record in RECORDS:
+        # the parser is reused for every record
+        parsed = record_convertor.parse_json(json.dumps(record).encode())
+        assert parsed == record_convertor.read_set().project(record)
+        assert json.loads(json.dumps(parsed)) == parsed
+
+
+def test_parse_json_errors(json_parser):
+    record_convertor = RecordConvertorTest(rule_dict=RULES[0])
+    with pytest.raises(ValueError, match="invalid JSON"):
+        record_convertor.parse_json(b"{")
+    with pytest.raises(ValueError, match="not a JSON object"):
+        record_convertor.parse_json(b"[1, 2]")
+
+
+def test_ndjson_records_with_parse_function(tmp_path, json_parser):
+    record_convertor = RecordConvertorTest(rule_dict={"id": "id"})
+    filename = tmp_path / "data.ndjson"
+    filename.write_bytes(b'{"id": 1, "other": 2}\n\n{"id": 2}\n[]\n')
+    with open(filename, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        records = ndjson_records(
+            buffer,
+            ByteRange(0, len(buffer)),
+            "data.ndjson",
+            record_convertor.parse_json,
+        )
+        assert next(records) == {"id": 1}
+        assert next(records) == {"id": 2}
+        with pytest.raises(ValueError, match="data.ndjson:4: not a JSON object"):
+            next(records)
+        buffer.close()
@@ -0,0 +1,96 @@
+import types
+
+import pytest
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.package_settings import SkipRecordHandling
+
+RULES = {
+    "$SKIP": {"fieldname": "status", "condition": {"equals": "inactive"}},
+    "name": "item.name",
+}
+
+RECORDS = [
+    {"status": "active", "item": {"name": "first"}},
+    {"status": "inactive", "item": {"name": "second"}},
+    {"status": "active", "item": {"name": "third"}},
+]
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    DEFAULT_VALUE = {"skipped": True}
+
+
+def test_convert_many_returns_a_generator():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    assert isinstance(record_convertor.convert_many(RECORDS), types.GeneratorType)
+
+
+def test_convert_many_converts_lazily():
+    consumed = []
+
+    def records():
+        for record in RECORDS:
+            consumed.append(record)
+            yield record
+
+    converted_records = RecordConvertorTest(rule_dict=RULES).convert_many(records())
+    assert consumed == []
+    assert next(converted_records) == {"name": "first"}
+    assert consumed == RECORDS[:1]
+
+
+def test_convert_many_gives_same_results_as_convert():
+    record_convertor = RecordConvertorTest(rule_dict=RULES)
+    assert list(record_convertor.convert_many(RECORDS)) == [
+        record_convertor.convert(record) for record in RECORDS
+    ]
+
+
+def test_convert_many_returns_default_value_for_skipped_records_by_default():
+    assert list(RecordConvertorTest(rule_dict=RULES).convert_many(RECORDS)) == [
+        {"name": "first"},
+        {"skipped": True},
+        {"name": "third"},
+    ]
+
+
+def test_convert_many_drops_skipped_records():
+    converted_records = RecordConvertorTest(rule_dict=RULES).convert_many(
+        RECORDS, skip_handling=SkipRecordHandling.DROP
+    )
+    assert list(converted_records) == [{"name": "first"}, {"name": "third"}]
+
+
+def test_convert_many_returns_none_for_skipped_records():
+    converted_records = RecordConvertorTest(rule_dict=RULES).convert_many(
+        RECORDS, skip_handling=SkipRecordHandling.NONE
+    )
+    assert list(converted_records) == [{"name": "first"}, None, {"name": "third"}]
+
+
+def test_skipped_records_can_be_told_apart_from_empty_results():
+    rules = {
+        "$SKIP": {"fieldname": "status", "condition": {"equals": "inactive"}},
+        "name": "name",
+    }
+    converted_records = RecordConvertorWithRulesDict(rule_dict=rules).convert_list(
+        [{"status": "active"}, {"status": "inactive"}],
+        skip_handling=SkipRecordHandling.DROP,
+    )
+    assert converted_records == [{}]
+
+
+def test_convert_many_raises_on_unknown_skip_handling():
+    with pytest.raises(ValueError):
+        next(
+            RecordConvertorTest(rule_dict=RULES).convert_many(
+                RECORDS, skip_handling="unknown"
+            )
+        )
+
+
+def test_convert_list_returns_list_of_converted_records():
+    converted_records = RecordConvertorTest(rule_dict=RULES).convert_list(
+        iter(RECORDS), skip_handling=SkipRecordHandling.DROP
+    )
+    assert converted_records == [{"name": "first"}, {"name": "third"}]
@@ -0,0 +1,79 @@
+from copy import deepcopy
+
+import pytest
+from record_convertor import RecordConvertorWithRulesDict
+
+RULES = {
+    "$convert1": {"fieldname": "item.name", "actions": [{"to_upper_str": None}]},
+    "$convert2": {"fieldname": "item.code", "actions": [{"remove": None}]},
+    "$convert3": {
+        "fieldname": "item.old_key",
+        "actions": [{"change_key_name_to": "item.new_key"}],
+    },
+    "$format_date1": {"date_field": "dates.created", "format": "DD-MM-YYYY"},
+    "name": "item.name",
+    "code": "item.code",
+    "new_key": "item.new_key",
+    "created": "dates.created",
+    "nested": {
+        "$convert1": {"fieldname": "brand.name", "actions": [{"to_lower_str": None}]},
+        "brand": "brand.name",
+    },
+}
+
+RECORD = {
+    "item": {"name": "Name", "code": "X1", "old_key": "value"},
+    "dates": {"created": "21-02-2021"},
+    "brand": {"name": "BRAND"},
+    "untouched": {"key": "value"},
+}
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    COPY_ON_WRITE = True
+
+
+class GeneratedRecordConvertorTest(RecordConvertorTest):
+    GENERATE_CODE = True
+
+
+@pytest.mark.parametrize(
+    "convertor_class", [RecordConvertorTest, GeneratedRecordConvertorTest]
+)
+def test_copy_on_write_leaves_input_record_untouched(convertor_class):
+    input_record = deepcopy(RECORD)
+    converted_record = convertor_class(rule_dict=RULES).convert(input_record)
+    assert input_record == RECORD
+    assert converted_record == RecordConvertorWithRulesDict(rule_dict=RULES).convert(
+        deepcopy(RECORD)
+    )
+
+
+def test_conversion_without_copy_on_write_updates_input_record():
+    input_record = deepcopy(RECORD)
+    RecordConvertorWithRulesDict(rule_dict=RULES).convert(input_record)
+    assert input_record != RECORD
+
+
+def test_copy_on_write_shares_unchanged_branches_with_input_record():
+    rules = {"$format_date1": RULES["$format_date1"], "untouched": "untouched"}
+    input_record = deepcopy(RECORD)
+    converted_record = RecordConvertorTest(rule_dict=rules).convert(input_record)
+    assert converted_record["untouched"] is input_record["untouched"]
+
+
+@pytest.mark.parametrize(
+    "convertor_class", [RecordConvertorTest, GeneratedRecordConvertorTest]
+)
+@pytest.mark.parametrize(
+    "rules",
+    [
+        {"$convert1": RULES["$convert1"], "$full_record": None},
+        {"$convert1": RULES["$convert1"], "full": {"$full_record": None}},
+    ],
+)
+def test_full_record_is_returned_as_plain_dict(convertor_class, rules):
+    converted_record = convertor_class(rule_dict=rules).convert(deepcopy(RECORD))
+    full_record = converted_record.get("full", converted_record)
+    assert type(full_record) is dict
+    assert full_record["item"]["name"] == "NAME"
@@ -0,0 +1,87 @@
+"""Conversions that read the values extracted with the path trie of the plan."""
+
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.command_processor import ProcessCommand
+
+RECORD = {
+    "id": 1,
+    "name": "first",
+    "inventory": {"item": {"name": "item", "sku": "A-1", "brand": {"name": "b"}}},
+}
+
+
+class FieldsSpyCommand(ProcessCommand):
+    """Command class that keeps the extracted fields it was given."""
+
+    seen_fields: list = []
+
+    def get_value(self):
+        self.seen_fields.append(self.fields)
+        return super().get_value()
+
+
+def test_path_copies_nested_rules_and_commands_read_extracted_fields():
+    rules = {
+        "sku": "inventory.item.sku",
+        "item": {
+            "name": "inventory.item.name",
+            "label": {"$join": ["$seperator ", "inventory.item.brand.name", "name"]},
+        },
+    }
+    FieldsSpyCommand.seen_fields = []
+    record_convertor = RecordConvertorWithRulesDict(
+        rule_dict=rules, command_class=FieldsSpyCommand
+    )
+    assert record_convertor.convert(RECORD) == {
+        "sku": "A-1",
+        "item": {"name": "item", "label": "b first"},
+    }
+    [fields] = FieldsSpyCommand.seen_fields
+    assert fields == {
+        "inventory.item.sku": "A-1",
+        "inventory.item.name": "item",
+        "inventory.item.brand.name": "b",
+        "name": "first",
+    }
+
+
+def test_fields_are_extracted_after_the_record_is_changed():
+    rules = {
+        "before": "name",
+        "$convert": {"fieldname": "name", "actions": [{"to_upper_str": None}]},
+        "after": "name",
+        "nested": {"after": "name"},
+    }
+    record_convertor = RecordConvertorWithRulesDict(rule_dict=rules)
+    assert record_convertor.convert(dict(RECORD)) == {
+        "before": "first",
+        "after": "FIRST",
+        "nested": {"after": "FIRST"},
+    }
+
+
+def test_rules_after_a_nested_change_of_the_record_read_the_record():
+    rules = {
+        "nested": {
+            "$convert": {"fieldname": "name", "actions": [{"to_upper_str": None}]},
+            "name": "name",
+        },
+        "after": "name",
+    }
+    record_convertor = RecordConvertorWithRulesDict(rule_dict=rules)
+    assert record_convertor.convert(dict(RECORD)) == {
+        "nested": {"name": "FIRST"},
+        "after": "FIRST",
+    }
+
+
+def test_subclass_with_own_field_lookup_does_not_read_extracted_fields():
+    class RecordConvertor(RecordConvertorWithRulesDict):
+        def _get_field(self, key, record):
+            return f"looked up {key}"
+
+    record_convertor = RecordConvertor(rule_dict={"id": "id", "nested": {"n": "name"}})
+    assert record_convertor.convert(RECORD) == {
+        "id": "looked up id",
+        "nested": {"n": "looked up name"},
+    }
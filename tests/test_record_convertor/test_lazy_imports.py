@@ -0,0 +1,44 @@
+"""The optional dependencies are only imported on first use."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import record_convertor
+
+SOURCE_PATH = str(Path(record_convertor.__file__).parents[1])
+
+LAZY_DEPENDENCIES = ("phonenumbers", "pydantic", "unidecode", "yaml")
+
+
+def modules_imported_after(code: str) -> set[str]:
+    script = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+    environment = {**os.environ, "PYTHONPATH": SOURCE_PATH}
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=environment,
+    ).stdout
+    return set(output.split())
+
+
+def test_import_does_not_import_lazy_dependencies():
+    modules = modules_imported_after("import record_convertor")
+    assert not modules.intersection(LAZY_DEPENDENCIES)
+
+
+def test_dependencies_are_imported_on_first_use():
+    code = """
+from record_convertor.field_convertors.base_convertor.base_convertor_helpers import (
+    country_code_from_phone_nr,
+    normalize_string,
+)
+assert country_code_from_phone_nr("+31201234567") == "NL"
+assert normalize_string("Café") == "cafe"
+"""
+    modules = modules_imported_after(code)
+    assert {"phonenumbers", "unidecode"} <= modules
+    assert not modules.intersection({"pydantic", "yaml"})
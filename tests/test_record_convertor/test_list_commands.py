@@ -0,0 +1,76 @@
+"""Tests for commands that convert (items of) the record with nested rule sets."""
+
+from record_convertor import RecordConvertorWithRulesDict
+
+RECORD = {
+    "name": "product",
+    "items": [
+        {"sku": "1", "price": 10, "status": "active"},
+        {"sku": "2", "price": 20, "status": "inactive"},
+        {"sku": "3", "status": "active"},
+    ],
+}
+
+
+def convert(rules, record=RECORD):
+    return RecordConvertorWithRulesDict(rule_dict=rules).convert(record)
+
+
+def test_from_list_converts_every_list_item():
+    rules = {
+        "offers": {
+            "$from_list": {"list_field_name": "items", "id": "sku", "amount": "price"}
+        }
+    }
+    assert convert(rules) == {
+        "offers": [
+            {"id": "1", "amount": 10},
+            {"id": "2", "amount": 20},
+            {"id": "3"},
+        ]
+    }
+
+
+def test_from_list_leaves_out_skipped_list_items():
+    rules = {
+        "offers": {
+            "$from_list": {
+                "list_field_name": "items",
+                "$skip": {"fieldname": "status", "condition": {"equals": "inactive"}},
+                "id": "sku",
+            }
+        },
+        "first": {"$first_item_from_list": {"list_field_name": "items", "id": "sku"}},
+    }
+    assert convert(rules) == {
+        "offers": [{"id": "1"}, {"id": "3"}],
+        "first": {"id": "1"},
+    }
+
+
+def test_from_list_without_list_returns_empty_list():
+    rules = {"offers": {"$from_list": {"list_field_name": "name", "id": "sku"}}}
+    assert convert(rules) == {"offers": []}
+
+
+def test_to_list_dynamic_converts_record_with_every_rule_set():
+    rules = {"list": {"$to_list_dynamic": [{"title": "name"}, {"missing": "none"}]}}
+    assert convert(rules) == {"list": [{"title": "product"}]}
+
+
+def test_join_key_value_with_nested_rule_sets():
+    rules = {
+        "key_value": {
+            "$join_key_value": {"key": {"$join": ["name", "$_key"]}, "value": "name"}
+        }
+    }
+    assert convert(rules) == {"key_value": {"product_key": "product"}}
+
+
+def test_list_item_rules_are_not_compiled_per_record():
+    rules = {"offers": {"$from_list": {"list_field_name": "items", "id": "sku"}}}
+    record_convertor = RecordConvertorWithRulesDict(rule_dict=rules)
+    number_of_plans = len(record_convertor._plan._plans)
+    record_convertor.convert(RECORD)
+    record_convertor.convert(RECORD)
+    assert len(record_convertor._plan._plans) == number_of_plans
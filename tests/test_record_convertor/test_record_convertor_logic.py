@@ -64,7 +64,6 @@ def basic_test_convertor(
         RULE_CLASS = rule_class
         EVALUATE_CLASS = evaluate_class
         DEFAULT_VALUE = default_value or {}
-        _input_record = {}
 
     data_classes = data_classes or []
     return RecordConvertorTest(
@@ -115,22 +114,24 @@ def test_record_convertor_sets_field_convertor():
 ################################################
 
 
+class LowerCaseKeyRuleConvertorTest(RuleConvertorTest):
+    DEFAULT_RULE = {"lower": "key1", "upper": "KEY1"}
+
+
 def test_record_convert_sets_keys_to_lower_case():
     class RecordConvertorTest(RecordConvertor):
-        RULE_CLASS = EmptyRuleConvertorTest
+        RULE_CLASS = LowerCaseKeyRuleConvertorTest
         KEYS_IN_LOWER_CASE = True
 
     record_convertor = RecordConvertorTest(rule_source="test")
     test_record = {"KEY1": 1}
-    record_convertor.convert(record=test_record)
-    assert record_convertor._input_record == {"key1": 1}
+    assert record_convertor.convert(record=test_record) == {"lower": 1}
 
 
 def test_record_convert_does_not_set_keys_to_lower_case_by_default():
-    record_convertor = basic_test_convertor(rule_class=EmptyRuleConvertorTest)
+    record_convertor = basic_test_convertor(rule_class=LowerCaseKeyRuleConvertorTest)
     test_record = {"KEY1": 1}
-    record_convertor.convert(record=test_record)
-    assert record_convertor._input_record == {"KEY1": 1}
+    assert record_convertor.convert(record=test_record) == {"upper": 1}
 
 
 ########################################################
@@ -179,42 +180,38 @@ def test_default_value_returned_when_record_skipped():
 
 def test_field_convert_method_changes_the_input_record_with_convert_key():
     class TestConvertRuleClass(RuleConvertorTest):
-        DEFAULT_RULE = {"$convert1": TEST_RULE}
+        DEFAULT_RULE = {"$convert1": TEST_RULE, "input": "input", "output": "ouput"}
 
     record_convertor = basic_test_convertor(rule_class=TestConvertRuleClass)
     input_record = {"input": "input value"}
-    record_convertor.convert(input_record)
-    assert record_convertor._input_record == FieldConvertorTest.DEFAULT_RESULT
+    assert record_convertor.convert(input_record) == {"output": "ouptut value"}
 
 
 def test_field_convert_method_no_change_of_input_without_convert_key():
     class TestConvertRuleClass(RuleConvertorTest):
-        DEFAULT_RULE = {"no_convert": None}
+        DEFAULT_RULE = {"no_convert": None, "input": "input"}
 
     record_convertor = basic_test_convertor(rule_class=TestConvertRuleClass)
     input_record = {"input": "input value"}
-    record_convertor.convert(input_record)
-    assert record_convertor._input_record == {"input": "input value"}
+    assert record_convertor.convert(input_record) == {"input": "input value"}
 
 
 def test_format_date_method_changes_input_record_with_format_date_key():
     class TestConvertRuleClass(RuleConvertorTest):
-        DEFAULT_RULE = {"$format_date1": TEST_FORMAT_DATE_RULE}
+        DEFAULT_RULE = {"$format_date1": TEST_FORMAT_DATE_RULE, "date": "date1"}
 
     record_convertor = basic_test_convertor(rule_class=TestConvertRuleClass)
     input_record = {"date1": "date1"}
-    record_convertor.convert(input_record)
-    assert record_convertor._input_record == {"date1": "formatted_date"}
+    assert record_convertor.convert(input_record) == {"date": "formatted_date"}
 
 
 def test_format_date_method_leaves_input_as_is_without_convert_key():
     class TestConvertRuleClass(RuleConvertorTest):
-        DEFAULT_RULE = {"no_format_date1": TEST_FORMAT_DATE_RULE}
+        DEFAULT_RULE = {"no_format_date1": TEST_FORMAT_DATE_RULE, "date": "date1"}
 
     record_convertor = basic_test_convertor(rule_class=TestConvertRuleClass)
     input_record = {"date1": "date1"}
-    record_convertor.convert(input_record)
-    assert record_convertor._input_record == {"date1": "date1"}
+    assert record_convertor.convert(input_record)["date"] == "date1"
 
 
 ############################################################
@@ -274,6 +271,18 @@ def test_data_class_processer_has_attribute_with_dataclass_name_in_snake_case_as
     assert "data_class_two" in dir(record_convertor.DATA_CLASS_PROCESSOR)
 
 
+def test_dataclasses_are_not_shared_between_record_convertors():
+    @dataclass
+    class DataClassThree:
+        pass
+
+    record_convertor = basic_test_convertor(data_classes=[DataClassThree])
+    other_record_convertor = basic_test_convertor()
+    assert "data_class_three" in dir(record_convertor.DATA_CLASS_PROCESSOR)
+    assert "data_class_three" not in dir(other_record_convertor.DATA_CLASS_PROCESSOR)
+    assert "data_class_three" not in dir(RecordConvertor.DATA_CLASS_PROCESSOR)
+
+
 def test_record_convertor_retrieves_result_from_data_class_processor():
     class DataClassTestProcessor:
         def data_from_dataclass(self, **kwargs) -> dict:
@@ -292,6 +301,22 @@ def test_record_convertor_retrieves_result_from_data_class_processor():
     }
 
 
+def test_dataclass_without_params_does_not_grow_the_plan_store():
+    @dataclass
+    class Foo:
+        pass
+
+    record_convertor = basic_test_convertor(data_classes=[Foo])
+    record_convertor._rules = {  # type: ignore
+        "foo": {"$dataclass": {"data_class_name": "foo"}}
+    }
+    record_convertor.convert(record={})
+    number_of_plans = len(record_convertor._plan._plans)
+    for _ in range(10):
+        assert record_convertor.convert(record={}) == {"foo": {}}
+    assert len(record_convertor._plan._plans) == number_of_plans
+
+
 #####################################
 # Test the command class conversion #
 #####################################
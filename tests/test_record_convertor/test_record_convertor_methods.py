@@ -2,6 +2,7 @@ import jmespath
 import pytest
 from jmespath.exceptions import ParseError
 from record_convertor import EvaluateConditions, RecordConvertor
+from record_convertor.rules_compiler import RulePlan
 
 TEST_RULES = {"rule1": "test"}
 SKIP_RULE = {"fieldname": "field1", "condition": {"does_not_equal": "test"}}
@@ -36,57 +37,41 @@ def basic_test_convertor() -> RecordConvertor:
     class RecordConvertorTest(RecordConvertor):
         RULE_CLASS = EmptyRuleConvertorTest
         EVALUATE_CLASS = EveluateConditionsAlwaysToTrue
-        _input_record = {}
 
     return RecordConvertorTest(rule_source="test")
 
 
 def test_get_field_method_returns_correct_value():
-    class RecordConvertorTest(RecordConvertor):
-        RULE_CLASS = RuleConvertorTest
-        _input_record = {"test_key": "test_value"}
-
-    rc = RecordConvertorTest(rule_source="test")
-    assert rc._get_field("test_key") == "test_value"
+    rc = basic_test_convertor()
+    assert rc._get_field("test_key", {"test_key": "test_value"}) == "test_value"
 
 
 def test_get_field_method_returns_correct_nested_field_value():
-    class RecordConvertorTest(RecordConvertor):
-        RULE_CLASS = RuleConvertorTest
-        _input_record = {"test_key": {"nested_key": "nested_test_value"}}
-
-    rc = RecordConvertorTest(rule_source="test")
-    assert rc._get_field("test_key.nested_key") == "nested_test_value"
+    rc = basic_test_convertor()
+    record = {"test_key": {"nested_key": "nested_test_value"}}
+    assert rc._get_field("test_key.nested_key", record) == "nested_test_value"
 
 
 def test_get_field_method_returns_none_if_field_not_found():
-    class RecordConvertorTest(RecordConvertor):
-        RULE_CLASS = RuleConvertorTest
-        _input_record = {"test_key": {"nested_key": "nested_test_value"}}
-
-    rc = RecordConvertorTest(rule_source="test")
-    assert rc._get_field("non_existing_field") is None
+    rc = basic_test_convertor()
+    record = {"test_key": {"nested_key": "nested_test_value"}}
+    assert rc._get_field("non_existing_field", record) is None
 
 
 def test_get_field_method_returns_none_if_None_key_is_provided():
-    class RecordConvertorTest(RecordConvertor):
-        RULE_CLASS = RuleConvertorTest
-        _input_record = {"test_key": {"nested_key": "nested_test_value"}}
-
-    rc = RecordConvertorTest(rule_source="test")
-    assert rc._get_field(key=None) is None
+    rc = basic_test_convertor()
+    record = {"test_key": {"nested_key": "nested_test_value"}}
+    assert rc._get_field(key=None, record=record) is None
 
 
 def test_get_field_method_fixes_parse_error_with_int_keys_as_str():
-    class RecordConvertorTest(RecordConvertor):
-        RULE_CLASS = RuleConvertorTest
-        _input_record = {"1": "test_value"}
+    record = {"1": "test_value"}
 
     with pytest.raises(ParseError):
-        jmespath.search("1", RecordConvertorTest._input_record)
+        jmespath.search("1", record)
 
-    rc = RecordConvertorTest(rule_source="test")
-    assert rc._get_field(key="1") == "test_value"
+    rc = basic_test_convertor()
+    assert rc._get_field(key="1", record=record) == "test_value"
 
 
 #######################################
@@ -115,27 +100,43 @@ def test_format_date_rule_method_returns_true_when_convert_in_rule_key():
     assert basic_test_convertor()._format_date_rule(("$format_date", "test"))
 
 
-############################
-# Test the _copy attribute #
-############################
+###############################
+# Test the compiled rule plan #
+###############################
 
 
-def test_copy_attribute_sets_the_stored_copy_attribute():
-    record_convertor = basic_test_convertor()
-    assert record_convertor._stored_copy is None
-    record_convertor._copy
-    assert isinstance(record_convertor._stored_copy, RecordConvertor)
+def test_rules_are_compiled_into_plan_at_construction():
+    class RecordConvertorTest(RecordConvertor):
+        RULE_CLASS = RuleConvertorTest
 
+    record_convertor = RecordConvertorTest(rule_source="test")
+    assert isinstance(record_convertor._plan, RulePlan)
+    assert record_convertor._plan.rules is TEST_RULES
+
+
+def test_setting_rules_compiles_a_new_plan():
+    record_convertor = basic_test_convertor()
+    new_rules = {"new_rule": "field"}
+    record_convertor._rules = new_rules
+    assert record_convertor._plan.rules is new_rules
 
-def test_copy_attribute_returns_stored_copy_attribute_when_not_None():
-    class CopyRecordConvertor(RecordConvertor):
-        RULE_CLASS = EmptyRuleConvertorTest
 
+def test_copy_with_new_rules_returns_a_new_copy_on_every_call():
     record_convertor = basic_test_convertor()
-    copy_record_convertor = CopyRecordConvertor(rule_source="test")
+    first_copy = record_convertor.get_record_convertor_copy_with_new_rules({})
+    second_copy = record_convertor.get_record_convertor_copy_with_new_rules({})
+    assert isinstance(first_copy, RecordConvertor)
+    assert first_copy is not record_convertor
+    assert first_copy is not second_copy
 
-    record_convertor._stored_copy = copy_record_convertor
-    assert record_convertor._copy == copy_record_convertor
+
+def test_copy_with_new_rules_reuses_compiled_sub_plan():
+    from record_convertor import RecordConvertorWithRulesDict
+
+    nested_rules = {"nested": "field1"}
+    record_convertor = RecordConvertorWithRulesDict(rule_dict={"out": nested_rules})
+    first_copy = record_convertor.get_record_convertor_copy_with_new_rules(nested_rules)
+    assert first_copy._plan is record_convertor._plan.compiled_rules[0].sub_plan
 
 
 ##############################
@@ -145,18 +146,20 @@ def test_copy_attribute_returns_stored_copy_attribute_when_not_None():
 
 def test_skip_method_returns_false_if_skip_not_in_key():
     record_convertor = basic_test_convertor()
-    assert not record_convertor._skip_this_record(rule=("$NOT_SKIP", SKIP_RULE))
+    assert not record_convertor._skip_this_record(
+        rule=("$NOT_SKIP", SKIP_RULE), record={}
+    )
 
 
 def test_skip_method_returns_true_if_skip_in_key_and_confition_is_true():
     record_convertor = basic_test_convertor()
-    assert record_convertor._skip_this_record(rule=("$SKIP", SKIP_RULE))
+    assert record_convertor._skip_this_record(rule=("$SKIP", SKIP_RULE), record={})
 
 
 def test_skip_method_returns_false_if_skip_in_key_and_confition_is_false():
     record_convertor = basic_test_convertor()
     record_convertor.__class__.EVALUATE_CLASS = EveluateConditionsAlwaysToFalse
-    assert not record_convertor._skip_this_record(rule=("$SKIP", SKIP_RULE))
+    assert not record_convertor._skip_this_record(rule=("$SKIP", SKIP_RULE), record={})
 
 
 ##########################################
@@ -196,3 +199,55 @@ def test_record_convertor_with_rules_dict_basic():
     record = {"full_name": "John Doe", "person_age": 30}
     result = RecordConvertorWithRulesDict(rule_dict=rules).convert(record=record)
     assert result == {"name": "John Doe", "age": 30}
+
+
+###################################################
+# Test overrides written against the old signature #
+###################################################
+
+
+def test_legacy_get_field_override_is_called_with_input_record():
+    with pytest.warns(DeprecationWarning, match="_get_field does not take the record"):
+
+        class LegacyRecordConvertor(RecordConvertor):
+            RULE_CLASS = RuleConvertorTest
+
+            def _get_field(self, key):
+                return super()._get_field(key) or "default"
+
+    record_convertor = LegacyRecordConvertor(rule_source="test")
+    assert record_convertor.convert({"test": "value"}) == {"rule1": "value"}
+    assert record_convertor.convert({}) == {"rule1": "default"}
+
+
+def test_legacy_skip_this_record_override_is_called_for_skip_rules():
+    class SkipRuleConvertorTest(RuleConvertorTest):
+        DEFAULT_RULE = {"$SKIP": SKIP_RULE, "rule1": "test"}
+
+    with pytest.warns(DeprecationWarning, match="_skip_this_record does not take"):
+
+        class LegacyRecordConvertor(RecordConvertor):
+            RULE_CLASS = SkipRuleConvertorTest
+            DEFAULT_VALUE = {"skipped": True}
+
+            def _skip_this_record(self, rule):
+                return self._input_record.get("skip", False)
+
+    record_convertor = LegacyRecordConvertor(rule_source="test")
+    assert record_convertor.convert({"test": "value"}) == {"rule1": "value"}
+    assert record_convertor.convert({"skip": True}) == {"skipped": True}
+
+
+def test_skip_this_record_override_is_called_for_skip_rules():
+    class SkipRuleConvertorTest(RuleConvertorTest):
+        DEFAULT_RULE = {"$SKIP": SKIP_RULE, "rule1": "test"}
+
+    class SkipAllRecordConvertor(RecordConvertor):
+        RULE_CLASS = SkipRuleConvertorTest
+        DEFAULT_VALUE = {"skipped": True}
+
+        def _skip_this_record(self, rule, record):
+            return True
+
+    record_convertor = SkipAllRecordConvertor(rule_source="test")
+    assert record_convertor.convert({"field1": "test"}) == {"skipped": True}
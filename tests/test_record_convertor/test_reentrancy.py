@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from record_convertor import RecordConvertorWithRulesDict
+
+RULES = {
+    "$convert1": {"fieldname": "name", "actions": [{"to_upper_str": None}]},
+    "$format_date1": {"date_field": "date", "format": "DD-MM-YYYY"},
+    "$SKIP": {"fieldname": "skip", "condition": {"equals": True}},
+    "name": "name",
+    "date": "date",
+    "nested": {"id": "id"},
+    "item": {
+        "$dataclass": {
+            "data_class_name": "item",
+            "params": {"id": "id", "name": "name"},
+        },
+    },
+}
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+class RecordConvertorTest(RecordConvertorWithRulesDict):
+    DEFAULT_VALUE = {"skipped": True}
+
+
+def input_record(number: int) -> dict:
+    return {
+        "id": number,
+        "name": f"name {number}",
+        "date": f"{number % 28 + 1:02d}-01-2024",
+        "skip": number % 10 == 0,
+    }
+
+
+def expected_output(number: int) -> dict:
+    if number % 10 == 0:
+        return {"skipped": True}
+    return {
+        "name": f"NAME {number}",
+        "date": f"2024-01-{number % 28 + 1:02d}",
+        "nested": {"id": number},
+        "item": {"id": number, "name": f"NAME {number}"},
+    }
+
+
+def test_single_record_convertor_can_be_used_from_multiple_threads():
+    record_convertor = RecordConvertorTest(rule_dict=RULES, data_classes=[Item])
+
+    def convert(number: int) -> dict:
+        return record_convertor.convert(input_record(number))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(convert, range(2000)))
+
+    assert results == [expected_output(number) for number in range(2000)]
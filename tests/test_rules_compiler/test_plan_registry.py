@@ -0,0 +1,103 @@
+"""Tests for the process-wide registry of shared plans."""
+
+from datetime import date
+
+from record_convertor import RecordConvertorWithRulesDict
+from record_convertor.rules_compiler import PLAN_REGISTRY, PlanRegistry
+
+RULES = {
+    "$skip": {"fieldname": "status", "condition": {"equals": "deleted"}},
+    "name": "item.name",
+    "brand": {"name": "item.brand"},
+    "since": {"$fixed_value": date(2021, 2, 21)},
+}
+
+RECORD = {"item": {"name": "Chair", "brand": "Acme"}}
+
+
+class SharedPlansConvertor(RecordConvertorWithRulesDict):
+    SHARE_PLANS = True
+
+
+def copy_of_rules():
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in RULES.items()
+    }
+
+
+def test_rule_sets_with_same_content_share_a_plan():
+    registry = PlanRegistry()
+    plan = registry.plan(copy_of_rules())
+    assert registry.plan(copy_of_rules()) is plan
+    assert len(registry) == 1
+
+
+def test_rule_sets_with_different_content_or_order_get_own_plan():
+    registry = PlanRegistry()
+    plan = registry.plan({"a": "x", "b": "y"})
+    assert registry.plan({"b": "y", "a": "x"}) is not plan
+    assert registry.plan({"a": "x", "b": ["y"]}) is not plan
+    assert registry.plan({"a": "x", "b": 1}) is not registry.plan({"a": "x", "b": 1.0})
+    assert registry.plan({"a": "x", "b": 1}) is not registry.plan({"a": "x", "b": True})
+    assert len(registry) == 6
+
+
+def test_shared_plan_is_compiled_from_copy_of_rules():
+    registry = PlanRegistry()
+    rules = copy_of_rules()
+    plan = registry.plan(rules)
+    rules["brand"]["name"] = "other.field"
+    assert plan.rules["brand"] == {"name": "item.brand"}
+    assert plan.rules is not rules
+
+
+def test_rule_sets_with_other_values_are_not_shared():
+    class Marker:
+        pass
+
+    registry = PlanRegistry()
+    rules = {"a": "x", "marker": Marker()}
+    assert registry.plan(rules) is not registry.plan(rules)
+    assert registry.plan(rules).rules is rules
+    assert len(registry) == 0
+
+
+def test_record_convertors_share_plan():
+    first_convertor = SharedPlansConvertor(rule_dict=copy_of_rules())
+    second_convertor = SharedPlansConvertor(rule_dict=copy_of_rules())
+    assert first_convertor._plan is second_convertor._plan
+    assert first_convertor.convert(RECORD) == {
+        "name": "Chair",
+        "brand": {"name": "Acme"},
+        "since": date(2021, 2, 21),
+    }
+    assert second_convertor.convert({"status": "deleted"}) == {}
+
+
+def test_record_convertors_do_not_share_plans_by_default():
+    first_convertor = RecordConvertorWithRulesDict(rule_dict=copy_of_rules())
+    second_convertor = RecordConvertorWithRulesDict(rule_dict=copy_of_rules())
+    assert first_convertor._plan is not second_convertor._plan
+
+
+def test_preloaded_plans_are_used():
+    rules = {"preloaded": "item.name", "other": {"brand": "item.brand"}}
+    SharedPlansConvertor.preload_plans([rules])
+    number_of_plans = len(PLAN_REGISTRY)
+
+    record_convertor = SharedPlansConvertor(rule_dict=dict(rules))
+    assert len(PLAN_REGISTRY) == number_of_plans
+    assert record_convertor._plan is PLAN_REGISTRY.plan(rules)
+    assert record_convertor.convert(RECORD) == {
+        "preloaded": "Chair",
+        "other": {"brand": "Acme"},
+    }
+
+
+def test_clear_registry():
+    registry = PlanRegistry()
+    plan = registry.plan({"a": "x"})
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.plan({"a": "x"}) is not plan
@@ -0,0 +1,176 @@
+"""Tests for compiling rule sets into a RulePlan."""
+
+import pytest
+
+from record_convertor.rules_compiler import (
+    LIST_ITEM_IGNORED_KEYS,
+    CompiledRule,
+    RuleKind,
+    RulePlan,
+    compile_rules,
+)
+
+DATACLASS_RULE = {
+    "data_class_name": "test",
+    "params": {"name": "field1"},
+    "methods": [{"set_name": {"name": "field2"}}],
+}
+
+
+def kinds(plan: RulePlan) -> list[str]:
+    return [compiled_rule.kind for compiled_rule in plan]
+
+
+@pytest.mark.parametrize(
+    "rule_key, rule_value, expected_kind",
+    [
+        ("$SKIP", {"fieldname": "a", "condition": {}}, RuleKind.SKIP),
+        ("$skip_convert", {"fieldname": "a", "condition": {}}, RuleKind.SKIP),
+        ("$convert1", {"fieldname": "a", "actions": []}, RuleKind.FIELD_CONVERT),
+        ("$format_date", {"date_field": "a", "format": "X"}, RuleKind.DATE_FORMAT),
+        ("$dataclass", DATACLASS_RULE, RuleKind.DATACLASS),
+        ("$join", ["a", "b"], RuleKind.COMMAND),
+        ("output", {"nested": "a"}, RuleKind.NESTED),
+        ("output", "input.path", RuleKind.PATH_COPY),
+    ],
+)
+def test_rule_is_compiled_into_correct_kind(rule_key, rule_value, expected_kind):
+    plan = compile_rules({rule_key: rule_value})
+    assert list(plan) == [
+        CompiledRule(
+            expected_kind, rule_key, rule_value, plan.compiled_rules[0].sub_plan
+        )
+    ]
+
+
+def test_rules_without_effect_are_left_out_of_the_plan():
+    plan = compile_rules({"output1": None, "output2": ["a"], "output3": "a"})
+    assert len(plan) == 1
+    assert plan.compiled_rules[0].key == "output3"
+
+
+def test_plan_keeps_order_of_the_rules():
+    rules = {
+        "$convert": {"fieldname": "a", "actions": []},
+        "output1": "a",
+        "output2": {"nested": "b"},
+    }
+    assert kinds(compile_rules(rules)) == [
+        RuleKind.FIELD_CONVERT,
+        RuleKind.PATH_COPY,
+        RuleKind.NESTED,
+    ]
+
+
+def test_nested_rules_are_compiled_into_a_sub_plan():
+    nested_rules = {"nested": "b", "$convert": {"fieldname": "b", "actions": []}}
+    plan = compile_rules({"output": nested_rules})
+    sub_plan = plan.compiled_rules[0].sub_plan
+    assert isinstance(sub_plan, RulePlan)
+    assert sub_plan.rules is nested_rules
+    assert kinds(sub_plan) == [RuleKind.PATH_COPY, RuleKind.FIELD_CONVERT]
+
+
+def test_empty_rule_set_results_in_empty_plan():
+    assert len(compile_rules(None)) == 0  # type: ignore[arg-type]
+
+
+def test_plan_for_returns_compiled_sub_plan_for_nested_rules():
+    nested_rules = {"nested": "b"}
+    plan = compile_rules({"output": nested_rules})
+    assert plan.plan_for(nested_rules) is plan.compiled_rules[0].sub_plan
+
+
+def test_plan_for_returns_compiled_plans_for_dataclass_rules():
+    plan = compile_rules({"$dataclass": DATACLASS_RULE})
+    params_plan = plan.plan_for(DATACLASS_RULE["params"])
+    assert params_plan is plan.plan_for(DATACLASS_RULE["params"])
+    assert kinds(params_plan) == [RuleKind.PATH_COPY]
+    method_rules = DATACLASS_RULE["methods"][0]["set_name"]
+    assert plan.plan_for(method_rules) is plan.plan_for(method_rules)
+
+
+def test_plan_for_compiles_unknown_rules():
+    plan = compile_rules({"output": "a"})
+    new_plan = plan.plan_for({"new_output": "b"})
+    assert new_plan.compiled_rules[0].key == "new_output"
+
+
+def test_plan_for_does_not_store_plans_of_unknown_rules():
+    plan = compile_rules({"output": {"nested": "a"}})
+    number_of_plans = len(plan._plans)
+    for _ in range(10):
+        plan.plan_for({"new_output": "b"})
+    assert len(plan._plans) == number_of_plans
+
+
+def test_plan_for_does_not_return_plan_of_equal_but_other_rule_dict():
+    nested_rules = {"nested": "b"}
+    plan = compile_rules({"output": nested_rules})
+    assert plan.plan_for(dict(nested_rules)) is not plan.compiled_rules[0].sub_plan
+
+
+def test_rules_in_command_arguments_are_compiled_with_the_plan():
+    from_list_rules = {"list_field_name": "items", "name": "item_name"}
+    dynamic_rules = {"price": "price"}
+    key_rules = {"$join": ["a", "b"]}
+    plan = compile_rules(
+        {
+            "list": {"$from_list": from_list_rules},
+            "dynamic": {"$to_list_dynamic": [dynamic_rules, "not a rule set"]},
+            "key_value": {"$join_key_value": {"key": key_rules, "value": "c"}},
+        }
+    )
+    number_of_plans = len(plan._plans)
+
+    item_plan = plan.plan_for(from_list_rules, LIST_ITEM_IGNORED_KEYS)
+    assert [rule.key for rule in item_plan] == ["name"]
+    assert plan.plan_for(dynamic_rules).rules is dynamic_rules
+    assert plan.plan_for(key_rules).rules is key_rules
+    assert len(plan._plans) == number_of_plans
+
+
+def test_path_trie_has_the_field_paths_of_path_copies_nested_rules_and_commands():
+    plan = compile_rules(
+        {
+            "$skip": {"fieldname": "status", "condition": {"equals": "x"}},
+            "name": "item.name",
+            "brand": {"name": "item.brand.name", "label": {"$join": ["a", "$-"]}},
+            "point": {"$point": {"lat": "geo.lat", "lon": "geo.lon"}},
+            "all": {"$full_record": None},
+        }
+    )
+    assert plan.path_trie_position == 0
+    assert plan.path_trie.field_paths == (
+        "item.name",
+        "item.brand.name",
+        "a",
+        "geo.lat",
+        "geo.lon",
+    )
+
+
+def test_path_trie_is_extracted_after_the_last_rule_that_changes_the_record():
+    plan = compile_rules(
+        {
+            "before": "a",
+            "$convert": {"fieldname": "a", "actions": [{"to_str": None}]},
+            "$format_date": {"date_field": "b", "format": "YYYY-MM-DD"},
+            "after": "a",
+        }
+    )
+    assert plan.path_trie_position == 3
+    assert plan.path_trie.field_paths == ("a",)
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        {"a": "a", "nested": {"$convert": {"fieldname": "a", "actions": []}}},
+        {"list": {"$to_list_dynamic": [{"$format_date": {"date_field": "a"}}]}},
+        {"$fixed_value": None},
+        {},
+    ],
+)
+def test_plan_without_path_trie(rules):
+    assert compile_rules(rules).path_trie is None
@@ -0,0 +1,136 @@
+"""Tests for the on-disk cache of parsed rule files."""
+
+import os
+import time
+
+import yaml
+
+from record_convertor.rules_generator import RuleFileCache, RulesFromYAML
+from record_convertor.rules_generator import from_yaml
+
+RULES_YAML = "output_field:\n  field: input_field\n"
+
+
+class ParseCounter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, content):
+        self.calls += 1
+        return yaml.safe_load(content)
+
+
+def write_rule_file(path, content, age_in_seconds=60):
+    path.write_text(content)
+    modification_time = time.time() - age_in_seconds
+    os.utime(path, (modification_time, modification_time))
+
+
+def test_unchanged_file_is_not_parsed_again(tmp_path):
+    rule_file = tmp_path / "rules.yaml"
+    write_rule_file(rule_file, RULES_YAML)
+    parse = ParseCounter()
+    cache = RuleFileCache(tmp_path / "cache")
+
+    first_rules = cache.load(rule_file, parse)
+    second_rules = RuleFileCache(tmp_path / "cache").load(str(rule_file), parse)
+
+    assert first_rules == second_rules == {"output_field": {"field": "input_field"}}
+    assert first_rules is not second_rules
+    assert parse.calls == 1
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    rule_file = tmp_path / "rules.yaml"
+    write_rule_file(rule_file, RULES_YAML)
+    parse = ParseCounter()
+    cache = RuleFileCache(tmp_path / "cache")
+    cache.load(rule_file, parse)
+
+    # same size, different content
+    modification_time = rule_file.stat().st_mtime_ns
+    rule_file.write_text(RULES_YAML.replace("input", "other"))
+    os.utime(rule_file, ns=(modification_time + 1, modification_time + 1))
+
+    assert cache.load(rule_file, parse) == {"output_field": {"field": "other_field"}}
+    assert parse.calls == 2
+
+
+def test_touched_file_is_not_parsed_again(tmp_path):
+    rule_file = tmp_path / "rules.yaml"
+    write_rule_file(rule_file, RULES_YAML)
+    parse = ParseCounter()
+    cache = RuleFileCache(tmp_path / "cache")
+    cache.load(rule_file, parse)
+
+    write_rule_file(rule_file, RULES_YAML, age_in_seconds=30)
+
+    assert cache.load(rule_file, parse) == {"output_field": {"field": "input_field"}}
+    assert parse.calls == 1
+
+
+def test_recently_modified_file_is_checked_by_content(tmp_path):
+    rule_file = tmp_path / "rules.yaml"
+    rule_file.write_text(RULES_YAML)
+    parse = ParseCounter()
+    cache = RuleFileCache(tmp_path / "cache")
+    cache.load(rule_file, parse)
+
+    # rewritten within the resolution of the file system clock
+    modification_time = rule_file.stat().st_mtime_ns
+    rule_file.write_text(RULES_YAML.replace("input", "other"))
+    os.utime(rule_file, ns=(modification_time, modification_time))
+
+    assert cache.load(rule_file, parse) == {"output_field": {"field": "other_field"}}
+
+
+def test_damaged_cache_entry_is_replaced(tmp_path):
+    rule_file = tmp_path / "rules.yaml"
+    write_rule_file(rule_file, RULES_YAML)
+    parse = ParseCounter()
+    cache_directory = tmp_path / "cache"
+    RuleFileCache(cache_directory).load(rule_file, parse)
+    (entry_file,) = cache_directory.iterdir()
+    entry_file.write_bytes(b"not a pickle")
+
+    rules = RuleFileCache(cache_directory).load(rule_file, parse)
+    assert rules == {"output_field": {"field": "input_field"}}
+    assert parse.calls == 2
+    assert RuleFileCache(cache_directory).load(rule_file, parse) == rules
+    assert parse.calls == 2
+
+
+def test_unwritable_cache_directory_is_ignored(tmp_path):
+    rule_file = tmp_path / "rules.yaml"
+    write_rule_file(rule_file, RULES_YAML)
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+
+    rules = RuleFileCache(not_a_directory / "cache").load(rule_file, ParseCounter())
+    assert rules == {"output_field": {"field": "input_field"}}
+
+
+def test_rules_from_yaml_with_cache_directory(tmp_path, monkeypatch):
+    class CachedRulesFromYAML(RulesFromYAML):
+        CACHE_DIRECTORY = str(tmp_path / "cache")
+
+    rule_file = tmp_path / "rules.yaml"
+    write_rule_file(rule_file, RULES_YAML)
+    parse = ParseCounter()
+    monkeypatch.setattr(from_yaml, "_parse_yaml", parse)
+
+    for _ in range(3):
+        rules = CachedRulesFromYAML(str(rule_file)).rules
+        assert rules == {"output_field": {"field": "input_field"}}
+    assert parse.calls == 1
+
+
+def test_rules_from_yaml_does_not_cache_invalid_files(tmp_path):
+    class CachedRulesFromYAML(RulesFromYAML):
+        CACHE_DIRECTORY = str(tmp_path / "cache")
+
+    rule_file = tmp_path / "bad.yaml"
+    write_rule_file(rule_file, "key: value\n\tbad_indent: value\n")
+
+    assert CachedRulesFromYAML(str(rule_file))._error
+    assert not (tmp_path / "cache").exists()